@@ -0,0 +1,142 @@
+"""Offline benchmarks for fmpxx against the local mock FMP server.
+
+Times the main client methods over 1 to 1,000 symbols and reports
+throughput, per-call latency, peak Python memory and the number of API
+requests issued. No API key or network access is needed.
+
+Usage:
+    python -m benchmarks.bench
+    python -m benchmarks.bench --sizes 1 10 100 --cases get_merged_financials merge_eps_his
+    python -m benchmarks.bench --json results.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fmpxx import FMPClient, Metrics  # noqa: E402
+from benchmarks.mock_server import MockServer  # noqa: E402
+
+# Per-symbol workloads; ``years`` is the price history length
+CASES = {
+    "get_merged_financials": lambda client, symbol, years: client.financials.get_merged_financials(symbol, limit=40),
+    "get_stock_performance": lambda client, symbol, years: client.financials.get_stock_performance(symbol),
+    "merge_eps_his": lambda client, symbol, years: client.financials.merge_eps_his(symbol, period=years, enable_logging=False),
+    "get_fiscal_close_chg": lambda client, symbol, years: client.financials.get_fiscal_close_chg(symbol, period=years),
+    "historical_price_full": lambda client, symbol, years: client.stocks.historical_price_full(symbol, period=years),
+}
+
+
+def run_case(url: str, case: str, symbols: list[str], years: int, workers: int, measure_memory: bool) -> dict:
+    """Run one case over ``symbols`` on a fresh client and return its measurements."""
+    client = FMPClient("benchmark", base_url=url, metrics=Metrics(), pool_maxsize=max(10, 3 * workers))
+    func = CASES[case]
+    latencies = []
+
+    def call(symbol: str) -> None:
+        start = time.perf_counter()
+        func(client, symbol, years)
+        latencies.append(time.perf_counter() - start)
+
+    if measure_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(call, symbols))
+    wall = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if measure_memory else None
+    if measure_memory:
+        tracemalloc.stop()
+
+    stats = client.stats()
+    client.close()
+    latencies.sort()
+    return {
+        "case": case,
+        "symbols": len(symbols),
+        "wall_s": wall,
+        "symbols_per_s": len(symbols) / wall if wall else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] * 1000,
+        "peak_mb": peak / 1e6 if peak is not None else None,
+        "requests": stats["totals"]["requests"],
+        "mb_received": stats["totals"]["bytes"] / 1e6,
+        "build_s": stats["totals"]["build_seconds"],
+    }
+
+
+def run_stock_list(url: str, measure_memory: bool) -> list[dict]:
+    """Time the full stock list, materialized and streamed in chunks."""
+    results = []
+    for case, fetch in (
+        ("stock_list", lambda client: client.stocks.stock_list()),
+        ("iter_stock_list", lambda client: sum(len(chunk) for chunk in client.stocks.iter_stock_list())),
+    ):
+        client = FMPClient("benchmark", base_url=url, metrics=Metrics())
+        if measure_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        fetch(client)
+        wall = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if measure_memory else None
+        if measure_memory:
+            tracemalloc.stop()
+        client.close()
+        results.append({
+            "case": case, "symbols": 1, "wall_s": wall, "symbols_per_s": 1 / wall, "p50_ms": wall * 1000,
+            "p95_ms": wall * 1000, "peak_mb": peak / 1e6 if peak is not None else None, "requests": 1,
+            "mb_received": None, "build_s": None,
+        })
+    return results
+
+
+def print_table(results: list[dict]) -> None:
+    header = f"{'case':<24}{'symbols':>8}{'wall s':>10}{'sym/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'peak MB':>10}{'requests':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        peak = f"{r['peak_mb']:.1f}" if r["peak_mb"] is not None else "-"
+        print(f"{r['case']:<24}{r['symbols']:>8}{r['wall_s']:>10.3f}{r['symbols_per_s']:>10.1f}"
+              f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{peak:>10}{r['requests']:>10}")
+
+
+def main(argv: list[str] | None = None) -> list[dict]:
+    parser = argparse.ArgumentParser(description="Offline fmpxx benchmarks against a local mock FMP server.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000], help="Symbol counts to run")
+    parser.add_argument("--cases", nargs="+", choices=[*CASES, "stock_list"], default=[*CASES, "stock_list"])
+    parser.add_argument("--years", type=int, default=10, help="Years of daily prices per symbol")
+    parser.add_argument("--workers", type=int, default=8, help="Symbols processed concurrently")
+    parser.add_argument("--stock-list-size", type=int, default=60_000)
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (it slows pandas code down)")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    with MockServer(stock_list_size=args.stock_list_size) as server:
+        # Warm up the server's templates and the client's imports
+        run_case(server.url, "get_stock_performance", ["SYM00000"], args.years, 1, False)
+        for case in args.cases:
+            if case == "stock_list":
+                results.extend(run_stock_list(server.url, not args.no_memory))
+                continue
+            for size in args.sizes:
+                symbols = [f"SYM{i:05d}" for i in range(size)]
+                results.append(run_case(server.url, case, symbols, args.years, args.workers, not args.no_memory))
+                print(f"{case} x {size}: {results[-1]['wall_s']:.2f}s", file=sys.stderr)
+
+    print()
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
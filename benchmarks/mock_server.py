@@ -0,0 +1,275 @@
+"""Local mock of the FMP endpoints used by fmpxx, for offline benchmarks.
+
+Payloads mimic the real API in shape and size: 40+ quarters of the three
+statements with their full field lists, daily bars for any requested range,
+the earnings calendar and a stock list of tens of thousands of rows. Bodies
+are rendered once per shape and only the symbol is substituted per request,
+so the server costs next to nothing compared to the client under test.
+
+Run standalone with ``python -m benchmarks.mock_server --port 8000``, or use
+``MockServer`` to start it in a background process.
+"""
+import argparse
+import functools
+import json
+import math
+import multiprocessing
+import re
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SYMBOL = "__SYMBOL__"
+
+INCOME_FIELDS = [
+    "revenue", "costOfRevenue", "grossProfit", "grossProfitRatio", "researchAndDevelopmentExpenses",
+    "generalAndAdministrativeExpenses", "sellingAndMarketingExpenses", "sellingGeneralAndAdministrativeExpenses",
+    "otherExpenses", "operatingExpenses", "costAndExpenses", "interestIncome", "interestExpense",
+    "depreciationAndAmortization", "ebitda", "ebitdaratio", "operatingIncome", "operatingIncomeRatio",
+    "totalOtherIncomeExpensesNet", "incomeBeforeTax", "incomeBeforeTaxRatio", "incomeTaxExpense", "netIncome",
+    "netIncomeRatio", "eps", "epsdiluted", "weightedAverageShsOut", "weightedAverageShsOutDil",
+]
+BALANCE_FIELDS = [
+    "cashAndCashEquivalents", "shortTermInvestments", "cashAndShortTermInvestments", "netReceivables", "inventory",
+    "otherCurrentAssets", "totalCurrentAssets", "propertyPlantEquipmentNet", "goodwill", "intangibleAssets",
+    "goodwillAndIntangibleAssets", "longTermInvestments", "taxAssets", "otherNonCurrentAssets",
+    "totalNonCurrentAssets", "otherAssets", "totalAssets", "accountPayables", "shortTermDebt", "taxPayables",
+    "deferredRevenue", "otherCurrentLiabilities", "totalCurrentLiabilities", "longTermDebt",
+    "deferredRevenueNonCurrent", "deferredTaxLiabilitiesNonCurrent", "otherNonCurrentLiabilities",
+    "totalNonCurrentLiabilities", "otherLiabilities", "capitalLeaseObligations", "totalLiabilities",
+    "preferredStock", "commonStock", "retainedEarnings", "accumulatedOtherComprehensiveIncomeLoss",
+    "othertotalStockholdersEquity", "totalStockholdersEquity", "totalEquity",
+    "totalLiabilitiesAndStockholdersEquity", "minorityInterest", "totalLiabilitiesAndTotalEquity",
+    "totalInvestments", "totalDebt", "netDebt",
+]
+CASH_FIELDS = [
+    "netIncome", "depreciationAndAmortization", "deferredIncomeTax", "stockBasedCompensation",
+    "changeInWorkingCapital", "accountsReceivables", "inventory", "accountsPayables", "otherWorkingCapital",
+    "otherNonCashItems", "netCashProvidedByOperatingActivities", "investmentsInPropertyPlantAndEquipment",
+    "acquisitionsNet", "purchasesOfInvestments", "salesMaturitiesOfInvestments", "otherInvestingActivites",
+    "netCashUsedForInvestingActivites", "debtRepayment", "commonStockIssued", "commonStockRepurchased",
+    "dividendsPaid", "otherFinancingActivites", "netCashUsedProvidedByFinancingActivities",
+    "effectOfForexChangesOnCash", "netChangeInCash", "cashAtEndOfPeriod", "cashAtBeginningOfPeriod",
+    "operatingCashFlow", "capitalExpenditure", "freeCashFlow",
+]
+STATEMENT_FIELDS = {
+    "income-statement": INCOME_FIELDS,
+    "balance-sheet-statement": BALANCE_FIELDS,
+    "cash-flow-statement": CASH_FIELDS,
+}
+EXCHANGES = [("NASDAQ Global Select", "NASDAQ"), ("New York Stock Exchange", "NYSE"), ("American Stock Exchange", "AMEX"),
+             ("Toronto Stock Exchange", "TSX"), ("London Stock Exchange", "LSE")]
+TYPES = ["stock", "stock", "stock", "etf", "trust"]
+
+
+def quarter_ends(count: int, today: date | None = None) -> list[date]:
+    """The last ``count`` calendar quarter ends reported by ``today`` (45-day filing lag), newest first."""
+    cursor = (today or date.today()) - timedelta(days=45)
+    ends = []
+    year, quarter = cursor.year, (cursor.month - 1) // 3
+    while len(ends) < count:
+        if quarter == 0:
+            year, quarter = year - 1, 4
+        month = quarter * 3
+        end = date(year, month, 31 if month in (3, 12) else 30)
+        if end <= cursor:
+            ends.append(end)
+        quarter -= 1
+    return ends
+
+
+def _value(field: str, index: int, quarters: int) -> float:
+    # Smooth growth with a seasonal wiggle; ratios stay in (0, 1)
+    age = quarters - index
+    base = 1e9 * (1 + 0.02 * age) * (1 + 0.05 * math.sin(age + len(field)))
+    if field.endswith(("Ratio", "ratio")):
+        return round(0.2 + 0.3 * abs(math.sin(age + len(field))), 6)
+    if field in ("eps", "epsdiluted"):
+        return round(1 + 0.03 * age + 0.1 * math.sin(age), 4)
+    if field.startswith(("capitalExpenditure", "dividendsPaid", "commonStockRepurchased", "debtRepayment")):
+        return -round(base * 0.05)
+    return float(round(base * (0.1 + (len(field) % 7) / 10)))
+
+
+@functools.lru_cache(maxsize=64)
+def statement_template(kind: str, limit: int, period: str) -> bytes:
+    rows = []
+    for i, end in enumerate(quarter_ends(limit)):
+        filed = end + timedelta(days=30)
+        row = {
+            "date": end.isoformat(), "symbol": SYMBOL, "reportedCurrency": "USD", "cik": "0000320193",
+            "fillingDate": filed.isoformat(), "acceptedDate": f"{filed.isoformat()} 18:01:36",
+            "calendarYear": str(end.year), "period": f"Q{(end.month - 1) // 3 + 1}" if period == "quarter" else "FY",
+        }
+        row.update((field, _value(field, i, limit)) for field in STATEMENT_FIELDS[kind])
+        row["link"] = f"https://www.sec.gov/Archives/edgar/data/320193/{SYMBOL}-{end:%Y%m%d}.htm"
+        row["finalLink"] = row["link"]
+        rows.append(row)
+    return json.dumps(rows).encode()
+
+
+@functools.lru_cache(maxsize=64)
+def prices_template(start: str | None, end: str | None) -> bytes:
+    last = date.fromisoformat(end) if end else date.today()
+    first = date.fromisoformat(start) if start else last - timedelta(days=365 * 5)
+    bars, day, prev = [], first, None
+    while day <= last:
+        if day.weekday() < 5:
+            close = round(100 + 30 * math.sin(day.toordinal() / 40) + 0.01 * (day.toordinal() % 97), 4)
+            change = round(close - prev, 4) if prev else 0.0
+            bars.append({
+                "date": day.isoformat(), "open": round(close * 0.995, 4), "high": round(close * 1.01, 4),
+                "low": round(close * 0.99, 4), "close": close, "adjClose": close, "volume": 50_000_000.0,
+                "unadjustedVolume": 50_000_000.0, "change": change, "changePercent": round(change / close * 100, 5),
+                "vwap": close, "label": f"{day:%B %d, %y}", "changeOverTime": round(change / close, 7),
+            })
+            prev = close
+        day += timedelta(days=1)
+    return json.dumps(bars[::-1]).encode()
+
+
+@functools.lru_cache(maxsize=64)
+def earnings_template(limit: int) -> bytes:
+    today = date.today()
+    # Two upcoming reports with estimates only, like the real calendar
+    ends = quarter_ends(limit, today + timedelta(days=2 * 92))
+    rows = []
+    for i, end in enumerate(ends):
+        report = end + timedelta(days=30)
+        future = report > today
+        rows.append({
+            "date": report.isoformat(), "symbol": SYMBOL,
+            "eps": None if future else round(1.2 + 0.03 * (limit - i), 2), "epsEstimated": round(1.15 + 0.03 * (limit - i), 2),
+            "time": "amc" if i % 2 else "bmo", "revenue": None if future else 9.0e10, "revenueEstimated": 8.9e10,
+            "fiscalDateEnding": end.isoformat(), "updatedFromDate": report.isoformat(),
+        })
+    return json.dumps(rows).encode()
+
+
+@functools.lru_cache(maxsize=4)
+def stock_list_body(size: int) -> bytes:
+    rows = []
+    for i in range(size):
+        exchange, short = EXCHANGES[i % len(EXCHANGES)]
+        rows.append({"symbol": f"SYM{i:05d}", "name": f"Mock Company {i} Inc.", "price": round(5 + (i % 500) * 0.73, 2),
+                     "exchange": exchange, "exchangeShortName": short, "type": TYPES[i % len(TYPES)]})
+    return json.dumps(rows).encode()
+
+
+def _fill(template: bytes, symbol: str) -> bytes:
+    return template.replace(SYMBOL.encode(), symbol.encode())
+
+
+def route(path: str, query: dict[str, str], stock_list_size: int) -> tuple[int, bytes]:
+    """Render the response body for an API path such as ``/api/v3/income-statement/AAPL``."""
+    path = re.sub(r"^/api/v[34]/", "", path)
+
+    match = re.fullmatch(r"(income-statement|balance-sheet-statement|cash-flow-statement)/([^/]+)", path)
+    if match:
+        template = statement_template(match.group(1), int(query.get("limit", 10)), query.get("period", "annual"))
+        return 200, _fill(template, match.group(2))
+
+    match = re.fullmatch(r"historical-price-full/([^/]+)", path)
+    if match:
+        bars = prices_template(query.get("from"), query.get("to"))
+        symbols = match.group(1).split(",")
+        if len(symbols) == 1:
+            return 200, b'{"symbol": "%s", "historical": %s}' % (symbols[0].encode(), bars)
+        entries = b", ".join(b'{"symbol": "%s", "historical": %s}' % (s.encode(), bars) for s in symbols)
+        return 200, b'{"historicalStockList": [%s]}' % entries
+
+    match = re.fullmatch(r"historical/earning_calendar/([^/]+)", path)
+    if match:
+        return 200, _fill(earnings_template(int(query.get("limit", 16))), match.group(1))
+
+    match = re.fullmatch(r"quote/([^/]+)", path)
+    if match:
+        quotes = [{"symbol": s, "price": 100.0 + i, "volume": 1_000_000, "marketCap": 1e10}
+                  for i, s in enumerate(match.group(1).split(","))]
+        return 200, json.dumps(quotes).encode()
+
+    if path == "stock/list":
+        return 200, stock_list_body(stock_list_size)
+
+    if path == "search":
+        term = query.get("query", "").upper()
+        matches = [{"symbol": term or "SYM00000", "name": f"{term.title()} Inc.", "currency": "USD",
+                    "stockExchange": "NASDAQ Global Select", "exchangeShortName": "NASDAQ"}]
+        return 200, json.dumps(matches[:int(query.get("limit", 10))]).encode()
+
+    return 404, json.dumps({"Error Message": f"Unknown endpoint {path}"}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    stock_list_size = 60_000
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        status, body = route(url.path, query, self.stock_list_size)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port: int = 0, stock_list_size: int = 60_000, ready=None) -> None:
+    handler = type("Handler", (_Handler,), {"stock_list_size": stock_list_size})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    if ready is not None:
+        ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+class MockServer:
+    """Run the mock API in a separate process so it does not compete for the client's GIL.
+
+    Example:
+        with MockServer() as server:
+            client = FMPClient("demo", base_url=server.url)
+    """
+
+    def __init__(self, port: int = 0, stock_list_size: int = 60_000):
+        self.port = port
+        self.stock_list_size = stock_list_size
+        self._process = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "MockServer":
+        ready = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=serve, args=(self.port, self.stock_list_size, ready), daemon=True
+        )
+        self._process.start()
+        self.port = ready.get(timeout=30)
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--stock-list-size", type=int, default=60_000)
+    args = parser.parse_args()
+    print(f"Mock FMP API on http://127.0.0.1:{args.port}")
+    serve(args.port, args.stock_list_size)
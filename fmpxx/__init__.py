@@ -1,6 +1,17 @@
+from collections.abc import Callable
 from .base import _BaseClient
-from .financials import Financials
+from .financials import Financials, compute_performance_panel
 from .stocks import Stocks
+from .cache import FrameCache, ResponseCache
+from .cassette import Cassette
+from .metrics import Metrics
+from .quality import QualityReport, validate_statements
+from .ratelimit import RateLimiter, RetryPolicy
+from .screener import Screener
+from .store import PriceStore, StatementStore
+from .transport import Transport
+from .utils import CompactDtypes
+from .async_client import AsyncFMPClient
 
 class FMPClient(_BaseClient):
     """Main client for interacting with the Financial Modeling Prep (FMP) API.
@@ -11,18 +22,99 @@ class FMPClient(_BaseClient):
     Args:
         api_key (str | None): Your FMP API key.
         timeout (int, optional): Request timeout in seconds. Defaults to 10.
+        pool_maxsize (int, optional): Keep-alive connections per host in the shared pool. Batch
+            methods cap their worker threads to fit in it. Defaults to 24.
+        cache (ResponseCache | None, optional): On-disk response cache with per-endpoint TTLs.
+            Disabled by default.
+        frame_cache (FrameCache | None, optional): In-memory LRU of processed DataFrames,
+            so repeated calls within a run skip the download and pandas work. Disabled by default.
+        calls_per_minute (float | None, optional): Client-side rate limit shared by all
+            sub-clients. Unlimited by default.
+        max_retries (int, optional): Retries for 429 and 5xx responses, with jittered
+            exponential backoff that honors ``Retry-After``. Defaults to 3.
+        price_store (PriceStore | None, optional): Local store used by
+            ``stocks.historical_price_full(..., incremental=True)``.
+        statement_store (StatementStore | None, optional): Local store used by
+            ``financials.get_merged_financials(..., incremental=True)`` and the
+            performance views built on it.
+        symbol_rules (dict[str, str] | None, optional): Per-symbol data quality rules
+            (``'drop_first'`` or ``'exclude'``) used when merging statements. Defaults to
+            ``quality.SYMBOL_RULES``.
+        compact (CompactDtypes | None, optional): Opt-in memory-lean dtypes (categorical
+            strings, integer years, optionally float32 and pyarrow strings) for statement and
+            performance frames and the stock list. Disabled by default.
+        metrics (Metrics | None, optional): Per-endpoint request counters and histograms of
+            network, decode and DataFrame build time, read with ``stats()``. Disabled by default.
+        json_loads (Callable[[bytes], object] | None, optional): Response decoder. Defaults
+            to orjson when installed (``pip install fmpxx[fast]``), else ``json.loads``.
+        base_url (str | None, optional): Send requests to this host instead of FMP, e.g.
+            ``'http://127.0.0.1:8000'`` for a local mock server.
+        cassette (Cassette | None, optional): Record responses to, or replay them from, a
+            compressed cassette store, e.g. ``Cassette('tests/cassettes', mode='replay')``
+            for runs without network access or API quota.
+        transport (Transport | None, optional): Pre-built transport to share. Built from
+            ``pool_maxsize`` when omitted.
 
     Attributes:
+        transport (Transport): Shared connection pool used by every sub-client.
         financials (Financials): Access to company fundamental data.
         stocks (Stocks): Access to stock market data.
     """
 
-    def __init__(self, api_key: str | None, timeout: int = 10):
-        super().__init__(api_key, timeout)
+    def __init__(self, api_key: str | None, timeout: int = 10, pool_maxsize: int = 24,
+                 cache: ResponseCache | None = None, frame_cache: FrameCache | None = None,
+                 calls_per_minute: float | None = None, max_retries: int = 3,
+                 price_store: PriceStore | None = None,
+                 statement_store: StatementStore | None = None, compact: CompactDtypes | None = None,
+                 symbol_rules: dict[str, str] | None = None,
+                 metrics: Metrics | None = None, json_loads: Callable[[bytes], object] | None = None,
+                 base_url: str | None = None, cassette: Cassette | None = None,
+                 transport: Transport | None = None):
+        if transport is None:
+            transport = Transport(
+                pool_maxsize=pool_maxsize,
+                cache=cache,
+                frame_cache=frame_cache,
+                rate_limiter=RateLimiter(calls_per_minute) if calls_per_minute else None,
+                retry_policy=RetryPolicy(max_retries=max_retries),
+                json_loads=json_loads,
+                metrics=metrics,
+                base_url=base_url,
+                cassette=cassette,
+            )
+        super().__init__(api_key, timeout, transport)
 
-        # Initialize categorized API modules
-        self.financials = Financials(api_key, timeout)
-        self.stocks = Stocks(api_key, timeout)
+        # Initialize categorized API modules on the shared transport
+        self.stocks = Stocks(api_key, timeout, transport=self.transport, price_store=price_store, compact=compact)
+        self.financials = Financials(api_key, timeout, transport=self.transport, stocks=self.stocks,
+                                     statement_store=statement_store, compact=compact, symbol_rules=symbol_rules)
+
+    def on_request(self, hook: Callable[[str, dict], None]) -> None:
+        """Register ``hook(endpoint, params)``, called before every request."""
+        self.transport.before_request_hooks.append(hook)
+
+    def on_response(self, hook: Callable[[str, dict, dict], None]) -> None:
+        """Register ``hook(endpoint, params, info)``, called after every request.
+
+        ``info`` holds ``status``, ``network`` and ``decode`` times in seconds,
+        response ``bytes``, ``retries``, whether it was ``cached`` and the
+        raised ``error``, if any.
+        """
+        self.transport.after_request_hooks.append(hook)
+
+    def stats(self) -> dict:
+        """Cumulative metrics snapshot, see :meth:`Metrics.snapshot`.
+
+        Raises:
+            ValueError: If the client was created without ``metrics``.
+        """
+        if self.transport.metrics is None:
+            raise ValueError("Metrics are disabled. Create the client with metrics=Metrics().")
+        return self.transport.metrics.snapshot()
+
+    def close(self) -> None:
+        """Close the shared transport and its pooled connections."""
+        self.transport.close()
 
     # You can add more categorized properties here as you implement more modules
     # For example:
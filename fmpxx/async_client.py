@@ -0,0 +1,385 @@
+import asyncio
+import time
+import pandas as pd
+import requests
+from collections.abc import Callable
+from .base import _BaseClient, _status_error
+from .cache import MISS, ResponseCache
+from .cassette import Cassette
+from .exceptions import FMPAPIError, FMPConnectionError
+from .financials import Financials
+from .metrics import Metrics
+from .ratelimit import RateLimiter, RetryPolicy
+from .stocks import Stocks
+from .transport import Transport
+from .utils import json_loads as default_json_loads
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+class AsyncTransport:
+    """Shared aiohttp transport with a semaphore-bounded concurrency limit.
+
+    Mirrors :class:`Transport`: requests wait on the rate limiter, 429/5xx
+    responses are retried per the retry policy, and the response cache,
+    metrics, request hooks, host override and cassette apply as they do for
+    the blocking clients. Use ``from_transport`` to share them with an
+    ``FMPClient``, so both stay under one rate limit and report to one
+    ``Metrics``.
+
+    The ``aiohttp.ClientSession`` and the semaphore are bound to an event
+    loop, so both are created lazily for the running loop: the transport can
+    be built outside of a loop and reused under a later ``asyncio.run``.
+
+    Args:
+        max_concurrency (int, optional): Maximum number of in-flight requests. Defaults to 10.
+        pool_maxsize (int | None, optional): Connector connection limit. Defaults to ``max_concurrency``.
+        json_loads (Callable[[bytes], object] | None, optional): Decoder applied to raw
+            response bytes. Defaults to orjson when installed, else the stdlib.
+        cache (ResponseCache | None, optional): On-disk response cache. Disabled when None.
+        rate_limiter (RateLimiter | None, optional): Token bucket every request waits on.
+            Unlimited when None.
+        retry_policy (RetryPolicy | None, optional): Backoff schedule for 429 and 5xx
+            responses. Defaults to ``RetryPolicy()``.
+        metrics (Metrics | None, optional): Request metrics. Disabled when None.
+        base_url (str | None, optional): Host to send requests to instead of FMP.
+        cassette (Cassette | None, optional): Record responses to, or replay them from, a
+            cassette store.
+
+    Attributes:
+        before_request_hooks (list): Callbacks ``hook(endpoint, params)``, see ``Transport``.
+        after_request_hooks (list): Callbacks ``hook(endpoint, params, info)``, see ``Transport``.
+    """
+
+    def __init__(self, max_concurrency: int = 10, pool_maxsize: int | None = None,
+                 json_loads: Callable[[bytes], object] | None = None, cache: ResponseCache | None = None,
+                 rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None,
+                 metrics: Metrics | None = None, base_url: str | None = None, cassette: Cassette | None = None):
+        if aiohttp is None:
+            raise ImportError("AsyncFMPClient requires aiohttp. Install it with `pip install fmpxx[async]`.")
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize or max_concurrency
+        self.json_loads = json_loads if json_loads is not None else default_json_loads
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.metrics = metrics
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.cassette = cassette
+        self.before_request_hooks: list[Callable] = []
+        self.after_request_hooks: list[Callable] = []
+        self.semaphore: asyncio.Semaphore | None = None
+        self.session = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def from_transport(cls, transport: Transport, max_concurrency: int = 10) -> "AsyncTransport":
+        """Build an async transport sharing a blocking transport's cache, rate limiter,
+        retry policy, metrics, request hooks, host override and cassette."""
+        async_transport = cls(
+            max_concurrency=max_concurrency,
+            json_loads=transport.json_loads,
+            cache=transport.cache,
+            rate_limiter=transport.rate_limiter,
+            retry_policy=transport.retry_policy,
+            metrics=transport.metrics,
+            base_url=transport.base_url,
+            cassette=transport.cassette,
+        )
+        async_transport.before_request_hooks = transport.before_request_hooks
+        async_transport.after_request_hooks = transport.after_request_hooks
+        return async_transport
+
+    def _loop_resources(self) -> tuple[asyncio.Semaphore, "aiohttp.ClientSession"]:
+        """The semaphore and session of the running event loop, created on its first request."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Those of a previous loop cannot be awaited on from this one
+            self._loop = loop
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.session = None
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.semaphore, self.session
+
+    async def get(self, url: str, params: dict | None = None, timeout: float | None = None) -> requests.Response:
+        """Issue a GET request, retrying 429/5xx responses per the retry policy.
+
+        The body is read in full and returned as a ``requests.Response`` with
+        ``retries`` set, so status handling stays with the caller as with
+        :meth:`Transport.get`. A replaying cassette serves the response
+        without touching the network.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            return await asyncio.to_thread(self.cassette.replay, url, params)
+
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            semaphore, session = self._loop_resources()
+            async with semaphore:
+                async with session.get(url, params=params, timeout=client_timeout) as response:
+                    body = await response.read()
+                    status, headers = response.status, response.headers
+
+            delay = self.retry_policy.backoff(url, status, attempt, headers.get("Retry-After"), self.rate_limiter)
+            if delay is None:
+                result = requests.Response()
+                result.status_code = status
+                result.headers.update({"Content-Type": headers.get("Content-Type", "application/json")})
+                result._content = body
+                result.url = url
+                result.encoding = "utf-8"
+                result.retries = attempt
+                if self.cassette is not None and self.cassette.recording:
+                    await asyncio.to_thread(self.cassette.record, url, params, result)
+                return result
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    run_hooks = Transport.run_hooks
+
+    async def close(self) -> None:
+        """Close the current loop's session and release pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+
+class _AsyncBaseClient:
+    BASE_URL = _BaseClient.BASE_URL
+
+    # Response helpers are pure functions shared with the blocking clients
+    _process_response = staticmethod(_BaseClient._process_response)
+    _ensure_dataframe = staticmethod(_BaseClient._ensure_dataframe)
+    _standardize_date_format = staticmethod(_BaseClient._standardize_date_format)
+    _resolve_base_url = _BaseClient._resolve_base_url
+    _start_request = _BaseClient._start_request
+    _finish_request = _BaseClient._finish_request
+    _fail_request = _BaseClient._fail_request
+    convert_to_json = _BaseClient.convert_to_json
+
+    def __init__(self, api_key: str | None, timeout: int = 10, transport: AsyncTransport | None = None):
+        if not api_key:
+            raise ValueError("API key is required.")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.transport = transport if transport is not None else AsyncTransport()
+
+    async def _make_request(self, endpoint: str, params: dict | None = None, base_url: str | None = None) -> dict:
+        base_url = self._resolve_base_url(base_url)
+        url = f"{base_url}{endpoint}"
+        # None values are dropped, as requests does for the blocking clients
+        full_params = {k: v for k, v in (params or {}).items() if v is not None}
+        transport = self.transport
+        info = self._start_request(endpoint, full_params)
+
+        cache = transport.cache
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, endpoint, full_params, base_url)
+            if cached is not MISS:
+                info["cached"] = True
+                self._finish_request(endpoint, full_params, info)
+                return cached
+
+        start = time.perf_counter()
+        try:
+            try:
+                response = await transport.get(url, params={**full_params, 'apikey': self.api_key},
+                                               timeout=self.timeout)
+            except aiohttp.ClientConnectionError as e:
+                raise FMPConnectionError(f"Network connection error: {e}") from e
+            except asyncio.TimeoutError as e:
+                raise FMPConnectionError(f"Request timed out after {self.timeout} seconds: {e}") from e
+            except aiohttp.ClientError as e:
+                raise FMPAPIError(f"An unexpected request error occurred: {e}") from e
+            info["status"], info["retries"] = response.status_code, response.retries
+            info["network"] = time.perf_counter() - start
+            info["bytes"] = len(response.content)
+            if response.status_code >= 400:
+                raise _status_error(response.status_code, response.text, endpoint)
+
+            decode_start = time.perf_counter()
+            try:
+                data = await asyncio.to_thread(transport.json_loads, response.content)
+            except ValueError as e:
+                raise FMPAPIError(f"Failed to decode JSON response: {e}. Response content: {response.text}") from e
+            info["decode"] = time.perf_counter() - decode_start
+        except FMPAPIError as e:
+            self._fail_request(endpoint, full_params, info, e, start)
+            raise
+
+        self._finish_request(endpoint, full_params, info)
+
+        # FMP reports some errors with a 200 status; never cache those
+        if cache is not None and not (isinstance(data, dict) and "Error Message" in data):
+            await asyncio.to_thread(cache.set, endpoint, full_params, data, base_url)
+
+        return data
+
+    @staticmethod
+    async def _offload(func, *args, **kwargs):
+        """Run pandas post-processing in a worker thread, off the event loop."""
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+class AsyncFinancials(_AsyncBaseClient):
+    """Async counterpart of :class:`Financials` for fundamentals endpoints."""
+
+    async def get_financials(self, symbol: str, statement: str, limit: int = 10, period: str = 'quarter', **query_params) -> pd.DataFrame:
+        """Async version of :meth:`Financials.get_financials`."""
+        endpoint, params = Financials._statement_request(symbol, statement, limit, period, **query_params)
+        data = await self._make_request(endpoint, params)
+        df = await self._offload(self._process_response, data)
+        return self._ensure_dataframe(df)
+
+    async def get_merged_financials(self, symbol: str, limit: int = 40, period: str = 'quarter') -> pd.DataFrame | None:
+        """Async version of :meth:`Financials.get_merged_financials`.
+
+        The three statements are requested concurrently.
+        """
+        income, balance, cash = await asyncio.gather(
+            self.get_financials(symbol, statement="income", period=period, limit=limit),
+            self.get_financials(symbol, statement="balance", period=period, limit=limit),
+            self.get_financials(symbol, statement="cash", period=period, limit=limit),
+        )
+        return await self._offload(Financials._merge_statements, symbol, income, balance, cash)
+
+    async def get_stock_performance(self, symbol: str, limit: int = 12, period: str = 'quarter') -> pd.DataFrame | None:
+        """Async version of :meth:`Financials.get_stock_performance`."""
+        merged_df = await self.get_merged_financials(symbol, limit=limit, period=period)
+        return await self._offload(Financials._compute_performance, merged_df)
+
+    async def get_earnings_his(self, symbol: str, period: int = 3) -> pd.DataFrame:
+        """Async version of :meth:`Financials.get_earnings_his`."""
+        endpoint = f"historical/earning_calendar/{symbol}"
+        data = await self._make_request(endpoint, {"limit": period * 4 + 4})
+        return await self._offload(Financials._process_earnings, data)
+
+
+class AsyncStocks(_AsyncBaseClient):
+    """Async counterpart of :class:`Stocks` for stock market endpoints."""
+
+    async def historical_price_full(self, symbol: str, series_type: str | None = None, start: str | None = None, end: str | None = None, period: int | None = None) -> pd.DataFrame:
+        """Async version of :meth:`Stocks.historical_price_full`."""
+        endpoint, params = Stocks._historical_request(symbol, series_type, start, end, period)
+        data = await self._make_request(endpoint, params)
+        return await self._offload(Stocks._process_historical, data)
+
+    async def daily_prices(self, symbol: str, start: str | None = None, end: str | None = None, period: int | None = None) -> pd.DataFrame:
+        """Async version of :meth:`Stocks.daily_prices`."""
+        return await self.historical_price_full(symbol, series_type='line', start=start, end=end, period=period)
+
+    async def stock_list(self):
+        """Async version of :meth:`Stocks.stock_list`."""
+        data = await self._make_request("stock/list")
+        return await self._offload(self._process_response, data)
+
+    async def quote(self, symbol: str):
+        """Async version of :meth:`Stocks.quote`."""
+        data = await self._make_request(f"quote/{symbol}")
+        return await self._offload(self._process_response, data)
+
+    async def search(self, query: str, exchange: str | None = None, limit: int = 10):
+        """Async version of :meth:`Stocks.search`."""
+        params = {'query': query, 'limit': limit}
+        if exchange: params['exchange'] = exchange
+        data = await self._make_request("search", params)
+        return await self._offload(self._process_response, data)
+
+
+class AsyncFMPClient:
+    """Asyncio client for the Financial Modeling Prep (FMP) API.
+
+    Mirrors :class:`FMPClient` on an aiohttp transport. All sub-clients share
+    one connection pool and one semaphore, so at most ``max_concurrency``
+    requests are in flight no matter how many coroutines are gathered.
+
+    Args:
+        api_key (str | None): Your FMP API key.
+        timeout (int, optional): Request timeout in seconds. Defaults to 10.
+        max_concurrency (int, optional): Maximum number of concurrent requests. Defaults to 10.
+        cache (ResponseCache | None, optional): On-disk response cache. Disabled by default.
+        calls_per_minute (float | None, optional): Client-side rate limit. Unlimited by default.
+        max_retries (int, optional): Retries for 429 and 5xx responses, honoring
+            ``Retry-After``. Defaults to 3.
+        metrics (Metrics | None, optional): Per-endpoint request metrics, read with ``stats()``.
+            Disabled by default.
+        json_loads (Callable[[bytes], object] | None, optional): Response decoder.
+        base_url (str | None, optional): Send requests to this host instead of FMP.
+        cassette (Cassette | None, optional): Record responses to, or replay them from, a
+            cassette store.
+        transport (AsyncTransport | None, optional): Pre-built transport to share, e.g.
+            ``AsyncTransport.from_transport(client.transport)`` to share an ``FMPClient``'s
+            rate limiter, retry policy, cache and metrics. Built from the other arguments
+            when omitted.
+
+    Attributes:
+        financials (AsyncFinancials): Access to company fundamental data.
+        stocks (AsyncStocks): Access to stock market data.
+
+    Example:
+        async with AsyncFMPClient(api_key) as client:
+            frames = await asyncio.gather(*(client.financials.get_stock_performance(s) for s in symbols))
+    """
+
+    def __init__(self, api_key: str | None, timeout: int = 10, max_concurrency: int = 10,
+                 cache: ResponseCache | None = None, calls_per_minute: float | None = None,
+                 max_retries: int = 3, metrics: Metrics | None = None,
+                 json_loads: Callable[[bytes], object] | None = None, base_url: str | None = None,
+                 cassette: Cassette | None = None, transport: AsyncTransport | None = None):
+        if not api_key:
+            raise ValueError("API key is required.")
+        self.api_key = api_key
+        self.timeout = timeout
+        if transport is None:
+            transport = AsyncTransport(
+                max_concurrency=max_concurrency,
+                json_loads=json_loads,
+                cache=cache,
+                rate_limiter=RateLimiter(calls_per_minute) if calls_per_minute else None,
+                retry_policy=RetryPolicy(max_retries=max_retries),
+                metrics=metrics,
+                base_url=base_url,
+                cassette=cassette,
+            )
+        self.transport = transport
+
+        self.financials = AsyncFinancials(api_key, timeout, transport=self.transport)
+        self.stocks = AsyncStocks(api_key, timeout, transport=self.transport)
+
+    def on_request(self, hook: Callable[[str, dict], None]) -> None:
+        """Register ``hook(endpoint, params)``, called before every request."""
+        self.transport.before_request_hooks.append(hook)
+
+    def on_response(self, hook: Callable[[str, dict, dict], None]) -> None:
+        """Register ``hook(endpoint, params, info)``, called after every request, see ``FMPClient.on_response``."""
+        self.transport.after_request_hooks.append(hook)
+
+    def stats(self) -> dict:
+        """Cumulative metrics snapshot, see :meth:`Metrics.snapshot`.
+
+        Raises:
+            ValueError: If the client was created without ``metrics``.
+        """
+        if self.transport.metrics is None:
+            raise ValueError("Metrics are disabled. Create the client with metrics=Metrics().")
+        return self.transport.metrics.snapshot()
+
+    convert_to_json = _BaseClient.convert_to_json
+
+    async def close(self) -> None:
+        """Close the shared transport."""
+        await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncFMPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -1,49 +1,228 @@
+import time
 import requests
 import pandas as pd
+from contextlib import nullcontext
+from collections.abc import Iterator
 from .exceptions import FMPAPIError, InvalidAPIKeyError, SymbolNotFoundError, RateLimitExceededError, FMPConnectionError
+from .cache import MISS
+from .metrics import endpoint_name
+from .transport import Transport
+from .utils import CompactDtypes, iter_json_array
+
+def _status_error(status_code: int, text: str, endpoint: str) -> FMPAPIError:
+    """Map an HTTP error status to the matching FMP exception."""
+    if status_code == 401:
+        return InvalidAPIKeyError("Invalid API key. Please check your API key.")
+    elif status_code == 404:
+        return SymbolNotFoundError(f"Resource not found for endpoint: {endpoint}. Details: {text}")
+    elif status_code == 429:
+        return RateLimitExceededError("API rate limit exceeded. Please wait and try again.")
+    else:
+        return FMPAPIError(f"FMP API error: {status_code} - {text}")
+
+FMP_HOST = "https://financialmodelingprep.com"
+
+# Sentinel marking the end of a streamed response
+_END = object()
 
 class _BaseClient:
-    BASE_URL = "https://financialmodelingprep.com/api/v3/"
+    BASE_URL = f"{FMP_HOST}/api/v3/"
+    BASE_URL_V4 = f"{FMP_HOST}/api/v4/"
 
-    def __init__(self, api_key: str|None, timeout: int = 10):
+    # Dtype policy for returned frames; None keeps pandas' default dtypes
+    compact: CompactDtypes | None = None
+
+    def __init__(self, api_key: str|None, timeout: int = 10, transport: Transport | None = None):
         if not api_key:
             raise ValueError("API key is required.")
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        # Reuse an injected transport so sub-clients share one connection pool
+        self.transport = transport if transport is not None else Transport()
+        self.session = self.transport.session
         self.session.params = {'apikey': self.api_key}
 
-    def _make_request(self, endpoint: str, params: dict | None = None) -> dict:
-        url = f"{self.BASE_URL}{endpoint}"
+    def _make_request(self, endpoint: str, params: dict | None = None, base_url: str | None = None) -> dict:
+        base_url = self._resolve_base_url(base_url)
+        url = f"{base_url}{endpoint}"
         full_params = params.copy() if params else {}
+        transport = self.transport
+        info = self._start_request(endpoint, full_params)
+
+        cache = transport.cache
+        if cache is not None:
+            cached = cache.get(endpoint, full_params, base_url)
+            if cached is not MISS:
+                info["cached"] = True
+                self._finish_request(endpoint, full_params, info)
+                return cached
 
+        start = time.perf_counter()
         try:
-            response = self.session.get(url, params=full_params, timeout=self.timeout)
+            response = self._send(url, endpoint, full_params)
+            info["status"], info["retries"] = response.status_code, getattr(response, "retries", 0)
+            info["network"] = time.perf_counter() - start
+            info["bytes"] = len(response.content)
+
+            decode_start = time.perf_counter()
+            try:
+                # Decode the raw bytes directly, skipping requests' text decoding
+                data = transport.json_loads(response.content)
+            except ValueError as e:
+                raise FMPAPIError(f"Failed to decode JSON response: {e}. Response content: {response.text}") from e
+            info["decode"] = time.perf_counter() - decode_start
+        except FMPAPIError as e:
+            self._fail_request(endpoint, full_params, info, e, start)
+            raise
+
+        self._finish_request(endpoint, full_params, info)
+
+        # FMP reports some errors with a 200 status; never cache those
+        if cache is not None and not (isinstance(data, dict) and "Error Message" in data):
+            cache.set(endpoint, full_params, data, base_url)
+
+        return data
+
+    def _start_request(self, endpoint: str, params: dict) -> dict:
+        """Run the before-request hooks and return the empty info dict passed to the after-request hooks."""
+        transport = self.transport
+        if transport.before_request_hooks:
+            transport.run_hooks(transport.before_request_hooks, endpoint, params)
+        return {"status": None, "network": 0.0, "decode": 0.0, "bytes": 0, "retries": 0, "cached": False, "error": None}
+
+    def _finish_request(self, endpoint: str, params: dict, info: dict) -> None:
+        """Record a finished request in the metrics and run the after-request hooks."""
+        transport = self.transport
+        metrics = transport.metrics
+        if metrics is not None:
+            name = endpoint_name(endpoint)
+            if info["cached"]:
+                metrics.record_cache_hit(name)
+            elif info["error"] is not None:
+                metrics.record_error(name, info["network"], info["status"], info["retries"])
+            else:
+                metrics.record_request(name, info["status"], info["network"], info["decode"],
+                                       info["bytes"], info["retries"])
+        if transport.after_request_hooks:
+            transport.run_hooks(transport.after_request_hooks, endpoint, params, info)
+
+    def _fail_request(self, endpoint: str, params: dict, info: dict, error: FMPAPIError, start: float) -> None:
+        """Fill ``info`` from a failed request, which raised before a response was read, and finish it."""
+        if info["status"] is None:
+            failed = getattr(error.__cause__, "response", None)
+            info["status"] = getattr(failed, "status_code", None)
+            info["retries"] = getattr(failed, "retries", 0)
+            info["network"] = time.perf_counter() - start
+        info["error"] = error
+        self._finish_request(endpoint, params, info)
+
+    def _resolve_base_url(self, base_url: str | None) -> str:
+        """Default to the v3 API and redirect to the transport's host override, if any."""
+        base_url = base_url or self.BASE_URL
+        if self.transport.base_url is not None and base_url.startswith(FMP_HOST):
+            return self.transport.base_url + base_url[len(FMP_HOST):]
+        return base_url
+
+    def _pool_workers(self, max_workers: int, requests_per_worker: int = 1) -> int:
+        """Cap ``max_workers`` so their concurrent requests fit in the transport's connection pool."""
+        return max(1, min(max_workers, self.transport.pool_maxsize // requests_per_worker))
+
+    def _memo_state(self) -> tuple:
+        """Client state that ``memoize_frame`` keys results on, so clients sharing a
+        transport never see frames built for another key or dtype policy."""
+        return type(self).__name__, self.compact, self.api_key
+
+    def _timed(self, stage: str):
+        """Context manager recording DataFrame build time for ``stage`` when metrics are enabled."""
+        metrics = self.transport.metrics
+        return metrics.time_build(stage) if metrics is not None else nullcontext()
+
+    def _stream_request(self, endpoint: str, params: dict | None = None, base_url: str | None = None,
+                        chunk_size: int = 64 * 1024) -> Iterator:
+        """Yield the elements of a JSON array response as they arrive.
+
+        The body is decoded incrementally from the socket, so the full payload
+        is never held in memory. A cached response is replayed from the cache;
+        streamed responses are not written to it. Request hooks and metrics
+        see the request once the stream ends (or is closed early); ``network``
+        is the time spent waiting on the socket and ``decode`` the time spent
+        parsing.
+        """
+        base_url = self._resolve_base_url(base_url)
+        url = f"{base_url}{endpoint}"
+        full_params = params.copy() if params else {}
+        info = self._start_request(endpoint, full_params)
+
+        cache = self.transport.cache
+        if cache is not None:
+            cached = cache.get(endpoint, full_params, base_url)
+            if cached is not MISS:
+                info["cached"] = True
+                self._finish_request(endpoint, full_params, info)
+                yield from cached if isinstance(cached, list) else [cached]
+                return
+
+        start = time.perf_counter()
+        try:
+            response = self._send(url, endpoint, full_params, stream=True)
+        except FMPAPIError as e:
+            self._fail_request(endpoint, full_params, info, e, start)
+            raise
+        info["status"], info["retries"] = response.status_code, getattr(response, "retries", 0)
+        info["network"] = time.perf_counter() - start
+
+        def chunks() -> Iterator[bytes]:
+            body = response.iter_content(chunk_size=chunk_size)
+            while True:
+                wait_start = time.perf_counter()
+                chunk = next(body, None)
+                info["network"] += time.perf_counter() - wait_start
+                if chunk is None:
+                    return
+                info["bytes"] += len(chunk)
+                yield chunk
+
+        with response:
+            try:
+                items = iter_json_array(chunks())
+                while True:
+                    parse_start, network = time.perf_counter(), info["network"]
+                    item = next(items, _END)
+                    info["decode"] += time.perf_counter() - parse_start - (info["network"] - network)
+                    if item is _END:
+                        break
+                    if isinstance(item, dict) and "Error Message" in item:
+                        raise FMPAPIError(f"FMP API error: {item['Error Message']}")
+                    yield item
+            except ValueError as e:
+                info["error"] = FMPAPIError(f"Failed to decode JSON response: {e}")
+                raise info["error"] from e
+            except requests.exceptions.RequestException as e:
+                info["error"] = FMPConnectionError(f"Network connection error while streaming: {e}")
+                raise info["error"] from e
+            except FMPAPIError as e:
+                info["error"] = e
+                raise
+            finally:
+                self._finish_request(endpoint, full_params, info)
+
+    def _send(self, url: str, endpoint: str, params: dict, stream: bool = False) -> requests.Response:
+        """Issue the request and map HTTP and network failures to FMP exceptions."""
+        try:
+            response = self.transport.get(url, params=params, timeout=self.timeout, stream=stream)
             response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                raise InvalidAPIKeyError("Invalid API key. Please check your API key.") from e
-            elif response.status_code == 404:
-                raise SymbolNotFoundError(f"Resource not found for endpoint: {endpoint}. Details: {response.text}") from e
-            elif response.status_code == 429:
-                raise RateLimitExceededError("API rate limit exceeded. Please wait and try again.") from e
-            else:
-                raise FMPAPIError(f"FMP API error: {response.status_code} - {response.text}") from e
+            raise _status_error(response.status_code, response.text, endpoint) from e
         except requests.exceptions.ConnectionError as e:
             raise FMPConnectionError(f"Network connection error: {e}") from e
         except requests.exceptions.Timeout as e:
             raise FMPConnectionError(f"Request timed out after {self.timeout} seconds: {e}") from e
         except requests.exceptions.RequestException as e:
             raise FMPAPIError(f"An unexpected request error occurred: {e}") from e
+        return response
 
-        try:
-            data = response.json()
-        except ValueError as e:
-            raise FMPAPIError(f"Failed to decode JSON response: {e}. Response content: {response.text}") from e
-
-        return data
-
-    def _process_response(self, data) -> list | pd.DataFrame:
+    @staticmethod
+    def _process_response(data) -> list | pd.DataFrame:
         if isinstance(data, list):
             if not data:
                 return pd.DataFrame() # Return empty DataFrame for empty list
@@ -58,17 +237,24 @@ class _BaseClient:
                 return data
         return data
 
-    def _ensure_dataframe(self, data) -> pd.DataFrame:
+    def _compact_frame(self, df):
+        """Apply the client's compact dtype policy, if any, to a result frame."""
+        if self.compact is None or not isinstance(df, pd.DataFrame):
+            return df
+        return self.compact.apply(df)
+
+    @staticmethod
+    def _ensure_dataframe(data) -> pd.DataFrame:
         """Ensure data is a DataFrame type"""
         if isinstance(data, list):
             return pd.DataFrame(data)
         return data if isinstance(data, pd.DataFrame) else pd.DataFrame()
 
-    def _standardize_date_format(self, df: pd.DataFrame, date_col: str = 'date') -> pd.DataFrame:
-        """Standardize date format to YYYY-MM-DD"""
+    @staticmethod
+    def _standardize_date_format(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFrame:
+        """Standardize dates to day-resolution datetime64[ns]"""
         if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col])
-            df[date_col] = df[date_col].dt.strftime('%Y-%m-%d')
+            df[date_col] = pd.to_datetime(df[date_col]).dt.normalize().astype('datetime64[ns]')
         return df
 
     def convert_to_json(self, data: pd.DataFrame | list[dict]) -> list[dict]:
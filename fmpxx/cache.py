@@ -0,0 +1,292 @@
+import functools
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+import pandas as pd
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# TTLs (seconds) per endpoint class, matched on the endpoint path prefix.
+# Endpoints without a matching entry are not cached.
+DEFAULT_TTLS = {
+    "income-statement": 7 * DAY,
+    "balance-sheet-statement": 7 * DAY,
+    "cash-flow-statement": 7 * DAY,
+    "historical/earning_calendar": 7 * DAY,
+    "revenue-product-segmentation": 7 * DAY,
+    "revenue-geographic-segmentation": 7 * DAY,
+    "historical-price-full": 1 * HOUR,
+    "stock/list": 1 * DAY,
+    "search": 1 * DAY,
+    "quote": 15,
+}
+
+# Returned by the cache lookups that find nothing, since None is a valid cached value
+MISS = object()
+
+
+class ResponseCache:
+    """Persistent on-disk cache of decoded API responses.
+
+    Entries are keyed by base URL, endpoint and normalized query params (the
+    API key is never part of the key) and stored as gzipped JSON files. Each
+    endpoint class has its own TTL, and the cache is bounded in size by
+    evicting the least recently used entries.
+
+    Args:
+        directory (str): Directory to store cache entries in. Created if missing.
+        ttls (dict[str, float] | None, optional): Overrides merged into ``DEFAULT_TTLS``.
+            Keys are endpoint prefixes such as ``'quote'`` or ``'stock/list'``; a TTL of
+            ``0`` or ``None`` disables caching for that endpoint class.
+        max_bytes (int, optional): Size budget for all entries. Defaults to 512 MB.
+    """
+
+    def __init__(self, directory: str, ttls: dict[str, float | None] | None = None, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        # Longest prefix first so 'historical-price-full' wins over shorter prefixes
+        self._prefixes = sorted(self.ttls, key=len, reverse=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, _, size in self._entries())
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        """Return the TTL in seconds for an endpoint, or None if it is not cacheable."""
+        for prefix in self._prefixes:
+            if endpoint == prefix or endpoint.startswith(prefix + "/"):
+                return self.ttls[prefix] or None
+        return None
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict | None = None, base_url: str = "") -> str:
+        """Build a stable cache key from the request, excluding the API key."""
+        normalized = sorted(
+            (str(k), str(v)) for k, v in (params or {}).items()
+            if k.lower() != "apikey" and v is not None
+        )
+        raw = json.dumps([base_url, endpoint, normalized], separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, endpoint: str, params: dict | None = None, base_url: str = ""):
+        """Return the cached response, or ``MISS`` if absent or expired."""
+        ttl = self.ttl_for(endpoint)
+        if ttl is None:
+            return MISS
+
+        path = self._path(self.make_key(endpoint, params, base_url))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return MISS
+
+        if time.time() - entry.get("created", 0) > ttl:
+            self._remove(path)
+            return MISS
+
+        # Touch the file so eviction order follows recency of use
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["data"]
+
+    def set(self, endpoint: str, params: dict | None, data, base_url: str = "") -> None:
+        """Store a decoded response if its endpoint class is cacheable."""
+        if self.ttl_for(endpoint) is None:
+            return
+
+        path = self._path(self.make_key(endpoint, params, base_url))
+        payload = json.dumps({"created": time.time(), "endpoint": endpoint, "data": data}).encode("utf-8")
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(payload))
+            with self._lock:
+                old_size = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(tmp_path, path)
+                self._total_bytes += os.path.getsize(path) - old_size
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            for path, _, _ in self._entries():
+                os.remove(path)
+            self._total_bytes = 0
+
+    @property
+    def size(self) -> int:
+        """Total size of cached entries in bytes."""
+        return self._total_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json.gz"):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _remove(self, path: str) -> None:
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self._total_bytes -= size
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its budget. Caller holds the lock."""
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        self._total_bytes = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self._total_bytes -= size
+            except OSError:
+                pass
+
+
+class FrameCache:
+    """In-process LRU cache of processed DataFrames.
+
+    Bounded by entry count and by an approximate byte budget (deep memory
+    usage of the cached frames). Frames are copied on the way out, so callers
+    can mutate results freely without corrupting the cache.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached results. Defaults to 256.
+        max_bytes (int | None, optional): Memory budget in bytes. Defaults to 256 MB;
+            None disables the byte bound.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to be computed.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int | None = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a copy of the cached value, or ``MISS``."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value, _ = self._entries[key]
+        return _copy_frame(value)
+
+    def set(self, key, value) -> None:
+        """Cache a value and evict least recently used entries beyond the bounds."""
+        size = _frame_bytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Snapshot of hit/miss counters and current usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+def _frame_bytes(value) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    return 0
+
+
+def _copy_frame(value):
+    return value.copy() if isinstance(value, pd.DataFrame) else value
+
+
+def memoize_frame(method):
+    """Memoize a client method's processed result in the transport's FrameCache.
+
+    The cache key is the client's ``_memo_state()`` (class, dtype policy, API
+    key and, for ``Financials``, the quality rules), the method name and the
+    bound arguments with defaults applied, so positional and keyword calls
+    share entries. Calls are passed straight through when no frame cache is
+    configured.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self.transport.frame_cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(
+            (name, tuple(sorted(value.items())) if isinstance(value, dict)
+             else tuple(value) if isinstance(value, list) else value)
+            for name, value in bound.arguments.items() if name != "self"
+        )
+        key = (*self._memo_state(), method.__name__, arguments)
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        cached = cache.get(key)
+        if cached is not MISS:
+            return cached
+        result = method(self, *args, **kwargs)
+        cache.set(key, result)
+        return _copy_frame(result)
+
+    return wrapper
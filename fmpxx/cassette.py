@@ -0,0 +1,111 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from urllib.parse import urlparse
+import requests
+from .exceptions import CassetteMissError
+
+MODES = ("record", "replay")
+
+
+class Cassette:
+    """Compressed store of recorded HTTP responses for zero-network runs.
+
+    In ``record`` mode every response that reaches the network is saved with
+    its status code and raw body. In ``replay`` mode responses are served
+    from the store only, and a request that was never recorded raises
+    :class:`CassetteMissError` instead of touching the network.
+
+    Recordings are keyed by URL path and query params, so they replay
+    against any host (e.g. a ``base_url`` override). The API key is never
+    part of the key or of the stored entry.
+
+    Args:
+        directory (str): Directory holding one gzipped JSON file per recording.
+        mode (str, optional): ``'record'`` or ``'replay'``. Defaults to ``'replay'``.
+        ignore_values (Iterable[str], optional): Query params matched by name only, e.g.
+            ``('from', 'to')`` so date windows computed from today still replay. Requests
+            that differ only in these values share one recording.
+    """
+
+    def __init__(self, directory: str, mode: str = "replay", ignore_values: Iterable[str] = ()):
+        if mode not in MODES:
+            raise ValueError(f"Invalid cassette mode: {mode}. Use one of {MODES}.")
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.mode = mode
+        self.ignore_values = {p.lower() for p in ignore_values}
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def make_key(self, url: str, params: dict | None = None) -> str:
+        """Stable key from the URL path and query params, without the API key."""
+        normalized = sorted(
+            (str(k), "*" if k.lower() in self.ignore_values else str(v))
+            for k, v in (params or {}).items()
+            if k.lower() != "apikey" and v is not None
+        )
+        raw = json.dumps([urlparse(url).path, normalized], separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def replay(self, url: str, params: dict | None = None) -> requests.Response:
+        """Build the recorded response for a request.
+
+        Raises:
+            CassetteMissError: If the request was not recorded.
+        """
+        path = self._path(self.make_key(url, params))
+        try:
+            with gzip.open(path, "rb") as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError) as e:
+            raise CassetteMissError(f"No recorded response for {urlparse(url).path} with params "
+                                    f"{self._public_params(params)} in {self.directory}") from e
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers.update(entry.get("headers", {}))
+        response.url = url
+        response.encoding = "utf-8"
+        # Served through raw so streamed reads work as well as .content
+        response.raw = io.BytesIO(entry["body"].encode("utf-8"))
+        response.retries = 0
+        return response
+
+    def record(self, url: str, params: dict | None, response: requests.Response) -> None:
+        """Save a response's status and body. Reads the body if it was streamed."""
+        entry = {
+            "recorded": time.time(),
+            "path": urlparse(url).path,
+            "params": self._public_params(params),
+            "status": response.status_code,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "application/json")},
+            "body": response.content.decode("utf-8", errors="replace"),
+        }
+        path = self._path(self.make_key(url, params))
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(json.dumps(entry).encode("utf-8")))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    @staticmethod
+    def _public_params(params: dict | None) -> dict:
+        return {k: v for k, v in (params or {}).items() if k.lower() != "apikey"}
@@ -19,3 +19,7 @@ class RateLimitExceededError(FMPAPIError):
 class FMPConnectionError(FMPAPIError):
     """Raised for network-related errors during API requests."""
     pass
+
+class CassetteMissError(FMPAPIError):
+    """Raised when a replaying cassette has no recorded response for a request."""
+    pass
@@ -1,17 +1,144 @@
 from .base import _BaseClient
+from .cache import memoize_frame
+from .exceptions import FMPAPIError
+from .quality import MAX_REPORT_GAP_DAYS, SYMBOL_RULES, QualityReport, validate_statements
 from .stocks import Stocks
+from .store import StatementStore
+from .transport import Transport
+from .utils import CompactDtypes, finalize_frame
+import numpy as np
 import pandas as pd
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
 from fmpxx.utils import round_raw_data
 
 logger = logging.getLogger(__name__)
 
-class Financials(_BaseClient):
-    """Client for FMP Company Fundamentals API endpoints."""
+STATEMENT_ENDPOINTS = {
+    "income": "income-statement",
+    "balance": "balance-sheet-statement",
+    "cash": "cash-flow-statement"
+}
+
+# Keys the three statements are joined on
+MERGE_KEYS = [
+    "cik", "fillingDate", "date", "symbol",
+    "period", "calendarYear", "reportedCurrency"
+]
+
+# Columns every merged frame keeps: the merge keys as renamed in the output,
+# plus the income statement's acceptance time used to order filings
+MERGED_KEY_COLUMNS = (
+    "cik", "date", "period_date", "symbol",
+    "period", "calendarYear", "reportedCurrency", "acceptedDate_x"
+)
+
+# Merged statement columns the performance metrics are derived from
+PERFORMANCE_INPUT_COLUMNS = [
+    'period_date', 'date', 'symbol', 'calendarYear', 'period',
+    'revenue', 'grossProfitRatio', 'epsdiluted', 'operatingIncomeRatio',
+    'operatingIncome', 'freeCashFlow', 'totalDebt', 'totalAssets'
+]
+
+# Year-over-year growth columns and the column each is computed from
+GROWTH_COLUMNS = {
+    'revenue_growth_rate': 'revenue',
+    'operatingIncome_growth_rate': 'operatingIncome',
+    'eps_diluted_growth_rate': 'epsdiluted',
+}
+
+PERFORMANCE_COLUMNS = [
+    'period_date', 'date', 'symbol', 'calendarYear', 'period',
+    # Quality metrics
+    'grossProfitRatio',
+    'operatingIncomeRatio',
+    'freeCashFlowMargin',
+    'debtToAssetRatio',
+    # Growth metrics
+    'revenue', 'revenue_growth_rate',
+    'operatingIncome', 'operatingIncome_growth_rate',
+    # Valuation metrics
+    'epsdiluted', 'eps_diluted_growth_rate'
+]
+
+
+def compute_performance_panel(merged_long_df: pd.DataFrame, raw: bool = False) -> pd.DataFrame:
+    """
+    Compute quality and growth metrics for many symbols in one vectorized pass.
+
+    Rows are ordered by symbol (in order of first appearance) and then by
+    ``period_date``, and the year-over-year growth rates compare each report
+    with the one four reports earlier of the same symbol, so symbols never
+    leak into each other's growth rates.
+
+    Args:
+        merged_long_df (pd.DataFrame): Merged statements of one or more symbols, as
+            returned by ``get_merged_financials``, stacked into one long frame.
+        raw (bool): Keep missing values and full precision instead of filling numeric
+            columns with 0 and rounding them to 2 decimals.
+
+    Returns:
+        pd.DataFrame: Performance metrics with the ``get_stock_performance`` columns.
+    """
+    df = merged_long_df[PERFORMANCE_INPUT_COLUMNS].assign(
+        period_date=lambda x: pd.to_datetime(x['period_date'])
+    )
+
+    # Sort by symbol, then chronologically, for the year-over-year comparison
+    codes = pd.factorize(df['symbol'])[0]
+    order = np.lexsort((df['period_date'].to_numpy(), codes))
+    df = df.iloc[order]
+
+    # Calculate quality metrics
+    df['freeCashFlowMargin'] = df['freeCashFlow'] / df['revenue']
+    df['debtToAssetRatio'] = df['totalDebt'] / df['totalAssets']
+
+    # Calculate year-over-year growth rates (periods=4 quarters = 1 year) within each symbol
+    base_columns = list(GROWTH_COLUMNS.values())
+    previous = df[base_columns].groupby(codes[order]).shift(4)
+    growth = df[base_columns] / previous - 1
+    for column, base_column in GROWTH_COLUMNS.items():
+        df[column] = growth[base_column]
+
+    result_df = df[PERFORMANCE_COLUMNS]
+    return result_df if raw else finalize_frame(result_df, fill_value=0)
+
 
-    def __init__(self, api_key: str|None, timeout: int = 10, debug: bool = False):
-        super().__init__(api_key, timeout)
+class Financials(_BaseClient):
+    """Client for FMP Company Fundamentals API endpoints.
+
+    Args:
+        statement_store (StatementStore | None, optional): Local store backing
+            ``get_merged_financials(..., incremental=True)``.
+        compact (CompactDtypes | None, optional): Dtype policy applied to the statement
+            (``get_financials``, ``get_merged_financials``) and performance results.
+        symbol_rules (dict[str, str] | None, optional): Per-symbol data quality rules,
+            ``'drop_first'`` or ``'exclude'``. Defaults to a copy of ``quality.SYMBOL_RULES``.
+    """
+
+    # Fewest reports requested when refreshing a stored statement: the newest
+    # quarter plus the one before it, in case it was amended
+    STATEMENT_REFRESH_LIMIT = 2
+
+    # Approximate days per reporting period, to estimate how many reports a
+    # stored statement is missing
+    PERIOD_DAYS = {"quarter": 91, "annual": 365}
+
+    # Largest accepted number of days between consecutive reports
+    MAX_REPORT_GAP_DAYS = MAX_REPORT_GAP_DAYS
+
+    def __init__(self, api_key: str|None, timeout: int = 10, debug: bool = False,
+                 transport: Transport | None = None, stocks: Stocks | None = None,
+                 statement_store: StatementStore | None = None, compact: CompactDtypes | None = None,
+                 symbol_rules: dict[str, str] | None = None):
+        super().__init__(api_key, timeout, transport)
         self.debug = debug
+        self._stocks = stocks
+        self.statement_store = statement_store
+        self.compact = compact
+        self.symbol_rules = dict(SYMBOL_RULES) if symbol_rules is None else symbol_rules
         if debug and not logger.handlers:
             logger.setLevel(logging.DEBUG)
             handler = logging.StreamHandler()
@@ -19,6 +146,18 @@ class Financials(_BaseClient):
             handler.setFormatter(formatter)
             logger.addHandler(handler)
 
+    def _memo_state(self) -> tuple:
+        """Client state in the frame cache key, including the quality rules that filter merges."""
+        return (*super()._memo_state(), tuple(sorted(self.symbol_rules.items())), self.MAX_REPORT_GAP_DAYS)
+
+    @property
+    def stocks(self) -> Stocks:
+        """Stocks client used for price data, sharing this client's transport."""
+        if self._stocks is None:
+            self._stocks = Stocks(self.api_key, self.timeout, transport=self.transport, compact=self.compact)
+        return self._stocks
+
+    @memoize_frame
     def get_financials(
         self,
         symbol: str,
@@ -43,22 +182,40 @@ class Financials(_BaseClient):
         Raises:
             ValueError: If statement parameter is invalid
         """
-        endpoint_map = {
-            "income": "income-statement",
-            "balance": "balance-sheet-statement", 
-            "cash": "cash-flow-statement"
-        }
+        return self._compact_frame(self._fetch_statement(symbol, statement, limit, period, **query_params))
+
+    @memoize_frame
+    def _fetch_statement(self, symbol: str, statement: str, limit: int = 10, period: str = 'quarter', **query_params) -> pd.DataFrame:
+        """Download one statement with default dtypes, as merged internally.
+
+        Memoized on its own, so merges of the same statements with different
+        ``columns`` (e.g. ``get_stock_performance`` then ``get_merged_financials``)
+        share one download.
+        """
+        return self._download_statement(symbol, statement, limit, period, **query_params)
+
+    def _download_statement(self, symbol: str, statement: str, limit: int = 10, period: str = 'quarter',
+                            **query_params) -> pd.DataFrame:
+        """Request and parse one statement, bypassing the frame cache."""
+        endpoint, params = self._statement_request(symbol, statement, limit, period, **query_params)
+        data = self._make_request(endpoint, params)
+        
+        with self._timed("get_financials"):
+            df = self._process_response(data)
+            return self._ensure_dataframe(df)
 
-        if statement not in endpoint_map:
+    @staticmethod
+    def _statement_request(symbol: str, statement: str, limit: int, period: str, **query_params) -> tuple[str, dict]:
+        """Build the endpoint and query params for a financial statement request."""
+        if statement not in STATEMENT_ENDPOINTS:
             raise ValueError(f"Invalid statement type: {statement}")
 
         params = {"limit": limit, "period": period, **query_params}
-        data = self._make_request(f"{endpoint_map[statement]}/{symbol}", params)
-        
-        df = self._process_response(data)
-        return self._ensure_dataframe(df)
+        return f"{STATEMENT_ENDPOINTS[statement]}/{symbol}", params
 
-    def get_merged_financials(self, symbol: str, limit: int = 40, period: str = 'quarter') -> pd.DataFrame | None:
+    @memoize_frame
+    def get_merged_financials(self, symbol: str, limit: int = 40, period: str = 'quarter', incremental: bool = False,
+                              columns: Iterable[str] | None = None, raw: bool = False) -> pd.DataFrame | None:
         """
         Merge cash flow, income statement, and balance sheet financial statements.
 
@@ -66,77 +223,211 @@ class Financials(_BaseClient):
             symbol: Stock ticker symbol
             limit: Number of records to return
             period: Reporting period ('annual' or 'quarter')
+            incremental: Serve the statements from ``statement_store``, only requesting
+                the reports filed since the newest stored one once ``limit`` rows are stored
+            columns: Statement fields to keep, e.g. ``['revenue', 'freeCashFlow']``. Each is
+                taken from the first statement reporting it (income, balance, cash), so
+                no ``_x``/``_y`` duplicates are created. The merge keys are always kept, so
+                asking for one (e.g. ``fillingDate``) is a no-op. A single name may be passed as a string.
+                Defaults to every field of the three statements.
+            raw: Keep missing values instead of filling numeric columns with 0
 
         Returns:
             Optional[pd.DataFrame]: Merged financial statements DataFrame, None if data is invalid
 
         Note:
             - Uses inner join to ensure complete data across all three statements
-            - Handles special stock data anomalies
-            - Checks data continuity and completeness
+            - Handles special stock data anomalies with ``symbol_rules``
+            - Checks data continuity and completeness, see ``quality_report`` for the reasons
         """
-        # Get three financial statements
-        income = self.get_financials(symbol, statement="income", period=period, limit=limit)
-        balance = self.get_financials(symbol, statement="balance", period=period, limit=limit)
-        cash = self.get_financials(symbol, statement="cash", period=period, limit=limit)
+        # Get three financial statements concurrently over the shared session
+        income, balance, cash = self._fetch_statements(symbol, ("income", "balance", "cash"), limit, period, incremental)
+
+        with self._timed("get_merged_financials"):
+            return self._compact_frame(self._merge_statements(
+                symbol, income, balance, cash, self.symbol_rules, self.MAX_REPORT_GAP_DAYS, columns, raw
+            ))
+
+    def _fetch_statements(self, symbol: str, statements: tuple[str, ...], limit: int, period: str,
+                          incremental: bool = False) -> list[pd.DataFrame]:
+        """Fetch several statements for one symbol in parallel, preserving order."""
+        fetch = self._statement_incremental if incremental else self._fetch_statement
+        with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            futures = [
+                executor.submit(fetch, symbol, statement=statement, period=period, limit=limit)
+                for statement in statements
+            ]
+            return [future.result() for future in futures]
+
+    def _statement_incremental(self, symbol: str, statement: str, limit: int, period: str) -> pd.DataFrame:
+        """Refresh one stored statement with the latest reports and return its newest ``limit`` rows.
+
+        Only the reports filed since the newest stored one (plus that one, in
+        case it was amended) are requested. Until ``limit`` rows are stored
+        (first use, or a longer history being requested), or when the refresh
+        does not reach back to the stored rows, the full ``limit`` is
+        downloaded instead so no report is left missing. The refresh always
+        goes to the API: the store, not the frame cache, holds the statement.
+        """
+        if self.statement_store is None:
+            raise ValueError("incremental=True requires a statement_store.")
+
+        stored = self.statement_store.load(symbol, statement, period)
+        fetch_limit = limit if len(stored) < limit else self._refresh_limit(stored, limit, period)
+        new_rows = self._download_statement(symbol, statement, limit=fetch_limit, period=period)
+        if (fetch_limit < limit and not new_rows.empty and 'date' in new_rows.columns
+                and pd.to_datetime(new_rows['date']).min() > pd.to_datetime(stored['date']).max()):
+            logger.debug(f"{symbol} {statement} refresh left a gap in the store, downloading {limit} reports")
+            new_rows = self._download_statement(symbol, statement, limit=limit, period=period)
+        df = self.statement_store.upsert(symbol, statement, period, new_rows)
+        return df.head(limit).reset_index(drop=True)
+
+    def _refresh_limit(self, stored: pd.DataFrame, limit: int, period: str) -> int:
+        """Reports to request for a stored statement: the periods elapsed since its newest report, plus that one."""
+        newest = pd.to_datetime(stored['date']).max()
+        elapsed = (date.today() - newest.date()).days // self.PERIOD_DAYS.get(period, self.PERIOD_DAYS["quarter"])
+        return min(limit, max(self.STATEMENT_REFRESH_LIMIT, elapsed + 1))
+
+    @classmethod
+    def _merge_statements(cls, symbol: str, income: pd.DataFrame, balance: pd.DataFrame, cash: pd.DataFrame,
+                          rules: dict[str, str] | None = None, max_gap_days: int = MAX_REPORT_GAP_DAYS,
+                          columns: Iterable[str] | None = None, raw: bool = False) -> pd.DataFrame | None:
+        """Merge the three statement frames and validate reporting continuity."""
+        merged_df = cls._join_statements(income, balance, cash, columns)
+        if merged_df is None:
+            logger.warning(f"{symbol}'s financial statement data is incomplete")
+            return None
+
+        # Symbol rules are keyed on the requested symbol, as in ``_fetch_merged_panel``
+        merged_df, report = validate_statements(merged_df.assign(symbol=symbol), rules, max_gap_days)
+        if not report.ok:
+            reason = next(iter(report.excluded.values()))
+            logger.warning(f"{symbol} excluded from merged financials: {reason}")
+            return None
+
+        # Final cleanup
+        return merged_df if raw else finalize_frame(merged_df, decimals=None, fill_value=0)
+
+    @classmethod
+    def _join_statements(cls, income: pd.DataFrame, balance: pd.DataFrame, cash: pd.DataFrame,
+                         columns: Iterable[str] | None = None) -> pd.DataFrame | None:
+        """Inner join the three statement frames of one symbol, None if one is empty.
 
+        With ``columns``, each statement is first cut down to the merge keys and
+        the requested fields it is the first to report.
+        """
         # Check data completeness
         if income.empty or balance.empty or cash.empty:
-            logger.warning(f"{symbol}'s financial statement data is incomplete")
             return None
 
-        # Define merge keys
-        on_list = [
-            "cik", "fillingDate", "date", "symbol", 
-            "period", "calendarYear", "reportedCurrency"
-        ]
+        if columns is not None:
+            income, balance, cash = cls._project_statements((income, balance, cash), columns)
 
         # Merge financial statements
         merged_df = pd.merge(
-            pd.merge(income, balance, how="inner", on=on_list),
-            cash, how="inner", on=on_list
+            pd.merge(income, balance, how="inner", on=MERGE_KEYS),
+            cash, how="inner", on=MERGE_KEYS
         )
 
-        # Data cleaning and transformation
-        merged_df = (
+        return (
             merged_df.rename(columns={
                 "date": "period_date",
                 "fillingDate": "date",
-                "netIncome_x": "netIncome"
+                "netIncome_x": "netIncome",
+                # Only the income statement's acceptance time is kept when projecting
+                **({"acceptedDate": "acceptedDate_x"} if columns is not None else {})
             })
-            .sort_values(by=["date", "acceptedDate_x"], ignore_index=True)
-            .drop_duplicates(subset=["date"], keep="first", ignore_index=True)
             .assign(period_date=lambda x: pd.to_datetime(x["period_date"]))
         )
 
-        # Handle special stocks
-        special_symbols = [
-            "ADT", "ALTR", "ARNC", "BEAM", "CEG", "CSC", "CTLT", "FTV", 
-            "HLT", "HPE", "LDOS", "LW", "MMI", "MRNA", "OTIS", "PLL", 
-            "S", "TWTR", "VNT"
-        ]
-        
-        if symbol in special_symbols:
-            merged_df = merged_df.drop([0]).reset_index(drop=True)
+    @staticmethod
+    def _project_statements(statements: tuple[pd.DataFrame, ...], columns: Iterable[str]) -> list[pd.DataFrame]:
+        """Keep the merge keys and the requested fields, each from the first statement reporting it."""
+        if isinstance(columns, str):
+            columns = [columns]
+        # The keys are always kept, under either their statement or their merged name
+        keys_kept = {*MERGED_KEY_COLUMNS, *MERGE_KEYS, "acceptedDate"}
+        remaining = [column for column in dict.fromkeys(columns) if column not in keys_kept]
+        projected = []
+        for i, df in enumerate(statements):
+            # The income statement carries the acceptance time used to order filings
+            keys = MERGE_KEYS + ["acceptedDate"] if i == 0 and "acceptedDate" in df.columns else MERGE_KEYS
+            fields = [column for column in remaining if column in df.columns]
+            remaining = [column for column in remaining if column not in fields]
+            projected.append(df[keys + fields])
+
+        if remaining:
+            raise ValueError(f"Unknown statement columns: {remaining}")
+        return projected
+
+    def _fetch_merged_panel(self, symbols: list[str], limit: int, period: str, max_workers: int,
+                            incremental: bool = False, columns: Iterable[str] | None = None
+                            ) -> tuple[pd.DataFrame, QualityReport, dict[str, str]]:
+        """Fetch and join the statements of many symbols, then validate them as one panel.
+
+        ``columns`` projects each symbol's statements before the join, see
+        ``get_merged_financials``.
+
+        Returns the validated long frame (not yet filled), its quality report
+        and the per-symbol errors raised while fetching.
+        """
+        joined: dict[str, pd.DataFrame] = {}
+        errors: dict[str, str] = {}
+
+        def fetch(symbol: str) -> pd.DataFrame | None:
+            statements = self._fetch_statements(symbol, ("income", "balance", "cash"), limit, period, incremental)
+            return self._join_statements(*statements, columns)
+
+        # Each worker requests the three statements at once
+        with ThreadPoolExecutor(max_workers=self._pool_workers(max_workers, 3)) as executor:
+            futures = {executor.submit(fetch, symbol): symbol for symbol in symbols}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to get financial statements for {symbol}: {e}")
+                    errors[symbol] = f"{type(e).__name__}: {e}"
+                    continue
+                if df is not None and not df.empty:
+                    joined[symbol] = df.assign(symbol=symbol)
+
+        frames = [joined[symbol] for symbol in symbols if symbol in joined]
+        with self._timed("validate_statements"):
+            return (*validate_statements(
+                pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(),
+                self.symbol_rules, self.MAX_REPORT_GAP_DAYS,
+                symbols=[symbol for symbol in symbols if symbol not in errors],
+            ), errors)
+
+    def quality_report(self, symbols: list[str], limit: int = 40, period: str = 'quarter',
+                       max_workers: int = 8, incremental: bool = False) -> QualityReport:
+        """
+        Check the statements of many symbols for gaps, duplicates and restatements.
 
-        # Check data continuity
-        merged_df["verify"] = merged_df["period_date"].diff()
-        if symbol == "CSC":
-            return None
+        Applies the same checks and ``symbol_rules`` as ``get_merged_financials``,
+        vectorized over the whole universe, and reports every issue instead of
+        returning None for the symbols that fail.
 
-        # Validate reporting period
-        for days in merged_df["verify"].tolist()[1:]:
-            if days.days > 150:  # Normal interval is about 91 days
-                logger.warning(f"{symbol} abnormal reporting period, incomplete data")
-                return None
+        Args:
+            symbols (list[str]): Stock ticker symbols
+            limit (int): Number of reports to check per symbol
+            period (str): Reporting period, 'annual' or 'quarter'
+            max_workers (int): Number of symbols fetched concurrently, at most a third of
+                the transport's ``pool_maxsize``
+            incremental (bool): Serve the statements from ``statement_store``
 
-        # Final cleanup
-        return (
-            merged_df.drop(columns=["verify"])
-            .fillna(value=0)
-        )
+        Returns:
+            QualityReport: Issues per symbol, with the excluded symbols in ``excluded``.
+            Symbols that could not be fetched are reported as ``incomplete``.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        # The checks only need the merge keys
+        _, report, errors = self._fetch_merged_panel(symbols, limit, period, max_workers, incremental, columns=())
+        return report.with_errors(errors) if errors else report
 
-    def get_stock_performance(self, symbol: str, limit: int = 12, period: str = 'quarter') -> pd.DataFrame | None:
+    def get_stock_performance(self, symbol: str, limit: int = 12, period: str = 'quarter', incremental: bool = False,
+                              raw: bool = False) -> pd.DataFrame | None:
         """
         Get comprehensive stock performance metrics using actual available financial data columns.
         
@@ -144,60 +435,80 @@ class Financials(_BaseClient):
             symbol (str): Stock ticker symbol
             limit (int): Number of quarters to return, default 8 quarters
             period (str): Reporting period, 'annual' or 'quarter'
+            incremental (bool): Serve the statements from ``statement_store``, see ``get_merged_financials``
+            raw (bool): Return full-precision metrics, with missing values (e.g. growth rates
+                of the first four quarters) kept as NaN instead of 0
             
         Returns:
             Optional[pd.DataFrame]: DataFrame containing comprehensive performance metrics, returns None if data invalid
         """
         # Get merged financial statements
-        merged_df = self.get_merged_financials(symbol, limit=limit, period=period)
+        merged_df = self.get_merged_financials(symbol, limit=limit, period=period, incremental=incremental,
+                                               columns=PERFORMANCE_INPUT_COLUMNS, raw=raw)
+        with self._timed("get_stock_performance"):
+            return self._compact_frame(self._compute_performance(merged_df, raw))
+
+    @classmethod
+    def _compute_performance(cls, merged_df: pd.DataFrame | None, raw: bool = False) -> pd.DataFrame | None:
+        """Derive quality and growth metrics from a merged statements frame."""
         if merged_df is None or merged_df.empty:
             return None
-            
-        # Based on actual available columns from AAPL.csv
-        performance_df = merged_df[[
-            'period_date', 'date', 'symbol', 'calendarYear', 'period',
-            'revenue', 'grossProfitRatio', 'epsdiluted', 'operatingIncomeRatio', 
-            'operatingIncome', 'freeCashFlow', 'totalDebt', 'totalAssets'
-        ]].copy()
-        
-        # Calculate quality metrics
-        performance_df['freeCashFlowMargin'] = performance_df['freeCashFlow'] / performance_df['revenue']
-        performance_df['debtToAssetRatio'] = performance_df['totalDebt'] / performance_df['totalAssets']
-        
-        # Calculate year-over-year growth rates (annual YoY comparison)
-        performance_df['period_date'] = pd.to_datetime(performance_df['period_date'])
-        performance_df['year'] = performance_df['period_date'].dt.year
-        performance_df['quarter'] = performance_df['period_date'].dt.quarter
-        
-        # Sort by date to ensure chronological order for YoY calculation
-        performance_df = performance_df.sort_values('period_date')
-        
-        # Calculate year-over-year growth rates (annual YoY - periods=4 quarters = 1 year)
-        performance_df['revenue_growth_rate'] = performance_df['revenue'].pct_change(periods=4)
-        performance_df['operatingIncome_growth_rate'] = performance_df['operatingIncome'].pct_change(periods=4)
-        performance_df['eps_diluted_growth_rate'] = performance_df['epsdiluted'].pct_change(periods=4)
-        
-        # Sort by date (oldest first)
-        # performance_df = performance_df.sort_values('period_date', ascending=True)
-        
-        # Select final required columns
-        result_df = performance_df[[
-            'period_date', 'date', 'symbol', 'calendarYear', 'period',
-            # Quality metrics
-            'grossProfitRatio',
-            'operatingIncomeRatio',
-            'freeCashFlowMargin',
-            'debtToAssetRatio',
-            # Growth metrics
-            'revenue', 'revenue_growth_rate',
-            'operatingIncome', 'operatingIncome_growth_rate',
-            # Valuation metrics
-            'epsdiluted', 'eps_diluted_growth_rate'
-        ]].copy()
-        
-        # Data cleaning
-        return result_df.fillna(value=0).round(2)
+        return compute_performance_panel(merged_df, raw)
+
+    def get_stock_performance_many(
+        self,
+        symbols: list[str],
+        limit: int = 12,
+        period: str = 'quarter',
+        max_workers: int = 8,
+        incremental: bool = False,
+        raw: bool = False
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Get performance metrics for many symbols in parallel.
+
+        Each symbol's statements are fetched on a worker thread, then the whole
+        panel is validated (see ``quality_report``) and its metrics computed at once
+        with ``compute_performance_panel``. Failures are collected per symbol
+        instead of aborting the whole batch.
+
+        Args:
+            symbols (list[str]): Stock ticker symbols
+            limit (int): Number of quarters to return per symbol
+            period (str): Reporting period, 'annual' or 'quarter'
+            max_workers (int): Number of symbols processed concurrently. Each worker
+                issues three statement requests at once, so at most a third of the
+                transport's ``pool_maxsize`` workers are used.
+            incremental (bool): Serve the statements from ``statement_store``, so a
+                universe refresh only downloads the newest reports
+            raw (bool): Return full-precision metrics with missing values kept, see
+                ``get_stock_performance``
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: Long-format performance metrics for all
+            successful symbols (with a ``symbol`` column, in input order), and an error
+            report with ``symbol`` and ``error`` columns for the ones that failed.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        merged_df, report, errors = self._fetch_merged_panel(
+            symbols, limit, period, max_workers, incremental, columns=PERFORMANCE_INPUT_COLUMNS
+        )
+        errors.update(report.excluded)
+
+        with self._timed("get_stock_performance_many"):
+            if not raw:
+                merged_df = finalize_frame(merged_df, decimals=None, fill_value=0)
+            performance_df = (
+                self._compact_frame(compute_performance_panel(merged_df, raw).reset_index(drop=True))
+                if not merged_df.empty else pd.DataFrame()
+            )
+        error_df = pd.DataFrame(
+            [{"symbol": symbol, "error": errors[symbol]} for symbol in symbols if symbol in errors],
+            columns=["symbol", "error"]
+        )
+        return performance_df, error_df
 
+    @memoize_frame
     def get_earnings_his(self, symbol: str, period: int = 3) -> pd.DataFrame:
         """
         Fetch historical earnings calendar for a given symbol.
@@ -213,7 +524,13 @@ class Financials(_BaseClient):
         params = {"limit": period * 4 + 4}  # Typically 4 empty records max
         
         data = self._make_request(endpoint, params)
-        df = self._ensure_dataframe(self._process_response(data))
+        with self._timed("get_earnings_his"):
+            return self._process_earnings(data)
+
+    @classmethod
+    def _process_earnings(cls, data) -> pd.DataFrame:
+        """Convert an earnings calendar payload to a date-adjusted DataFrame."""
+        df = cls._ensure_dataframe(cls._process_response(data))
         
         if df.empty:
             return df
@@ -228,13 +545,13 @@ class Financials(_BaseClient):
                   .drop(columns=['date'])
                   .rename(columns={'date_adj': 'date'})
                   .assign(is_fiscal=True)
-                  .pipe(self._standardize_date_format)
+                  .pipe(cls._standardize_date_format)
                   .sort_values('date', ascending=False)
                   .reset_index(drop=True))
         
         return df
 
-    def merge_eps_his(self, symbol: str, period: int = 3, enable_logging: bool = True) -> pd.DataFrame:
+    def merge_eps_his(self, symbol: str, period: int = 3, enable_logging: bool = True, raw: bool = False) -> pd.DataFrame:
         """
         Generate PE and historical time series data.
         Note: If used after earnings release, need to wait for market open data, otherwise no close, latest epsttm will be deleted
@@ -243,67 +560,168 @@ class Financials(_BaseClient):
             symbol (str): Stock ticker symbol
             period (int): Number of years to retrieve historical data
             enable_logging (bool): Whether to enable logging, defaults to True
+            raw (bool): Use full-precision prices and return unrounded values. PE is always
+                computed before rounding, defaults to False
             
         Returns:
             pd.DataFrame: DataFrame containing PE calculation results
         """
-        # 获取历史盈利数据
-        eps_df = self.get_earnings_his(symbol, period)
+        eps_df, his_df = self._fetch_eps_prices(symbol, period, raw)
+        with self._timed("merge_eps_his"):
+            return self._pe_history(eps_df, his_df, enable_logging, raw)
+
+    def earnings_event_study(self, symbol: str, period: int = 3, enable_logging: bool = False) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Get PE history and post-earnings close changes from a single download.
+
+        Prices and the earnings calendar are fetched once (concurrently) and
+        shared by both results, instead of calling ``merge_eps_his`` and
+        ``get_fiscal_close_chg`` separately.
+
+        Args:
+            symbol (str): Stock ticker symbol
+            period (int): Number of years to retrieve historical data
+            enable_logging (bool): Whether to enable logging, defaults to False
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The ``merge_eps_his`` PE series and the
+            ``get_fiscal_close_chg`` table
+        """
+        eps_df, his_df = self._fetch_eps_prices(symbol, period)
+        with self._timed("earnings_event_study"):
+            return (
+                self._pe_history(eps_df, his_df, enable_logging),
+                self._fiscal_close_chg(eps_df, his_df, enable_logging),
+            )
+
+    def merge_eps_his_many(self, symbols: list[str], period: int = 3, max_workers: int = 8,
+                           raw: bool = False) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Generate PE and historical time series data for many symbols.
+
+        Earnings and prices are fetched and aligned per symbol on a worker pool,
+        then PE is computed for the whole panel in one vectorized pass. Failures
+        are collected per symbol instead of aborting the whole batch.
+
+        Args:
+            symbols (list[str]): Stock ticker symbols
+            period (int): Number of years to retrieve historical data
+            max_workers (int): Number of symbols fetched concurrently, at most half the
+                transport's ``pool_maxsize`` as each fetches earnings and prices at once
+            raw (bool): Use full-precision prices and return unrounded values
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]:
+                - Long-format PE data with a ``symbol`` column; symbols that fail or
+                  lack earnings or price data are left out
+                - Errors with ``symbol`` and ``error`` columns
+        """
+        symbols = list(dict.fromkeys(symbols))
+        errors: dict[str, str] = {}
+
+        def align(symbol: str) -> pd.DataFrame:
+            try:
+                return self._align_eps_prices(*self._fetch_eps_prices(symbol, period, raw), False)
+            except Exception as e:
+                logger.warning(f"Failed to get PE data for {symbol}: {e}")
+                errors[symbol] = f"{type(e).__name__}: {e}"
+                return pd.DataFrame()
+
+        with ThreadPoolExecutor(max_workers=self._pool_workers(max_workers, 2)) as executor:
+            aligned = list(executor.map(align, symbols))
+
+        error_df = pd.DataFrame(
+            [{"symbol": symbol, "error": errors[symbol]} for symbol in symbols if symbol in errors],
+            columns=["symbol", "error"]
+        )
+        frames = [df.assign(symbol=symbol) for symbol, df in zip(symbols, aligned) if not df.empty]
+        if not frames:
+            return pd.DataFrame(), error_df
+        panel = pd.concat(frames, ignore_index=True)
+        panel['pe'] = self._compute_pe(panel['close'], panel['eps_ttm'])
+        panel = self._select_pe_columns(panel, ['symbol']).reset_index(drop=True)
+        return (panel if raw else finalize_frame(panel)), error_df
+
+    @staticmethod
+    def _compute_pe(close: pd.Series, eps_ttm: pd.Series) -> np.ndarray:
+        """Vectorized PE: close / eps_ttm where eps_ttm > 0, else 0."""
+        close = close.to_numpy(dtype='float64', na_value=np.nan)
+        eps_ttm = eps_ttm.to_numpy(dtype='float64', na_value=np.nan)
+        positive = eps_ttm > 0
+        return np.divide(close, eps_ttm, out=np.zeros_like(close), where=positive)
+
+    @staticmethod
+    def _select_pe_columns(merged_df: pd.DataFrame, keys: list[str] | None = None) -> pd.DataFrame:
+        """Select the PE output columns and drop rows without a close price."""
+        return merged_df[
+            (keys or []) + ['date', 'eps_ttm', 'pe', 'close', 'eps', 'forward']
+        ].dropna(subset=['close'])
+
+    def _fetch_eps_prices(self, symbol: str, period: int, raw: bool = False) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Fetch the earnings calendar and daily closes concurrently, both sorted by date.
+
+        Either frame is empty (with a warning) when its data is missing.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            eps_future = executor.submit(self.get_earnings_his, symbol, period)
+            his_future = executor.submit(self.stocks.historical_price_full, symbol, period=period, raw=raw)
+            eps_df, his_df = eps_future.result(), self._ensure_dataframe(his_future.result())
+
         if eps_df.empty:
             logger.warning(f"No earnings data found for {symbol}")
+        else:
+            eps_df = eps_df.sort_values(by='date', ascending=True, ignore_index=True)
+
+        if his_df.empty or 'date' not in his_df.columns or 'close' not in his_df.columns:
+            logger.warning(f"No valid price data found for {symbol}")
+            his_df = pd.DataFrame()
+        else:
+            his_df = his_df[['date', 'close']].sort_values('date', ignore_index=True)
+
+        return eps_df, his_df
+
+    @classmethod
+    def _pe_history(cls, eps_df: pd.DataFrame, his_df: pd.DataFrame, enable_logging: bool, raw: bool = False) -> pd.DataFrame:
+        """PE series from pre-fetched earnings and prices, rounded after computing PE unless ``raw``."""
+        merged_df = cls._align_eps_prices(eps_df, his_df, enable_logging)
+        if merged_df.empty:
+            return merged_df
+
+        merged_df['pe'] = cls._compute_pe(merged_df['close'], merged_df['eps_ttm'])
+        merged_df = cls._select_pe_columns(merged_df)
+        return merged_df if raw else finalize_frame(merged_df)
+
+    @staticmethod
+    def _align_eps_prices(eps_df: pd.DataFrame, his_df: pd.DataFrame, enable_logging: bool) -> pd.DataFrame:
+        """Align full-precision TTM EPS with daily closes; empty if either input is empty."""
+        if eps_df.empty or his_df.empty:
             return pd.DataFrame()
-            
-        eps_df = eps_df.sort_values(by='date', ascending=True, ignore_index=True)
-        
+
         if enable_logging:
             logger.info(f"Earnings data shape: {eps_df.shape}")
             logger.info(f"Earnings columns: {list(eps_df.columns)}")
-        
+
         # 处理EPS数据
+        eps_df = eps_df.copy()
         eps_df['forward'] = eps_df.get('eps', pd.Series()).isnull()
         eps_df['eps'] = eps_df.get('eps', pd.Series()).fillna(eps_df.get('epsEstimated', pd.Series()))
         eps_df['eps_ttm'] = eps_df['eps'].rolling(4).sum()
 
-        # 获取历史价格数据
-        stocks_client = Stocks(self.api_key, self.timeout)
-        his_df = stocks_client.historical_price_full(symbol, period=period)
-        his_df = self._ensure_dataframe(his_df)
-        
-        if his_df.empty or 'date' not in his_df.columns or 'close' not in his_df.columns:
-            logger.warning(f"No valid price data found for {symbol}")
-            return pd.DataFrame()
-            
-        his_df = his_df[['date', 'close']].copy()
+        # Sorted as-of joins on datetime64 keys, one row per trading day:
+        # eps_ttm comes from the next report on or after the day (the last
+        # report once none is left), forward from the next report, eps only
+        # on report days.
+        ttm = eps_df.loc[eps_df['eps_ttm'].notna(), ['date', 'eps_ttm']]
+        merged_df = pd.merge_asof(his_df, ttm, on='date', direction='forward')
+        if not ttm.empty:
+            merged_df['eps_ttm'] = merged_df['eps_ttm'].fillna(ttm['eps_ttm'].iloc[-1])
+        merged_df = pd.merge_asof(merged_df, eps_df[['date', 'forward']], on='date', direction='forward')
+        merged_df = pd.merge_asof(merged_df, eps_df[['date', 'eps']], on='date', tolerance=pd.Timedelta(0))
 
-        # 确保日期格式一致
-        eps_df_temp = pd.DataFrame(eps_df)
-        eps_df = self._standardize_date_format(df=eps_df_temp)
-        his_df_temp = pd.DataFrame(his_df)
-        his_df = self._standardize_date_format(df=his_df_temp)
-        
-        # 合并数据
-        merged_df = pd.merge(eps_df, his_df, on='date', how='outer', sort=True)
-        
         if enable_logging:
             logger.info(f"Merged data shape: {merged_df.shape}")
-        
-        # 填充数据
-        merged_df['eps_ttm'] = merged_df['eps_ttm'].backfill().forward_fill()
-        merged_df['forward'] = merged_df['forward'].backfill()
-        merged_df = merged_df.round(2)
-        
-        # 计算市盈率(PE)
-        merged_df['pe'] = merged_df.apply(
-            lambda row: row['close'] / row['eps_ttm'] if row['eps_ttm'] > 0 else 0, 
-            axis=1
-        )
-        
-        # 选择需要的列并删除没有收盘价的行
-        selected = merged_df[
-            ['date', 'eps_ttm', 'pe', 'close', 'eps', 'forward']
-        ].dropna(subset=['close'])
-        
-        return selected
+
+        return merged_df
 
 
     def get_fiscal_close_chg(self, symbol: str, period: int = 3, enable_logging: bool = False) -> pd.DataFrame:
@@ -318,65 +736,38 @@ class Financials(_BaseClient):
         Returns:
             pd.DataFrame: 包含财报发布后收盘价变动的DataFrame
         """
-        # 获取历史价格数据
-        stocks_client = Stocks(self.api_key, self.timeout)
-        his_df = stocks_client.historical_price_full(symbol, period=period)
-        his_df = self._ensure_dataframe(his_df)
-        
-        if his_df.empty or 'date' not in his_df.columns or 'close' not in his_df.columns:
-            logger.warning(f"No valid price data found for {symbol}")
+        eps_df, his_df = self._fetch_eps_prices(symbol, period)
+        with self._timed("get_fiscal_close_chg"):
+            return self._fiscal_close_chg(eps_df, his_df, enable_logging)
+
+    @staticmethod
+    def _fiscal_close_chg(eps_df: pd.DataFrame, his_df: pd.DataFrame, enable_logging: bool) -> pd.DataFrame:
+        """Post-earnings close changes from pre-fetched earnings and prices."""
+        if eps_df.empty or his_df.empty:
             return pd.DataFrame()
-            
-        his_df = his_df[['date', 'close']].copy()
-
-        # 获取历史盈利数据
-        eps_df = self.get_earnings_his(symbol, period)
-        if eps_df.empty:
-            logger.warning(f"No earnings data found for {symbol}")
+        if 'is_fiscal' not in eps_df.columns:
+            logger.warning("is_fiscal column not found")
             return pd.DataFrame()
-            
-        eps_df = eps_df.sort_values(by='date', ascending=True, ignore_index=True)
-        
-        # 确保日期格式一致
-        eps_df = self._standardize_date_format(eps_df)
-        his_df = self._standardize_date_format(his_df)
-        
-        # 合并数据
-        merged_df = pd.merge(eps_df, his_df, on='date', how='outer', sort=True)
-        
-        if enable_logging:
-            logger.info(f"Merged data shape: {merged_df.shape}")
-            logger.info(f"Merged data:\n{merged_df.head()}")
-        
-        # 可能会有周五盘后发布财报的情况，比如clsk，使用前值填充
-        merged_df['close'] = merged_df['close'].forward_fill()
-        
-        if enable_logging:
-            logger.info(f"After ffill:\n{merged_df.head()}")
-        
+
         # 删除掉预估数据：删除date日期大于今天的行
-        merged_df['date'] = pd.to_datetime(merged_df['date'])
-        merged_df = merged_df[merged_df['date'] <= pd.Timestamp.now()]
-        
-        if enable_logging:
-            logger.info(f"After filtering future dates:\n{merged_df.head()}")
-        
+        eps_df = eps_df[eps_df['date'] <= pd.Timestamp.now()].reset_index(drop=True)
+
+        # Close on the report day; a report on a non-trading day (e.g. Friday
+        # after close, like CLSK) takes the last close before it
+        merged_df = pd.merge_asof(eps_df, his_df, on='date', direction='backward')
+        # Close of the last trading day strictly before the report
+        prev_close = pd.merge_asof(
+            eps_df[['date']], his_df.rename(columns={'close': 'prev_close'}),
+            on='date', direction='backward', allow_exact_matches=False
+        )['prev_close']
+
         # 计算is_fiscal=True时的close变动比率，考虑盘后发布财报的情况
-        merged_df['fiscal_chg'] = merged_df['close'].pct_change()
-        
-        if enable_logging:
-            logger.info(f"After calculating fiscal_chg:\n{merged_df.head()}")
-        
-        # 只保留 is_fiscal 为 True 且不为 NA 的行
-        if 'is_fiscal' in merged_df.columns:
-            merged_df = merged_df[merged_df['is_fiscal'].notna() & merged_df['is_fiscal']]
-        else:
-            logger.warning("is_fiscal column not found")
-            return pd.DataFrame()
-            
+        merged_df['fiscal_chg'] = merged_df['close'] / prev_close - 1
+
         if enable_logging:
+            logger.info(f"Merged data shape: {merged_df.shape}")
             logger.info(f"Final data:\n{merged_df}")
-        
+
         # 后续根据导出情况，可以简化列
         return merged_df
 
@@ -407,14 +798,8 @@ class Financials(_BaseClient):
         endpoint = f"revenue-{structure}-segmentation"
         params = {"symbol": symbol, "structure": "flat", "period": period, "limit": limit}
         
-        # Temporarily override base URL for v4 endpoint
-        original_base_url = self.BASE_URL
-        self.BASE_URL = "https://financialmodelingprep.com/api/v4/"
-        try:
-            data = self._make_request(endpoint, params)
-        finally:
-            # Restore original base URL
-            self.BASE_URL = original_base_url
+        # Pass the v4 base URL per request; mutating BASE_URL is not safe across threads
+        data = self._make_request(endpoint, params, base_url=self.BASE_URL_V4)
             
         # Ensure we respect the limit even if API returns more data
         if isinstance(data, list) and len(data) > limit:
@@ -0,0 +1,182 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from .cache import DEFAULT_TTLS
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Longest prefix first so 'historical-price-full' is not reported as 'historical'
+_ENDPOINT_PREFIXES = sorted(DEFAULT_TTLS, key=len, reverse=True)
+
+
+def endpoint_name(endpoint: str) -> str:
+    """Group an endpoint by class, dropping symbols: 'income-statement/AAPL' -> 'income-statement'."""
+    for prefix in _ENDPOINT_PREFIXES:
+        if endpoint == prefix or endpoint.startswith(prefix + "/"):
+            return prefix
+    return endpoint.split("/", 1)[0]
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with running count, sum, min and max.
+
+    Quantiles are estimated as the upper bound of the bucket they fall in,
+    so they are accurate to the bucket resolution.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimated ``q`` quantile (0-1), or 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _EndpointStats:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.status: dict[int, int] = {}
+        self.network = Histogram(buckets)
+        self.decode = Histogram(buckets)
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "bytes": self.bytes,
+            "status": dict(self.status),
+            "network": self.network.summary(),
+            "decode": self.decode.summary(),
+        }
+
+
+class Metrics:
+    """Thread-safe request and processing metrics shared through the transport.
+
+    Network requests are grouped per endpoint class (``endpoint_name``) with
+    request, error, retry, cache-hit and byte counters, status code counts and
+    histograms of network and JSON decode time. Pandas post-processing is
+    timed per client method as DataFrame build time.
+
+    Args:
+        buckets (tuple[float, ...], optional): Histogram bucket upper bounds in seconds.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self._stages: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, name: str) -> _EndpointStats:
+        stats = self._endpoints.get(name)
+        if stats is None:
+            stats = self._endpoints[name] = _EndpointStats(self.buckets)
+        return stats
+
+    def record_request(self, name: str, status: int, network: float, decode: float, size: int, retries: int = 0) -> None:
+        """Record a completed network request."""
+        with self._lock:
+            stats = self._endpoint(name)
+            stats.requests += 1
+            stats.retries += retries
+            stats.bytes += size
+            stats.status[status] = stats.status.get(status, 0) + 1
+            stats.network.observe(network)
+            stats.decode.observe(decode)
+
+    def record_error(self, name: str, network: float, status: int | None = None, retries: int = 0) -> None:
+        """Record a request that failed (HTTP error status, timeout or connection error)."""
+        with self._lock:
+            stats = self._endpoint(name)
+            stats.requests += 1
+            stats.errors += 1
+            stats.retries += retries
+            if status is not None:
+                stats.status[status] = stats.status.get(status, 0) + 1
+            stats.network.observe(network)
+
+    def record_cache_hit(self, name: str) -> None:
+        with self._lock:
+            self._endpoint(name).cache_hits += 1
+
+    def record_build(self, stage: str, seconds: float) -> None:
+        """Record DataFrame build time for a client method."""
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def time_build(self, stage: str):
+        """Context manager timing a DataFrame build stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_build(stage, time.perf_counter() - start)
+
+    def snapshot(self) -> dict:
+        """Cumulative stats: per-endpoint counters and histograms, build times and totals.
+
+        ``totals['requests']`` counts requests that reached the API, which is
+        what plan quotas are charged for; cache hits are reported separately.
+        """
+        with self._lock:
+            endpoints = {name: stats.snapshot() for name, stats in sorted(self._endpoints.items())}
+            stages = {name: {"build": histogram.summary()} for name, histogram in sorted(self._stages.items())}
+        totals = {
+            key: sum(stats[key] for stats in endpoints.values())
+            for key in ("requests", "errors", "retries", "cache_hits", "bytes")
+        }
+        totals["network_seconds"] = sum(stats["network"]["total"] for stats in endpoints.values())
+        totals["decode_seconds"] = sum(stats["decode"]["total"] for stats in endpoints.values())
+        totals["build_seconds"] = sum(stage["build"]["total"] for stage in stages.values())
+        return {"endpoints": endpoints, "stages": stages, "totals": totals}
+
+    def reset(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._endpoints.clear()
+            self._stages.clear()
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+
+# Symbol rule actions
+DROP_FIRST = "drop_first"  # The oldest report predates the current entity (spin-off, IPO) and breaks continuity
+EXCLUDE = "exclude"        # The statements are unusable
+
+# Known anomalies in FMP statement data, looked up by symbol
+SYMBOL_RULES: dict[str, str] = {
+    **{symbol: DROP_FIRST for symbol in (
+        "ADT", "ALTR", "ARNC", "BEAM", "CEG", "CTLT", "FTV", "HLT", "HPE",
+        "LDOS", "LW", "MMI", "MRNA", "OTIS", "PLL", "S", "TWTR", "VNT"
+    )},
+    "CSC": EXCLUDE,
+}
+
+# Normal interval between quarterly reports is about 91 days
+MAX_REPORT_GAP_DAYS = 150
+
+ISSUE_COLUMNS = ["symbol", "check", "period_date", "date", "detail"]
+
+
+class QualityReport:
+    """Data quality issues found in a panel of merged financial statements.
+
+    Each issue is one row of ``issues`` with the symbol, the check that raised
+    it, the report it concerns (``period_date`` and filing ``date``, when it
+    concerns a single report) and a description. Checks:
+
+    - ``incomplete``: a statement had no data.
+    - ``excluded``: the symbol is excluded by its symbol rule.
+    - ``gap``: more than ``max_gap_days`` between consecutive reports.
+    - ``duplicate``: a report filed twice on the same date; the later copy was dropped.
+    - ``restatement``: a period reported again in a later filing; both filings are kept.
+    - ``dropped``: a report dropped by the symbol's ``drop_first`` rule.
+
+    The first three are blocking: those symbols are removed from the cleaned frame.
+
+    Args:
+        issues (pd.DataFrame): Issue rows with the ``ISSUE_COLUMNS`` columns.
+    """
+
+    BLOCKING = ("incomplete", "excluded", "gap")
+
+    def __init__(self, issues: pd.DataFrame):
+        self.issues = issues.reset_index(drop=True)
+
+    @property
+    def excluded(self) -> dict[str, str]:
+        """Symbols removed by a blocking check, with the first reason found."""
+        blocking = self.issues[self.issues["check"].isin(self.BLOCKING)].drop_duplicates("symbol")
+        return dict(zip(blocking["symbol"], blocking["detail"]))
+
+    @property
+    def ok(self) -> bool:
+        """True when no symbol was excluded."""
+        return not self.issues["check"].isin(self.BLOCKING).any()
+
+    def summary(self) -> pd.DataFrame:
+        """Issue counts as a (symbol × check) table."""
+        return self.issues.pivot_table(index="symbol", columns="check", values="detail",
+                                       aggfunc="size", fill_value=0)
+
+    def with_errors(self, errors: dict[str, str]) -> "QualityReport":
+        """A copy with ``errors`` (symbol to reason, e.g. a failed download) added first as ``incomplete``."""
+        current = {column: self.issues[column].to_numpy() for column in ISSUE_COLUMNS}
+        return _report([_symbol_issues(errors, "incomplete", list(errors.values())), current])
+
+    def for_symbol(self, symbol: str) -> pd.DataFrame:
+        """Issues found for one symbol."""
+        return self.issues[self.issues["symbol"] == symbol].reset_index(drop=True)
+
+    def __repr__(self) -> str:
+        counts = self.issues["check"].value_counts().to_dict()
+        return f"QualityReport(issues={counts}, excluded={len(self.excluded)})"
+
+
+def _issues(df: pd.DataFrame, mask: pd.Series, check: str, detail) -> dict[str, np.ndarray] | None:
+    """Issue columns for the reports selected by ``mask``, None when there are none."""
+    if not mask.any():
+        return None
+    rows = df[mask]
+    return _issue_columns(rows["symbol"].to_numpy(), check, rows["period_date"].to_numpy(),
+                          rows["date"].to_numpy(), detail)
+
+
+def _symbol_issues(symbols, check: str, detail) -> dict[str, np.ndarray] | None:
+    """Issue columns that concern whole symbols rather than single reports."""
+    symbols = list(symbols)
+    if not symbols:
+        return None
+    return _issue_columns(np.array(symbols, dtype=object), check,
+                          np.full(len(symbols), np.datetime64("NaT", "ns")),
+                          np.full(len(symbols), None, dtype=object), detail)
+
+
+def _issue_columns(symbols: np.ndarray, check: str, period_dates: np.ndarray, dates: np.ndarray,
+                   detail) -> dict[str, np.ndarray]:
+    """Typed issue columns: dates as ``datetime64[ns]`` and strings as objects, so
+    issue sets concatenate without dtype upcasting."""
+    n = len(symbols)
+    return {
+        "symbol": symbols.astype(object),
+        "check": np.full(n, check, dtype=object),
+        "period_date": period_dates.astype("datetime64[ns]"),
+        "date": dates.astype(object),
+        "detail": np.full(n, detail, dtype=object) if isinstance(detail, str) else np.asarray(detail, dtype=object),
+    }
+
+
+def _report(issues: list[dict[str, np.ndarray] | None]) -> QualityReport:
+    """Concatenate issue columns into a report, column by column."""
+    issues = [issue for issue in issues if issue is not None]
+    empty = _issue_columns(np.array([], dtype=object), "", np.array([], dtype="datetime64[ns]"),
+                           np.array([], dtype=object), "")
+    return QualityReport(pd.DataFrame({
+        column: np.concatenate([empty[column], *(issue[column] for issue in issues)]) for column in ISSUE_COLUMNS
+    }))
+
+
+def validate_statements(
+    merged_df: pd.DataFrame,
+    rules: dict[str, str] | None = None,
+    max_gap_days: int = MAX_REPORT_GAP_DAYS,
+    symbols: list[str] | None = None,
+) -> tuple[pd.DataFrame, QualityReport]:
+    """
+    Check merged statements of one or many symbols and drop the unusable ones.
+
+    Every check runs vectorized over the whole panel. Rows are ordered by
+    symbol (in order of first appearance), filing ``date`` and acceptance time,
+    duplicate filings are dropped, symbol rules applied and reporting
+    continuity checked on ``period_date`` in filing order.
+
+    Args:
+        merged_df (pd.DataFrame): Joined statements with ``symbol``, ``period_date``
+            (the fiscal period end) and ``date`` (the filing date) columns.
+        rules (dict[str, str] | None): Symbol rules, ``DROP_FIRST`` or ``EXCLUDE`` per
+            symbol. Defaults to ``SYMBOL_RULES``.
+        max_gap_days (int): Largest accepted number of days between consecutive reports.
+        symbols (list[str] | None): Symbols expected in the panel; those without rows
+            are reported as ``incomplete``.
+
+    Returns:
+        tuple[pd.DataFrame, QualityReport]: The cleaned frame without excluded symbols,
+        with a fresh index, and the quality report.
+    """
+    rules = SYMBOL_RULES if rules is None else rules
+    issues = []
+
+    if symbols is not None:
+        present = set(merged_df["symbol"]) if "symbol" in merged_df.columns else set()
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in present]
+        issues.append(_symbol_issues(missing, "incomplete", "financial statement data is incomplete"))
+
+    if merged_df.empty:
+        return merged_df, _report(issues)
+
+    sort_keys = ["date", "acceptedDate_x"] if "acceptedDate_x" in merged_df.columns else ["date"]
+    df = (merged_df
+          .assign(_symbol_order=pd.factorize(merged_df["symbol"])[0])
+          .sort_values(["_symbol_order", *sort_keys], ignore_index=True))
+
+    # Duplicate filings: keep the first accepted copy
+    duplicated = df.duplicated(["_symbol_order", "date"])
+    if duplicated.any():
+        issues.append(_issues(df, duplicated, "duplicate", "duplicate filing dropped"))
+        df = df[~duplicated]
+
+    # Symbol rules, a dict lookup per row
+    rule = df["symbol"].map(rules)
+    excluded_symbols = df.loc[rule == EXCLUDE, "symbol"].unique()
+    issues.append(_symbol_issues(excluded_symbols, "excluded", "excluded by symbol rule"))
+    dropped = (rule == DROP_FIRST) & ~df.duplicated("_symbol_order")
+    issues.append(_issues(df, dropped, "dropped", "oldest report dropped by symbol rule"))
+    if len(excluded_symbols) or dropped.any():
+        df = df[(rule != EXCLUDE) & ~dropped]
+
+    # Restatements: the same period filed again later
+    restated = df.duplicated(["_symbol_order", "period_date"])
+    issues.append(_issues(df, restated, "restatement", "period restated in a later filing"))
+
+    # Reporting continuity
+    gap_days = df.groupby("_symbol_order")["period_date"].diff().dt.days
+    gaps = gap_days > max_gap_days
+    if gaps.any():
+        detail = gap_days[gaps].astype(int).astype(str) + " days since the previous report"
+        issues.append(_issues(df, gaps, "gap", detail.to_numpy()))
+
+    report = _report(issues)
+    if not report.ok:
+        df = df[~df["symbol"].isin(report.excluded)]
+    return df.drop(columns=["_symbol_order"]).reset_index(drop=True), report
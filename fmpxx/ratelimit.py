@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting requests to a calls-per-minute budget.
+
+    Tokens refill continuously at ``calls_per_minute / 60`` per second up to
+    ``burst``. Every client sharing a transport draws from the same bucket, so
+    parallel batch jobs stay under the plan limit together. Blocking and asyncio
+    clients can share one limiter.
+
+    Args:
+        calls_per_minute (float): Sustained request budget.
+        burst (int | None, optional): Bucket capacity. Defaults to one second's
+            worth of calls (at least 1).
+    """
+
+    def __init__(self, calls_per_minute: float, burst: int | None = None):
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive.")
+        self.calls_per_minute = calls_per_minute
+        self.rate = calls_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(self.rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while (wait := self._reserve()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait until a request may be sent without blocking the event loop."""
+        while (wait := self._reserve()) > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self) -> float:
+        """Take a token and return 0, or return the seconds to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if now >= self._resume_at and self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return max(self._resume_at - now, (1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds``, e.g. after the server answers 429."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class RetryPolicy:
+    """Retry schedule for rate-limited (429) and transient 5xx responses.
+
+    Delays grow exponentially with full jitter, capped at ``max_backoff``. A
+    ``Retry-After`` header from the server takes precedence.
+
+    Args:
+        max_retries (int, optional): Retries after the first attempt. Defaults to 3.
+        backoff_factor (float, optional): Base delay in seconds. Defaults to 0.5.
+        max_backoff (float, optional): Upper bound for a single delay. Defaults to 60.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 60.0):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """Whether a response with ``status_code`` on attempt ``attempt`` (0-based) is retried."""
+        return status_code in RETRY_STATUS_CODES and attempt < self.max_retries
+
+    def backoff(self, url: str, status_code: int, attempt: int, retry_after: str | None = None,
+                rate_limiter: "RateLimiter | None" = None) -> float | None:
+        """Decide what to do with a response, for the blocking and asyncio transports alike.
+
+        Returns None when the response is final, else the seconds to wait before
+        the next attempt. A 429 also pauses ``rate_limiter``, so every caller
+        sharing it backs off, not just this one.
+        """
+        if not self.should_retry(status_code, attempt):
+            return None
+        delay = self.delay(attempt, retry_after)
+        if status_code == 429 and rate_limiter is not None:
+            rate_limiter.pause(delay)
+        logger.debug(f"HTTP {status_code} from {url}, retrying in {delay:.2f}s")
+        return delay
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before the next attempt."""
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
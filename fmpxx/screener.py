@@ -0,0 +1,203 @@
+import logging
+import pandas as pd
+from .financials import Financials, compute_performance_panel
+
+logger = logging.getLogger(__name__)
+
+# Identifier and key columns of a performance panel, never ranked
+KEY_COLUMNS = ('period_date', 'date', 'symbol', 'calendarYear', 'period', 'quarter')
+
+# Suffix of the per-quarter percentile column kept for every metric
+PCT_SUFFIX = '_pct'
+
+
+class Screener:
+    """Cross-sectional screens over a panel of performance metrics.
+
+    The panel is the long frame returned by ``get_stock_performance_many`` or
+    ``compute_performance_panel``: one row per symbol and report with the
+    quality and growth metrics. Rows are grouped by the calendar quarter their
+    fiscal period ends in (``quarter``),
+    and every metric gets a ``<metric>_pct`` column holding its percentile rank
+    (0-1, higher value ranks higher) within that quarter. Both are computed
+    once, so filters, ranks and percentiles run as vectorized expressions over
+    the whole universe without fetching anything again.
+
+    Args:
+        panel (pd.DataFrame): Long-format performance metrics with ``symbol`` and
+            ``period_date`` columns.
+
+    Attributes:
+        panel (pd.DataFrame): The panel with ``quarter`` and percentile columns added.
+        metrics (list[str]): Numeric metric columns that can be ranked.
+        errors (pd.DataFrame): Per-symbol errors when built with ``from_symbols``.
+
+    Example:
+        >>> screener = Screener.from_symbols(client.financials, symbols)
+        >>> screener.top('revenue_growth_rate', 0.1, where='debtToAssetRatio < 0.4')
+    """
+
+    def __init__(self, panel: pd.DataFrame):
+        missing = {'symbol', 'period_date'} - set(panel.columns)
+        if missing:
+            raise ValueError(f"Panel is missing required columns: {sorted(missing)}")
+
+        panel = panel.assign(period_date=pd.to_datetime(panel['period_date']))
+        panel['quarter'] = panel['period_date'].dt.to_period('Q')
+        self.metrics = [
+            column for column in panel.select_dtypes(include='number').columns
+            if column not in KEY_COLUMNS and not column.endswith(PCT_SUFFIX)
+        ]
+        panel = panel.sort_values(['quarter', 'symbol'], ignore_index=True)
+        percentiles = panel.groupby('quarter', observed=True)[self.metrics].rank(pct=True)
+        self.panel = pd.concat([panel, percentiles.add_suffix(PCT_SUFFIX)], axis=1)
+        self.errors = pd.DataFrame(columns=['symbol', 'error'])
+
+    @classmethod
+    def from_symbols(cls, financials: Financials, symbols: list[str], limit: int = 12, period: str = 'quarter',
+                     max_workers: int = 8, incremental: bool = False) -> "Screener":
+        """Build a screener by fetching the performance metrics of ``symbols``.
+
+        Uses ``get_stock_performance_many``, so the transport's caches and an
+        ``incremental`` statement store apply to the download. The metrics are
+        kept raw: a growth rate a symbol has no history for (fewer than five
+        reports) stays NaN and is left out of ranks instead of counting as 0%.
+
+        Args:
+            financials (Financials): Client used to fetch the statements.
+            symbols (list[str]): Universe of stock ticker symbols.
+            limit (int): Number of reports per symbol.
+            period (str): Reporting period, 'annual' or 'quarter'.
+            max_workers (int): Number of symbols processed concurrently.
+            incremental (bool): Serve the statements from ``statement_store``.
+
+        Returns:
+            Screener: Screener over the symbols that succeeded; failures are in ``errors``.
+        """
+        panel, errors = financials.get_stock_performance_many(
+            symbols, limit=limit, period=period, max_workers=max_workers, incremental=incremental, raw=True
+        )
+        if panel.empty:
+            panel = pd.DataFrame(columns=['symbol', 'period_date'])
+        screener = cls(panel)
+        screener.errors = errors
+        return screener
+
+    @classmethod
+    def from_merged(cls, merged_long_df: pd.DataFrame) -> "Screener":
+        """Build a screener from stacked ``get_merged_financials`` frames of many symbols.
+
+        The metrics are computed in one pass with ``compute_performance_panel``
+        and kept raw, so missing values stay NaN and are not ranked. Build the
+        frames with ``raw=True`` so missing statement values are not filled with 0.
+        """
+        return cls(compute_performance_panel(merged_long_df, raw=True))
+
+    @property
+    def quarters(self) -> list[pd.Period]:
+        """Quarters present in the panel, oldest first."""
+        return list(self.panel['quarter'].unique())
+
+    def cross_section(self, quarter: str | pd.Period | None = 'latest') -> pd.DataFrame:
+        """Rows of one quarter.
+
+        Args:
+            quarter (str | pd.Period | None): A quarter such as ``'2024Q4'``, ``'latest'``
+                for the most recent quarter in the panel, or None for every quarter.
+                The latest quarter only holds the companies that already reported it.
+
+        Returns:
+            pd.DataFrame: The selected rows.
+        """
+        if quarter is None:
+            return self.panel
+        if self.panel.empty:
+            return self.panel.iloc[0:0]
+        if isinstance(quarter, str) and quarter == 'latest':
+            quarter = self.panel['quarter'].iloc[-1]
+        return self.panel[self.panel['quarter'] == pd.Period(quarter, freq='Q')]
+
+    def screen(self, expr: str, quarter: str | pd.Period | None = 'latest') -> pd.DataFrame:
+        """Filter a cross-section with a ``DataFrame.query`` expression.
+
+        Metrics and their ``<metric>_pct`` percentiles can both be used, e.g.
+        ``'revenue_growth_rate_pct >= 0.9 and debtToAssetRatio < 0.4'``.
+
+        Args:
+            expr (str): Boolean expression over the panel columns.
+            quarter (str | pd.Period | None): Quarter to screen, see ``cross_section``.
+
+        Returns:
+            pd.DataFrame: Matching rows.
+        """
+        return self.cross_section(quarter).query(expr)
+
+    def rank(self, metric: str, quarter: str | pd.Period | None = 'latest', ascending: bool = False,
+             where: str | None = None) -> pd.DataFrame:
+        """Rank symbols by ``metric`` within each quarter.
+
+        Args:
+            metric (str): Metric column to rank.
+            quarter (str | pd.Period | None): Quarter to rank, see ``cross_section``.
+            ascending (bool): Rank the lowest values first. Defaults to False.
+            where (str | None): Filter applied after ranking, so ranks stay relative
+                to the whole universe.
+
+        Returns:
+            pd.DataFrame: Rows sorted by quarter and rank, with a ``rank`` column
+            (1 is best). Symbols without a value for ``metric`` are dropped.
+        """
+        self._check_metric(metric)
+        df = self.cross_section(quarter)
+        df = df.assign(rank=df.groupby('quarter', observed=True)[metric].rank(ascending=ascending, method='min'))
+        df = df.dropna(subset=['rank'])
+        if where:
+            df = df.query(where)
+        return df.sort_values(['quarter', 'rank'], ignore_index=True)
+
+    def top(self, metric: str, fraction: float = 0.1, quarter: str | pd.Period | None = 'latest',
+            ascending: bool = False, where: str | None = None) -> pd.DataFrame:
+        """Symbols in the top ``fraction`` of ``metric`` within each quarter.
+
+        ``top('revenue_growth_rate', 0.1, where='debtToAssetRatio < 0.4')`` is the
+        top decile by revenue growth among the whole universe, then restricted to
+        companies with a debt-to-asset ratio below 0.4.
+
+        Args:
+            metric (str): Metric column to rank.
+            fraction (float): Share of the cross-section to keep, e.g. 0.1 for a decile.
+            quarter (str | pd.Period | None): Quarter to screen, see ``cross_section``.
+            ascending (bool): Keep the lowest values instead. Defaults to False.
+            where (str | None): Filter applied after selecting the top fraction.
+
+        Returns:
+            pd.DataFrame: Matching rows sorted by quarter and rank.
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError(f"fraction must be in (0, 1], got {fraction}")
+        ranked = self.rank(metric, quarter=quarter, ascending=ascending)
+        counts = ranked.groupby('quarter', observed=True)['rank'].transform('size')
+        ranked = ranked[ranked['rank'] <= fraction * counts]
+        if where:
+            ranked = ranked.query(where)
+        return ranked.reset_index(drop=True)
+
+    def percentile(self, metric: str, quarter: str | pd.Period | None = None) -> pd.DataFrame:
+        """Per-quarter percentile ranks of ``metric`` as a (quarter × symbol) table.
+
+        Args:
+            metric (str): Metric column.
+            quarter (str | pd.Period | None): Quarter to return, see ``cross_section``.
+                Defaults to every quarter.
+
+        Returns:
+            pd.DataFrame: Percentiles from 0 to 1, higher values ranking higher.
+        """
+        self._check_metric(metric)
+        return self.cross_section(quarter).pivot_table(
+            index='quarter', columns='symbol', values=metric + PCT_SUFFIX, observed=True
+        )
+
+    def _check_metric(self, metric: str) -> None:
+        if metric not in self.metrics:
+            raise ValueError(f"Unknown metric: {metric}. Available metrics: {self.metrics}")
@@ -1,14 +1,34 @@
 from .base import _BaseClient
+from .cache import memoize_frame
+from .store import PriceStore
+from .transport import Transport
+from .utils import CompactDtypes, finalize_frame
 import pandas as pd
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 class Stocks(_BaseClient):
-    """Client for FMP Stock API endpoints."""
+    """Client for FMP Stock API endpoints.
 
-    def __init__(self, api_key: str|None, timeout: int = 10):
-        super().__init__(api_key, timeout)
+    Args:
+        price_store (PriceStore | None, optional): Local store backing
+            ``historical_price_full(..., incremental=True)``.
+        compact (CompactDtypes | None, optional): Dtype policy applied to ``stock_list`` and
+            the ``iter_stock_list`` chunks.
+    """
 
-    def historical_price_full(self, symbol: str, series_type: str | None = None, start: str | None = None, end: str | None = None, period: int | None = None) -> pd.DataFrame:
+    # Conservative URL length limit for comma-separated batch requests
+    MAX_URL_LENGTH = 2000
+
+    def __init__(self, api_key: str|None, timeout: int = 10, transport: Transport | None = None,
+                 price_store: PriceStore | None = None, compact: CompactDtypes | None = None):
+        super().__init__(api_key, timeout, transport)
+        self.price_store = price_store
+        self.compact = compact
+
+    @memoize_frame
+    def historical_price_full(self, symbol: str, series_type: str | None = None, start: str | None = None, end: str | None = None, period: int | None = None, incremental: bool = False, raw: bool = False) -> pd.DataFrame:
         """
         Get full historical daily prices for a given symbol.
 
@@ -18,10 +38,65 @@ class Stocks(_BaseClient):
             start (str, optional): Start date in YYYY-MM-DD format.
             end (str, optional): End date in YYYY-MM-DD format.
             period (int, optional): Number of years to retrieve data for, ending today. Takes precedence over `start` if both are provided.
+            incremental (bool, optional): Serve the window from ``price_store`` and only
+                download bars missing from it (from the last stored bar onwards, plus any
+                older range not yet stored; without a start, everything before the first
+                stored bar). Defaults to False.
+            raw (bool, optional): Return full-precision prices and ``pct_chg`` instead of
+                rounding them to 2 decimals. Defaults to False.
 
         Returns:
             pd.DataFrame: Historical price data as a DataFrame.
         """
+        endpoint, params = self._historical_request(symbol, series_type, start, end, period)
+        if incremental:
+            return self._historical_incremental(symbol, series_type, params, raw)
+        data = self._make_request(endpoint, params)
+        with self._timed("historical_price_full"):
+            return self._process_historical(data, raw)
+
+    def _historical_incremental(self, symbol: str, series_type: str | None, params: dict, raw: bool = False) -> pd.DataFrame:
+        """Update the local price store with missing bars and return the requested window."""
+        if self.price_store is None:
+            raise ValueError("incremental=True requires a price_store.")
+        if series_type:
+            raise ValueError("incremental=True only supports the full OHLC series.")
+
+        window_start = pd.Timestamp(params['from']) if 'from' in params else None
+        window_end = pd.Timestamp(params['to']) if 'to' in params else None
+
+        # Work out which ranges the store is missing
+        missing = []
+        stored_range = self.price_store.date_range(symbol)
+        if stored_range is None:
+            missing.append((params.get('from'), params.get('to')))
+        else:
+            first, last = stored_range
+            # No start asks for the whole history, which may reach back before the stored bars
+            if window_start is None or window_start < first:
+                missing.append((params.get('from'), (first - timedelta(days=1)).strftime('%Y-%m-%d')))
+            if window_end is None or window_end >= last:
+                # Refetch the last stored bar too, it may have been an intraday snapshot
+                missing.append((last.strftime('%Y-%m-%d'), params.get('to')))
+
+        df = self.price_store.load(symbol)
+        for fetch_start, fetch_end in missing:
+            endpoint, fetch_params = self._historical_request(symbol, start=fetch_start, end=fetch_end)
+            new_bars = self._build_historical(self._make_request(endpoint, fetch_params))
+            df = self.price_store.upsert(symbol, new_bars)
+
+        if df.empty:
+            return pd.DataFrame()
+        if window_start is not None:
+            df = df[df['date'] >= window_start]
+        if window_end is not None:
+            df = df[df['date'] <= window_end]
+        df = df.reset_index(drop=True)
+        return df if raw else finalize_frame(df)
+
+    @staticmethod
+    def _historical_request(symbol: str, series_type: str | None = None, start: str | None = None, end: str | None = None, period: int | None = None) -> tuple[str, dict]:
+        """Build the endpoint and query params for a historical price request."""
         endpoint = f"historical-price-full/{symbol}"
         params = {}
         if series_type: params['serietype'] = series_type
@@ -34,12 +109,21 @@ class Stocks(_BaseClient):
         else:
             if start: params['from'] = start
             if end: params['to'] = end
+        return endpoint, params
 
-        data = self._make_request(endpoint, params)
+    @classmethod
+    def _process_historical(cls, data, raw: bool = False) -> pd.DataFrame:
+        """Convert a historical price payload to a sorted OHLC DataFrame with pct_chg."""
+        df = cls._build_historical(data)
+        return df if raw else finalize_frame(df)
+
+    @classmethod
+    def _build_historical(cls, data) -> pd.DataFrame:
+        """Build the full-precision OHLC + pct_chg frame from a historical price payload."""
         if data and 'historical' in data:
-            df = self._process_response(data['historical'])
+            df = cls._process_response(data['historical'])
         else:
-            df = self._process_response(data)
+            df = cls._process_response(data)
 
         if isinstance(df, pd.DataFrame) and not df.empty:
             # Ensure 'date' column is datetime for proper sorting and deduplication
@@ -57,14 +141,75 @@ class Stocks(_BaseClient):
             # Calculate pct_chg
             if 'close' in df.columns:
                 df['pct_chg'] = df['close'].pct_change()
-            
-            df = df.round(2)
         else:
             # If df is not a DataFrame or is empty, return an empty DataFrame to satisfy the type hint
             df = pd.DataFrame()
 
         return df
 
+    def historical_price_many(self, symbols: list[str], start: str | None = None, end: str | None = None, period: int | None = None,
+                              chunk_size: int = 5, max_workers: int = 4, panel: bool = False, field: str = 'close') -> pd.DataFrame:
+        """
+        Get full historical daily prices for many symbols with batched requests.
+
+        Symbols are sent comma-separated, ``chunk_size`` per request, and the
+        chunks are fetched concurrently.
+
+        Args:
+            symbols (list[str]): Stock ticker symbols.
+            start (str, optional): Start date in YYYY-MM-DD format.
+            end (str, optional): End date in YYYY-MM-DD format.
+            period (int, optional): Number of years to retrieve data for, ending today. Takes precedence over `start` if both are provided.
+            chunk_size (int, optional): Symbols per request. FMP serves at most 5. Defaults to 5.
+            max_workers (int, optional): Number of chunks fetched concurrently. Defaults to 4.
+            panel (bool, optional): Return a (date × symbol) panel of ``field`` instead of
+                the long format. Defaults to False.
+            field (str, optional): Column used for the panel values. Defaults to 'close'.
+
+        Returns:
+            pd.DataFrame: Long-format prices with a ``symbol`` column, sorted by symbol
+            and date, or a date-indexed panel with one column per symbol.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+
+        def fetch(chunk: list[str]) -> list[pd.DataFrame]:
+            endpoint, params = self._historical_request(",".join(chunk), start=start, end=end, period=period)
+            return self._process_historical_list(self._make_request(endpoint, params))
+
+        with ThreadPoolExecutor(max_workers=self._pool_workers(max_workers)) as executor:
+            frames = [df for chunk_frames in executor.map(fetch, chunks) for df in chunk_frames]
+
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        # Keep the caller's symbol order
+        order = {symbol: i for i, symbol in enumerate(symbols)}
+        df = (df.assign(_order=df['symbol'].map(order))
+              .sort_values(['_order', 'date'], ignore_index=True)
+              .drop(columns=['_order']))
+
+        if panel:
+            present = set(df['symbol'])
+            return df.pivot(index='date', columns='symbol', values=field)[[s for s in symbols if s in present]]
+        return df
+
+    @classmethod
+    def _process_historical_list(cls, data) -> list[pd.DataFrame]:
+        """Split a (multi-symbol) historical price payload into per-symbol frames with a symbol column."""
+        if not isinstance(data, dict):
+            return []
+        # A single-symbol batch comes back in the regular {'symbol', 'historical'} shape
+        entries = data.get('historicalStockList', [data] if 'historical' in data else [])
+
+        frames = []
+        for entry in entries:
+            df = cls._process_historical(entry)
+            if not df.empty:
+                df.insert(0, 'symbol', entry.get('symbol'))
+                frames.append(df)
+        return frames
+
     def daily_prices(self, symbol: str, start: str | None = None, end: str | None = None, period: int | None = None) -> pd.DataFrame:
         """
         Get historical daily prices for a given symbol (line series).
@@ -89,21 +234,98 @@ class Stocks(_BaseClient):
         """
         endpoint = "stock/list"
         data = self._make_request(endpoint)
-        return self._process_response(data)
+        with self._timed("stock_list"):
+            return self._compact_frame(self._process_response(data))
 
-    def quote(self, symbol: str):
+    def iter_stock_list(self, chunk_size: int = 10000, exchange: str | Iterable[str] | None = None,
+                        security_type: str | Iterable[str] | None = None) -> Iterator[pd.DataFrame]:
         """
-        Get real-time quote for a given symbol.
+        Stream the list of all available stocks in DataFrame chunks.
+
+        The payload is parsed incrementally as it downloads and filtered row by
+        row, so peak memory stays around one chunk instead of the whole list
+        held twice (as dicts and as a DataFrame).
 
         Args:
-            symbol (str): Stock ticker symbol (e.g., 'AAPL').
+            chunk_size (int, optional): Rows per yielded DataFrame. Defaults to 10000.
+            exchange (str | Iterable[str], optional): Keep only these exchanges,
+                matched on ``exchangeShortName`` (e.g. 'NASDAQ', 'NYSE').
+            security_type (str | Iterable[str], optional): Keep only these ``type``
+                values (e.g. 'stock', 'etf').
+
+        Yields:
+            pandas.DataFrame: Up to ``chunk_size`` stocks each, with the client's ``compact``
+            dtypes applied per chunk (so categories can differ between chunks).
+        """
+        exchanges = {exchange} if isinstance(exchange, str) else set(exchange) if exchange else None
+        types = {security_type} if isinstance(security_type, str) else set(security_type) if security_type else None
+
+        rows = []
+        for row in self._stream_request("stock/list"):
+            if exchanges is not None and row.get('exchangeShortName') not in exchanges:
+                continue
+            if types is not None and row.get('type') not in types:
+                continue
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield self._compact_frame(pd.DataFrame(rows))
+                rows = []
+        if rows:
+            yield self._compact_frame(pd.DataFrame(rows))
+
+    def quote(self, symbol: str | Iterable[str], max_workers: int = 4):
+        """
+        Get real-time quotes for one symbol or many symbols.
+
+        For an iterable of symbols, the symbols are packed comma-separated into
+        as few requests as fit under ``MAX_URL_LENGTH`` and those requests are
+        issued concurrently.
+
+        Args:
+            symbol (str | Iterable[str]): Stock ticker symbol (e.g., 'AAPL') or an iterable of symbols.
+            max_workers (int, optional): Number of batch requests in flight at once. Defaults to 4.
 
         Returns:
-            list or pandas.DataFrame: Quote data.
+            list or pandas.DataFrame: Quote data. For an iterable of symbols, a DataFrame
+            indexed by symbol in input order (symbols without a quote are omitted).
         """
-        endpoint = f"quote/{symbol}"
-        data = self._make_request(endpoint)
-        return self._process_response(data)
+        if isinstance(symbol, str):
+            endpoint = f"quote/{symbol}"
+            data = self._make_request(endpoint)
+            return self._process_response(data)
+
+        symbols = list(dict.fromkeys(symbol))
+        chunks = self._chunk_symbols(symbols, len(f"{self.BASE_URL}quote/?apikey={self.api_key}"))
+
+        def fetch(chunk: list[str]) -> list:
+            data = self._make_request(f"quote/{','.join(chunk)}")
+            return data if isinstance(data, list) else []
+
+        with ThreadPoolExecutor(max_workers=self._pool_workers(max_workers)) as executor:
+            rows = [row for chunk_rows in executor.map(fetch, chunks) for row in chunk_rows]
+
+        df = self._ensure_dataframe(self._process_response(rows))
+        if df.empty:
+            return df
+        df = df.drop_duplicates(subset=['symbol'], keep='last').set_index('symbol')
+        return df.reindex([s for s in symbols if s in df.index])
+
+    @classmethod
+    def _chunk_symbols(cls, symbols: list[str], overhead: int) -> list[list[str]]:
+        """Pack symbols into comma-separated chunks whose URL stays under MAX_URL_LENGTH."""
+        budget = max(cls.MAX_URL_LENGTH - overhead, 1)
+        chunks, current, length = [], [], 0
+        for symbol in symbols:
+            added = len(symbol) + (1 if current else 0)
+            if current and length + added > budget:
+                chunks.append(current)
+                current, length = [], 0
+                added = len(symbol)
+            current.append(symbol)
+            length += added
+        if current:
+            chunks.append(current)
+        return chunks
 
     def search(self, query: str, exchange: str | None = None, limit: int = 10):
         """
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import threading
+import pandas as pd
+
+
+def _require_pyarrow() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError("Local stores require pyarrow. Install it with `pip install fmpxx[store]`.") from e
+
+
+class _ParquetStore:
+    """Base class for local Parquet stores rooted at a directory."""
+
+    def __init__(self, root: str):
+        _require_pyarrow()
+        self.root = os.path.abspath(os.path.expanduser(root))
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _read(self, path: str) -> pd.DataFrame:
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        return pd.read_parquet(path)
+
+    def _write(self, path: str, df: pd.DataFrame) -> None:
+        """Atomically replace ``path`` with ``df``."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class PriceStore(_ParquetStore):
+    """Local store of daily price bars, one Parquet file per symbol.
+
+    Bars are kept at full precision with their ``pct_chg`` so incremental
+    updates only need the bars after the last stored date.
+
+    Args:
+        root (str): Directory holding the store. Files live under ``<root>/prices/``.
+    """
+
+    COLUMNS = ['date', 'open', 'high', 'low', 'close', 'pct_chg']
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.root, "prices", f"{symbol}.parquet")
+
+    def load(self, symbol: str) -> pd.DataFrame:
+        """Return the stored bars for ``symbol`` sorted by date, or an empty frame."""
+        return self._read(self.path(symbol))
+
+    def date_range(self, symbol: str) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """First and last stored bar dates, or None when nothing is stored."""
+        df = self.load(symbol)
+        if df.empty:
+            return None
+        return df['date'].iloc[0], df['date'].iloc[-1]
+
+    def upsert(self, symbol: str, new_bars: pd.DataFrame) -> pd.DataFrame:
+        """Merge ``new_bars`` into the stored series and persist it.
+
+        New bars replace stored bars on the same date. ``pct_chg`` is only
+        recomputed for the new bars and the bar right after each new block;
+        every other stored value is kept as is.
+
+        Returns:
+            pd.DataFrame: The full merged series.
+        """
+        with self._lock:
+            stored = self.load(symbol)
+            if new_bars.empty:
+                return stored
+
+            new_bars = new_bars.assign(_new=True)
+            if stored.empty:
+                merged = new_bars
+            else:
+                stored = stored[~stored['date'].isin(new_bars['date'])].assign(_new=False)
+                merged = pd.concat([stored, new_bars], ignore_index=True)
+            merged = merged.sort_values('date', ignore_index=True)
+
+            if 'close' in merged.columns:
+                is_new = merged['_new'].astype(bool)
+                boundary = is_new | is_new.shift(1, fill_value=False)
+                prev_close = merged['close'].shift(1)
+                merged.loc[boundary, 'pct_chg'] = merged.loc[boundary, 'close'] / prev_close[boundary] - 1
+
+            merged = merged.drop(columns=['_new'])
+            merged = merged[[col for col in self.COLUMNS if col in merged.columns]]
+            self._write(self.path(symbol), merged)
+            return merged
+
+
+class StatementStore(_ParquetStore):
+    """Local store of financial statements, partitioned by symbol and statement.
+
+    Each (symbol, statement, period) series is one Parquet file holding the
+    raw statement rows newest first, as the API returns them. Refreshes only
+    need the latest one or two reports, which are upserted by period end date.
+
+    Args:
+        root (str): Directory holding the store. Files live under
+            ``<root>/statements/<symbol>/<statement>-<period>.parquet``.
+    """
+
+    def path(self, symbol: str, statement: str, period: str) -> str:
+        return os.path.join(self.root, "statements", symbol, f"{statement}-{period}.parquet")
+
+    def load(self, symbol: str, statement: str, period: str) -> pd.DataFrame:
+        """Return the stored rows newest first, or an empty frame."""
+        return self._read(self.path(symbol, statement, period))
+
+    def upsert(self, symbol: str, statement: str, period: str, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """Merge ``new_rows`` into the stored statement and persist it.
+
+        Rows are keyed by ``date`` (period end). A new row replaces the stored
+        row for the same date, so amended filings (a later ``fillingDate``)
+        overwrite the original; older stored rows are kept as is.
+
+        Returns:
+            pd.DataFrame: The full merged statement, newest first.
+        """
+        with self._lock:
+            stored = self.load(symbol, statement, period)
+            if new_rows.empty or 'date' not in new_rows.columns:
+                return stored
+
+            if 'fillingDate' in new_rows.columns:
+                new_rows = new_rows.sort_values('fillingDate', ascending=False)
+            new_rows = new_rows.drop_duplicates(subset=['date'], keep='first')
+            if not stored.empty:
+                stored = stored[~stored['date'].isin(new_rows['date'])]
+                new_rows = pd.concat([new_rows, stored], ignore_index=True)
+            merged = new_rows.sort_values('date', ascending=False, ignore_index=True)
+
+            self._write(self.path(symbol, statement, period), merged)
+            return merged
@@ -0,0 +1,126 @@
+import logging
+import time
+import requests
+from collections.abc import Callable
+from requests.adapters import HTTPAdapter
+from .cache import FrameCache, ResponseCache
+from .cassette import Cassette
+from .metrics import Metrics
+from .ratelimit import RateLimiter, RetryPolicy
+from .utils import json_loads as default_json_loads
+
+logger = logging.getLogger(__name__)
+
+
+class Transport:
+    """Shared HTTP transport for all FMP API clients.
+
+    Owns a single ``requests.Session`` backed by a pooled ``HTTPAdapter`` so
+    that ``FMPClient`` and every sub-client reuse the same keep-alive
+    connections instead of paying a new TCP+TLS handshake per client.
+
+    Args:
+        pool_connections (int, optional): Number of host pools to cache. Defaults to 10.
+        pool_maxsize (int, optional): Maximum connections kept alive per host. Batch methods
+            cap their worker threads so concurrent requests fit in it. Defaults to 24, enough
+            for the default ``get_stock_performance_many`` workers (8 × 3 statements).
+        pool_block (bool, optional): Block when the pool is exhausted instead of
+            opening throw-away connections. Defaults to False.
+        cache (ResponseCache | None, optional): On-disk response cache shared by
+            every client on this transport. Disabled when None.
+        frame_cache (FrameCache | None, optional): In-memory LRU of processed
+            DataFrames shared by every client on this transport. Disabled when None.
+        rate_limiter (RateLimiter | None, optional): Token bucket every request waits
+            on before hitting the network. Unlimited when None.
+        retry_policy (RetryPolicy | None, optional): Backoff schedule for 429 and 5xx
+            responses. Defaults to ``RetryPolicy()``; pass ``RetryPolicy(max_retries=0)``
+            to disable retries.
+        json_loads (Callable[[bytes], object] | None, optional): Decoder applied to raw
+            response bytes. Defaults to ``orjson.loads`` when orjson is installed,
+            else ``json.loads``.
+        metrics (Metrics | None, optional): Request and processing metrics recorded by
+            every client on this transport. Disabled when None.
+        base_url (str | None, optional): Host to send requests to instead of
+            ``https://financialmodelingprep.com``, e.g. a local mock server. API paths
+            (``/api/v3/...``) are kept.
+        cassette (Cassette | None, optional): Record every network response to, or
+            replay every request from, a compressed cassette store. A replaying
+            transport never touches the network.
+
+    Attributes:
+        before_request_hooks (list): Callbacks ``hook(endpoint, params)`` run before each
+            request, including ones served from the response cache.
+        after_request_hooks (list): Callbacks ``hook(endpoint, params, info)`` run after
+            each request. ``info`` has ``status``, ``network``, ``decode`` (seconds),
+            ``bytes``, ``retries``, ``cached`` and ``error``.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 24, pool_block: bool = False,
+                 cache: ResponseCache | None = None, frame_cache: FrameCache | None = None,
+                 rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None,
+                 json_loads: Callable[[bytes], object] | None = None, metrics: Metrics | None = None,
+                 base_url: str | None = None, cassette: Cassette | None = None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache
+        self.frame_cache = frame_cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.json_loads = json_loads if json_loads is not None else default_json_loads
+        self.metrics = metrics
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.cassette = cassette
+        self.before_request_hooks: list[Callable] = []
+        self.after_request_hooks: list[Callable] = []
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, params: dict | None = None, timeout: int | None = None,
+            stream: bool = False) -> requests.Response:
+        """Issue a GET request over the pooled session.
+
+        Waits on the rate limiter before each attempt and retries 429/5xx
+        responses per the retry policy. The last response is returned as-is,
+        so status handling stays with the caller. With ``stream=True`` the
+        body is left unread for the caller to consume and close. The number
+        of retries taken is set as ``response.retries``.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            return self.cassette.replay(url, params)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=timeout, stream=stream)
+            delay = self.retry_policy.backoff(url, response.status_code, attempt,
+                                              response.headers.get("Retry-After"), self.rate_limiter)
+            if delay is None:
+                response.retries = attempt
+                if self.cassette is not None and self.cassette.recording:
+                    self.cassette.record(url, params, response)
+                return response
+
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def run_hooks(self, hooks: list[Callable], *args) -> None:
+        """Call request hooks; a failing hook is logged and never breaks the request."""
+        for hook in hooks:
+            try:
+                hook(*args)
+            except Exception:
+                logger.exception(f"Request hook {hook!r} failed")
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
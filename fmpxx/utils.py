@@ -1,4 +1,14 @@
+import codecs
 import json
+import numpy as np
+import pandas as pd
+from collections.abc import Iterable, Iterator
+
+try:
+    # Decodes straight from bytes, several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    json_loads = json.loads
 
 def round_raw_data(data, decimals=2):
     """格式化raw数据中的数值保留指定小数位"""
@@ -11,4 +21,177 @@ def round_raw_data(data, decimals=2):
             return [round_value(item) for item in obj]
         return obj
     
-    return round_value(data)
\ No newline at end of file
+    return round_value(data)
+
+
+def finalize_frame(df: pd.DataFrame, decimals: int | None = 2, fill_value: float | None = None) -> pd.DataFrame:
+    """Fill and round the numeric columns of a result frame at output time.
+
+    Works column by column, in place: only numeric columns that have missing
+    values (when filling) or a float dtype (when rounding) are replaced, so
+    text, date, integer and boolean columns are never copied. Non-numeric
+    columns keep their missing values. Replacing columns one at a time costs
+    about 1 ms per call on typical output frames, against about 0.1 ms for
+    pandas' block-wise ``fillna``/``round``, which copy every block.
+
+    Args:
+        df (pd.DataFrame): Frame to finalize; it is modified in place.
+        decimals (int | None, optional): Decimals to round float columns to. None skips rounding.
+        fill_value (float | None, optional): Value for missing numbers. None skips filling.
+
+    Returns:
+        pd.DataFrame: ``df`` itself, finalized.
+    """
+    dtypes = df.dtypes.to_numpy()
+    numeric = np.array([
+        pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) for dtype in dtypes
+    ], dtype=bool)
+    fill = numeric & df.isna().to_numpy().any(axis=0) if fill_value is not None else np.zeros(len(dtypes), dtype=bool)
+    rounded = np.array([
+        decimals is not None and is_numeric and pd.api.types.is_float_dtype(dtype)
+        for dtype, is_numeric in zip(dtypes, numeric)
+    ], dtype=bool)
+
+    for i in np.flatnonzero(fill | rounded):
+        column = df.iloc[:, i]
+        if fill[i]:
+            column = column.fillna(fill_value)
+        if rounded[i]:
+            column = column.round(decimals)
+        df.isetitem(i, column)
+    return df
+
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """Incrementally decode a top-level JSON array from byte chunks.
+
+    Elements are yielded as soon as they are complete, so only the current
+    chunk and the element being parsed are held in memory. A document that
+    is not an array is decoded whole and yielded as a single item.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf, pos = "", 0
+    started = is_array = done = False
+
+    for chunk in _with_end(chunks):
+        final = chunk is None
+        buf = buf[pos:] + (utf8.decode(b"", final=True) if final else utf8.decode(chunk))
+        pos = 0
+
+        if not started:
+            stripped = buf.lstrip(_WHITESPACE)
+            if not stripped:
+                continue
+            started, is_array = True, stripped[0] == "["
+            pos = len(buf) - len(stripped) + (1 if is_array else 0)
+        if not is_array:
+            # Not a streamable array; decode once everything has arrived
+            if final:
+                yield decoder.decode(buf)
+            continue
+
+        while not done:
+            while pos < len(buf) and buf[pos] in _WHITESPACE + ",":
+                pos += 1
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":
+                done = True
+                break
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # Element continues in the next chunk
+            if not final and (end >= len(buf) or buf[end] not in _WHITESPACE + ",]"):
+                break  # A number may be cut off mid-token, wait for its delimiter
+            yield item
+            pos = end
+
+    if is_array and not done:
+        raise ValueError("Truncated JSON array")
+
+
+def _with_end(chunks: Iterable[bytes]) -> Iterator[bytes | None]:
+    for chunk in chunks:
+        if chunk:
+            yield chunk
+    yield None
+
+
+class CompactDtypes:
+    """Memory-lean dtype policy for DataFrames returned by the clients.
+
+    Repeated strings (``symbol``, ``reportedCurrency``, ``period``, ``cik``,
+    exchanges, ...) become categoricals, year columns become small nullable
+    integers and integer columns are downcast losslessly. Float downcasting
+    and pyarrow-backed strings are opt-in since they change precision and
+    require pyarrow respectively.
+
+    Args:
+        float32 (bool, optional): Store float columns as float32 (about 7 significant
+            digits). Defaults to False.
+        pyarrow_strings (bool, optional): Store the remaining, mostly unique string
+            columns as ``string[pyarrow]``. Defaults to False.
+        max_category_ratio (float, optional): A string column becomes categorical when
+            its distinct values are at most this share of its rows. Defaults to 0.5.
+    """
+
+    YEAR_COLUMNS = ('calendarYear', 'year')
+
+    def __init__(self, float32: bool = False, pyarrow_strings: bool = False, max_category_ratio: float = 0.5):
+        if pyarrow_strings:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError("pyarrow_strings=True requires pyarrow. Install it with `pip install fmpxx[store]`.") from e
+        self.float32 = float32
+        self.pyarrow_strings = pyarrow_strings
+        self.max_category_ratio = max_category_ratio
+
+    def _key(self) -> tuple:
+        return (self.float32, self.pyarrow_strings, self.max_category_ratio)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CompactDtypes) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (f"CompactDtypes(float32={self.float32}, pyarrow_strings={self.pyarrow_strings}, "
+                f"max_category_ratio={self.max_category_ratio})")
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return ``df`` with compact dtypes. Values are unchanged unless ``float32`` is set."""
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            return df
+
+        columns = {}
+        for name, col in df.items():
+            if name in self.YEAR_COLUMNS and not pd.api.types.is_datetime64_any_dtype(col):
+                years = pd.to_numeric(col, errors='coerce')
+                # Only convert when every present value is a year
+                if years.notna().sum() == col.notna().sum():
+                    columns[name] = years.round().astype('Int16')
+            elif pd.api.types.is_bool_dtype(col):
+                continue
+            elif pd.api.types.is_integer_dtype(col):
+                columns[name] = pd.to_numeric(col, downcast='integer')
+            elif pd.api.types.is_float_dtype(col):
+                if self.float32:
+                    columns[name] = col.astype('float32')
+            elif col.dtype == object and pd.api.types.infer_dtype(col, skipna=True) == 'string':
+                if col.nunique() <= self.max_category_ratio * len(col):
+                    columns[name] = col.astype('category')
+                elif self.pyarrow_strings:
+                    columns[name] = col.astype('string[pyarrow]')
+
+        if not columns:
+            return df
+        return df.assign(**columns)
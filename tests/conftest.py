@@ -0,0 +1,169 @@
+import io
+import json
+import re
+import threading
+import time
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from fmpxx import FMPClient
+
+# Scripts that hit the live API (or replay its cassettes) and exit on import
+collect_ignore = ["test_stock.py", "test_financials.py", "test3.py", "dual_axis_charts.py", "performance_analysis.py"]
+
+STATEMENTS = ("income-statement", "balance-sheet-statement", "cash-flow-statement")
+
+
+class FakeFMP(BaseAdapter):
+    """Offline stand-in for the FMP API, mounted on a client's session.
+
+    Statements are generated for quarters ending on or before ``as_of``, so
+    moving ``as_of`` forward simulates new filings; ``history`` caps the
+    reports available per symbol, symbols in ``empty`` have no statements,
+    prices or quotes and ``aliases`` sets the symbol reported in a symbol's
+    statements. Responses queued in ``replies`` (status, body, headers) are
+    served first for a matching path.
+
+    Attributes:
+        calls (list[tuple[str, dict]]): API path and query params of every request.
+        max_active (int): Most requests in flight at once.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.as_of = pd.Timestamp("2025-06-30")
+        self.empty: set[str] = set()
+        self.history: dict[str, int] = {}
+        self.aliases: dict[str, str] = {}
+        self.replies: dict[str, list[tuple[int, object, dict]]] = {}
+        self.calls: list[tuple[str, dict]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def requests_to(self, prefix: str) -> list[dict]:
+        """Query params of the requests whose path starts with ``prefix``."""
+        return [params for path, params in self.calls if path.startswith(prefix)]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlparse(request.url)
+        path = re.sub(r"^/api/v[34]/", "", url.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items() if key != "apikey"}
+        with self._lock:
+            self.calls.append((path, params))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            queued = self.replies.get(path)
+            status, body, headers = queued.pop(0) if queued else (200, self.route(path, params), {})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+        response = requests.Response()
+        response.status_code = status
+        response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        response.raw = io.BytesIO(response._content)
+        response.headers.update({"Content-Type": "application/json", **headers})
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+    def route(self, path: str, params: dict):
+        statement = re.match(rf"({'|'.join(STATEMENTS)})/(.+)", path)
+        if statement:
+            return self.statement(statement.group(1), statement.group(2), int(params.get("limit", 10)))
+        prices = re.match(r"historical-price-full/(.+)", path)
+        if prices:
+            symbols = prices.group(1).split(",")
+            entries = [{"symbol": symbol, "historical": self.prices(params.get("from"), params.get("to"))}
+                       for symbol in symbols if symbol not in self.empty]
+            return {"historicalStockList": entries} if len(symbols) > 1 else entries[0] if entries else {}
+        quotes = re.match(r"quote/(.+)", path)
+        if quotes:
+            return [{"symbol": symbol, "price": 1.5 * i, "volume": 1000}
+                    for i, symbol in enumerate(quotes.group(1).split(",")) if symbol not in self.empty]
+        earnings = re.match(r"historical/earning_calendar/(.+)", path)
+        if earnings:
+            return self.earnings(earnings.group(1), int(params.get("limit", 16)))
+        if path == "stock/list":
+            return [{"symbol": f"S{i:03d}", "name": f"Company {i}", "price": 1.5 * i,
+                     "exchangeShortName": ("NASDAQ", "NYSE", "AMEX")[i % 3],
+                     "type": "etf" if i % 4 == 0 else "stock"} for i in range(30)]
+        return {"Error Message": f"Unknown endpoint {path}"}
+
+    def statement(self, kind: str, symbol: str, limit: int) -> list[dict]:
+        if symbol in self.empty:
+            return []
+        limit = min(limit, self.history.get(symbol, limit))
+        rows = []
+        for i, period_end in enumerate(pd.date_range(end=self.as_of, periods=limit, freq="QE")[::-1]):
+            filed = period_end.to_pydatetime() + timedelta(days=30)
+            revenue = 1000.0 * 1.02 ** (period_end.year * 4 + period_end.quarter - 8000)
+            row = {
+                "date": period_end.strftime("%Y-%m-%d"), "symbol": self.aliases.get(symbol, symbol),
+                "reportedCurrency": "USD",
+                "cik": "0000320193", "fillingDate": filed.strftime("%Y-%m-%d"),
+                "acceptedDate": filed.strftime("%Y-%m-%d 18:01:00"), "calendarYear": str(period_end.year),
+                "period": f"Q{period_end.quarter}", "link": "", "finalLink": "",
+            }
+            if kind == "income-statement":
+                row.update(revenue=revenue, grossProfitRatio=0.45, epsdiluted=revenue / 1000,
+                           operatingIncomeRatio=0.3, operatingIncome=revenue * 0.3, netIncome=revenue * 0.25)
+            elif kind == "balance-sheet-statement":
+                row.update(totalDebt=500.0, totalAssets=2000.0)
+            else:
+                row.update(freeCashFlow=revenue * 0.2, netIncome=revenue * 0.25)
+            rows.append(row)
+        return rows
+
+    def prices(self, start: str | None, end: str | None) -> list[dict]:
+        end = min(pd.Timestamp(end), self.as_of) if end else self.as_of
+        dates = pd.bdate_range(start or "2024-01-01", end)[::-1]
+        return [{"date": day.strftime("%Y-%m-%d"), "open": 100.0 + day.day % 7, "high": 101.0 + day.day % 7,
+                 "low": 99.0 + day.day % 7, "close": 100.0 + day.day % 7, "volume": 1000}
+                for day in dates]
+
+    def earnings(self, symbol: str, limit: int) -> list[dict]:
+        dates = [day.to_pydatetime() + timedelta(days=30)
+                 for day in pd.date_range(end=self.as_of, periods=limit, freq="QE")[::-1]]
+        return [{"date": day.strftime("%Y-%m-%d"), "symbol": symbol, "eps": 1.0 + 0.1 * i,
+                 "epsEstimated": 1.0, "time": "amc"} for i, day in enumerate(dates)]
+
+
+@pytest.fixture
+def fake_api() -> FakeFMP:
+    return FakeFMP()
+
+
+@pytest.fixture
+def make_client(fake_api):
+    """Build an ``FMPClient`` whose requests are answered by ``fake_api``."""
+    clients = []
+
+    def make(**kwargs) -> FMPClient:
+        client = FMPClient("test-key", **kwargs)
+        client.session.mount("https://", fake_api)
+        client.session.mount("http://", fake_api)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(make_client) -> FMPClient:
+    return make_client()
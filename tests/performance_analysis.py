@@ -28,7 +28,7 @@ def setup_client():
     api_key = os.getenv("FMP_KEY")
     if not api_key:
         raise ValueError("FMP_KEY environment variable not set")
-    return FMPClient(api_key=api_key, output_format='pandas')
+    return FMPClient(api_key=api_key)
 
 def get_stock_performance_batch(client, symbols, limit=8):
     """
@@ -42,25 +42,20 @@ def get_stock_performance_batch(client, symbols, limit=8):
     Returns:
         dict: 股票代码到DataFrame的映射
     """
+    performance_df, errors = client.financials.get_stock_performance_many(symbols, limit=limit)
+    
     results = {}
+    for symbol, df in performance_df.groupby('symbol', sort=False):
+        df = df.reset_index(drop=True)
+        results[symbol] = df
+        
+        # 保存CSV
+        csv_path = f'tests/test_data/performance_{symbol}.csv'
+        df.to_csv(csv_path, index=False)
+        print(f"✅ {symbol} 数据已保存到 {csv_path}")
     
-    for symbol in symbols:
-        print(f"正在获取 {symbol} 的业绩数据...")
-        try:
-            df = client.financials.get_stock_performance(symbol=symbol, limit=limit)
-            if df is not None and not df.empty:
-                # 添加股票代码列用于后续分析
-                df['symbol'] = symbol
-                results[symbol] = df
-                
-                # 保存CSV
-                csv_path = f'tests/test_data/performance_{symbol}.csv'
-                df.to_csv(csv_path, index=False)
-                print(f"✅ {symbol} 数据已保存到 {csv_path}")
-            else:
-                print(f"❌ 无法获取 {symbol} 的数据")
-        except Exception as e:
-            print(f"❌ 获取 {symbol} 数据时出错: {str(e)}")
+    for row in errors.itertuples(index=False):
+        print(f"❌ 获取 {row.symbol} 数据时出错: {row.error}")
     
     return results
 
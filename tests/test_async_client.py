@@ -0,0 +1,152 @@
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from fmpxx import AsyncFMPClient, Cassette, Metrics, ResponseCache
+from fmpxx.async_client import AsyncTransport
+from fmpxx.exceptions import CassetteMissError, RateLimitExceededError
+
+
+def run_with_server(replies: dict, scenario, delay: float = 0.0, load: dict | None = None):
+    """Run ``scenario(base_url, requests)`` against a local server answering ``replies``.
+
+    ``replies`` maps a path to the (status, body, headers) answered in turn;
+    the last one is repeated. Each answer takes ``delay`` seconds, and the
+    most requests handled at once is kept in ``load["peak"]``.
+    """
+    seen = []
+    load = load if load is not None else {}
+    load.update(active=0, peak=0)
+
+    async def handle(request):
+        seen.append((request.path, dict(request.query)))
+        load["active"] += 1
+        load["peak"] = max(load["peak"], load["active"])
+        await asyncio.sleep(delay)
+        load["active"] -= 1
+        queue = replies.get(request.path, [(404, {"Error Message": "not found"}, {})])
+        status, body, headers = queue.pop(0) if len(queue) > 1 else queue[0]
+        return web.Response(status=status, body=json.dumps(body), headers=headers, content_type="application/json")
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await scenario(f"http://127.0.0.1:{port}", seen)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+QUOTE = [{"symbol": "AAPL", "price": 1.0}]
+
+
+def test_retries_429_honoring_retry_after_and_records_metrics():
+    replies = {"/api/v3/quote/AAPL": [(429, {}, {"Retry-After": "0.1"}), (200, QUOTE, {})]}
+    info = []
+
+    async def scenario(url, seen):
+        async with AsyncFMPClient("key", base_url=url, metrics=Metrics()) as client:
+            client.on_response(lambda endpoint, params, i: info.append(i))
+            df = await client.stocks.quote("AAPL")
+            return df, client.stats()
+
+    df, stats = run_with_server(replies, scenario)
+    assert df["symbol"].tolist() == ["AAPL"]
+    assert stats["endpoints"]["quote"]["requests"] == 1
+    assert stats["endpoints"]["quote"]["retries"] == 1
+    assert info[0]["status"] == 200 and info[0]["retries"] == 1
+
+
+def test_raises_after_max_retries():
+    replies = {"/api/v3/quote/AAPL": [(429, {}, {"Retry-After": "0"})]}
+
+    async def scenario(url, seen):
+        async with AsyncFMPClient("key", base_url=url, max_retries=2, metrics=Metrics()) as client:
+            with pytest.raises(RateLimitExceededError):
+                await client.stocks.quote("AAPL")
+            return len(seen), client.stats()
+
+    calls, stats = run_with_server(replies, scenario)
+    assert calls == 3
+    assert stats["endpoints"]["quote"]["errors"] == 1
+
+
+def test_response_cache_and_api_key_param(tmp_path):
+    replies = {"/api/v3/quote/AAPL": [(200, QUOTE, {})]}
+
+    async def scenario(url, seen):
+        async with AsyncFMPClient("key", base_url=url, cache=ResponseCache(str(tmp_path))) as client:
+            await client.stocks.quote("AAPL")
+            await client.stocks.quote("AAPL")
+        return seen
+
+    seen = run_with_server(replies, scenario)
+    assert seen == [("/api/v3/quote/AAPL", {"apikey": "key"})]
+
+
+def test_cassette_replays_without_network(tmp_path):
+    replies = {"/api/v3/quote/AAPL": [(200, QUOTE, {})]}
+
+    async def record(url, seen):
+        async with AsyncFMPClient("key", base_url=url, cassette=Cassette(str(tmp_path), mode="record")) as client:
+            return await client.stocks.quote("AAPL")
+
+    recorded = run_with_server(replies, record)
+
+    async def replay():
+        async with AsyncFMPClient("key", cassette=Cassette(str(tmp_path))) as client:
+            with pytest.raises(CassetteMissError):
+                await client.stocks.quote("MSFT")
+            return await client.stocks.quote("AAPL")
+
+    assert asyncio.run(replay()).equals(recorded)
+
+
+def test_from_transport_shares_limiter_and_metrics(make_client):
+    client = make_client(calls_per_minute=60, metrics=Metrics())
+    transport = AsyncTransport.from_transport(client.transport)
+    assert transport.rate_limiter is client.transport.rate_limiter
+    assert transport.retry_policy is client.transport.retry_policy
+    assert transport.metrics is client.transport.metrics
+    assert transport.after_request_hooks is client.transport.after_request_hooks
+
+
+def test_max_concurrency_bounds_requests_in_flight():
+    replies = {f"/api/v3/quote/S{i}": [(200, [{"symbol": f"S{i}", "price": 1.0}], {})] for i in range(12)}
+    load = {}
+
+    async def scenario(url, seen):
+        async with AsyncFMPClient("key", base_url=url, max_concurrency=3) as client:
+            return await asyncio.gather(*(client.stocks.quote(f"S{i}") for i in range(12)))
+
+    frames = run_with_server(replies, scenario, delay=0.05, load=load)
+    assert len(frames) == 12
+    assert load["peak"] == 3
+
+
+def test_client_is_reusable_across_event_loops():
+    client = AsyncFMPClient("key", max_concurrency=2)
+
+    async def scenario(url, seen):
+        client.transport.base_url = url
+        try:
+            # More requests than slots, so requests wait on the semaphore
+            return await asyncio.gather(*(client.stocks.quote("AAPL") for _ in range(4)))
+        finally:
+            await client.close()
+
+    replies = {"/api/v3/quote/AAPL": [(200, QUOTE, {})]}
+    first = run_with_server(replies, scenario, delay=0.01)
+    second = run_with_server(replies, scenario, delay=0.01)
+    assert all(df.equals(first[0]) for df in first + second)
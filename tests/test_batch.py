@@ -0,0 +1,57 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from fmpxx.financials import PERFORMANCE_COLUMNS, Financials
+
+
+def test_performance_many_fits_connection_pool(make_client, fake_api, caplog):
+    fake_api.delay = 0.02
+    client = make_client(pool_maxsize=6)
+    with caplog.at_level(logging.WARNING, logger="urllib3"):
+        panel, errors = client.financials.get_stock_performance_many([f"S{i}" for i in range(10)], limit=8)
+
+    assert errors.empty
+    assert list(panel.columns) == PERFORMANCE_COLUMNS
+    assert panel["symbol"].nunique() == 10
+    assert fake_api.max_active <= 6
+    assert "Connection pool is full" not in caplog.text
+
+
+def test_default_pool_fits_default_workers(client):
+    assert client.transport.pool_maxsize >= 3 * 8
+    assert client.financials._pool_workers(8, 3) == 8
+    assert client.financials._pool_workers(8, 30) == 1
+
+
+def test_merge_eps_his_many_fits_connection_pool(make_client, fake_api):
+    # Price windows are counted back from today
+    fake_api.as_of = pd.Timestamp.today().normalize()
+    fake_api.delay = 0.02
+    client = make_client(pool_maxsize=4)
+    panel, errors = client.financials.merge_eps_his_many(["AAA", "BBB", "CCC", "DDD"], period=1)
+
+    assert list(panel["symbol"].unique()) == ["AAA", "BBB", "CCC", "DDD"]
+    assert fake_api.max_active <= 4
+
+
+def test_merge_eps_his_many_records_failures_per_symbol(client, fake_api):
+    fake_api.as_of = pd.Timestamp.today().normalize()
+    fake_api.replies["historical/earning_calendar/BBB"] = [(200, [{"symbol": "BBB", "eps": 1.0}], {})]
+    fake_api.replies["historical/earning_calendar/CCC"] = [(500, {}, {"Retry-After": "0"})] * 4
+    panel, errors = client.financials.merge_eps_his_many(["AAA", "BBB", "CCC"], period=1)
+
+    assert list(panel["symbol"].unique()) == ["AAA"]
+    assert errors["symbol"].tolist() == ["BBB", "CCC"]
+    assert errors["error"].str.startswith("KeyError").iloc[0]
+    assert errors["error"].str.startswith("FMPAPIError").iloc[1]
+
+
+def test_compute_pe_is_zero_without_positive_ttm_eps():
+    close = pd.Series([10.0, 10.0, 10.0, 10.0, np.nan])
+    eps_ttm = pd.Series([2.0, 0.0, -1.0, np.nan, 2.0])
+
+    pe = Financials._compute_pe(close, eps_ttm)
+    assert pe[:4].tolist() == [5.0, 0.0, 0.0, 0.0]
+    assert np.isnan(pe[4])
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from fmpxx import ResponseCache
+from fmpxx.cache import DAY, MISS
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResponseCache:
+    return ResponseCache(str(tmp_path / "cache"))
+
+
+def test_ttl_matches_longest_endpoint_prefix(cache):
+    assert cache.ttl_for("income-statement/AAPL") == 7 * DAY
+    assert cache.ttl_for("quote/AAPL,MSFT") == 15
+    assert cache.ttl_for("stock/list") == DAY
+    assert cache.ttl_for("unknown/AAPL") is None
+
+
+def test_key_ignores_api_key_and_param_order():
+    key = ResponseCache.make_key("quote/AAPL", {"a": 1, "b": 2, "apikey": "x"})
+    assert key == ResponseCache.make_key("quote/AAPL", {"b": 2, "a": 1, "apikey": "y"})
+    assert key != ResponseCache.make_key("quote/AAPL", {"a": 1, "b": 3})
+    assert key != ResponseCache.make_key("quote/AAPL", {"a": 1, "b": 2}, "http://127.0.0.1:8000")
+
+
+def test_round_trip_and_expiry(cache, monkeypatch):
+    cache.set("quote/AAPL", {}, [{"symbol": "AAPL", "price": 1.0}])
+    assert cache.get("quote/AAPL", {}) == [{"symbol": "AAPL", "price": 1.0}]
+    assert cache.size > 0
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 16)
+    assert cache.get("quote/AAPL", {}) is MISS
+    assert cache.size == 0
+
+
+def test_uncacheable_endpoint_is_not_stored(cache):
+    cache.set("unknown/AAPL", {}, [1])
+    assert cache.get("unknown/AAPL", {}) is MISS
+    assert cache.size == 0
+
+
+def test_ttl_override_disables_endpoint(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttls={"quote": 0})
+    cache.set("quote/AAPL", {}, [1])
+    assert cache.get("quote/AAPL", {}) is MISS
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    payload = [{"value": i * 7919 % 10007} for i in range(200)]
+    cache.set("quote/S0", {}, payload)
+    cache.max_bytes = 3 * cache.size
+    for i in range(1, 10):
+        time.sleep(0.01)
+        cache.set(f"quote/S{i}", {}, payload)
+
+    assert cache.size <= cache.max_bytes
+    assert cache.get("quote/S9", {}) == payload
+    assert cache.get("quote/S0", {}) is MISS
+
+
+def test_client_serves_repeat_requests_from_cache(make_client, fake_api, tmp_path):
+    client = make_client(cache=ResponseCache(str(tmp_path)))
+    first = client.financials.get_financials("AAPL", "income", limit=4)
+    second = client.financials.get_financials("AAPL", "income", limit=4)
+
+    assert len(fake_api.requests_to("income-statement")) == 1
+    assert first.equals(second)
+
+
+def test_client_never_caches_error_payloads(make_client, fake_api, tmp_path):
+    client = make_client(cache=ResponseCache(str(tmp_path)))
+    fake_api.replies["quote/AAPL"] = [(200, {"Error Message": "Limit reached"}, {})]
+    client.stocks.quote("AAPL")
+    client.stocks.quote("AAPL")
+
+    assert len(fake_api.requests_to("quote")) == 2
@@ -0,0 +1,36 @@
+import gzip
+
+import pytest
+
+from fmpxx import Cassette, FMPClient
+from fmpxx.exceptions import CassetteMissError
+
+
+def test_record_then_replay_without_network(make_client, fake_api, tmp_path):
+    recorder = make_client(cassette=Cassette(str(tmp_path), mode="record"))
+    recorded = recorder.financials.get_merged_financials("AAPL", limit=8)
+    streamed = list(recorder.stocks.iter_stock_list())
+
+    # No adapter mounted: any request reaching the network would fail
+    replayer = FMPClient("other-key", cassette=Cassette(str(tmp_path)))
+    assert replayer.financials.get_merged_financials("AAPL", limit=8).equals(recorded)
+    assert [chunk.equals(other) for chunk, other in zip(replayer.stocks.iter_stock_list(), streamed)] == [True]
+    with pytest.raises(CassetteMissError):
+        replayer.financials.get_merged_financials("MSFT", limit=8)
+
+
+def test_ignored_values_match_any_window(tmp_path):
+    cassette = Cassette(str(tmp_path), ignore_values=("from", "to"))
+    key = cassette.make_key("https://host/api/v3/historical-price-full/AAPL", {"from": "2024-01-01", "apikey": "a"})
+    assert key == cassette.make_key("http://127.0.0.1/api/v3/historical-price-full/AAPL", {"from": "2025-01-01"})
+
+
+def test_recordings_never_store_the_api_key(make_client, tmp_path):
+    make_client(cassette=Cassette(str(tmp_path), mode="record")).financials.get_financials("AAPL", "income", limit=1)
+    contents = b"".join(gzip.open(path).read() for path in tmp_path.iterdir())
+    assert b"test-key" not in contents
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        Cassette("unused", mode="rewind")
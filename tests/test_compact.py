@@ -0,0 +1,36 @@
+import pandas as pd
+
+from fmpxx import CompactDtypes
+from fmpxx.financials import PERFORMANCE_COLUMNS
+
+
+def test_compact_statement_frames_keep_values(make_client):
+    plain = make_client().financials.get_merged_financials("AAPL", limit=8)
+    compact = make_client(compact=CompactDtypes()).financials.get_merged_financials("AAPL", limit=8)
+
+    assert isinstance(compact["symbol"].dtype, pd.CategoricalDtype)
+    assert compact["calendarYear"].dtype == "Int16"
+    assert compact["calendarYear"].astype(str).tolist() == plain["calendarYear"].tolist()
+    numeric = plain.select_dtypes("number").columns
+    pd.testing.assert_frame_equal(compact[numeric], plain[numeric])
+
+
+def test_compact_applies_to_performance_panels(make_client):
+    client = make_client(compact=CompactDtypes(float32=True))
+    panel, errors = client.financials.get_stock_performance_many(["AAA", "BBB"], limit=8)
+    single = client.financials.get_stock_performance("AAA", limit=8)
+
+    assert errors.empty
+    assert list(panel.columns) == PERFORMANCE_COLUMNS
+    for df in (panel, single):
+        assert isinstance(df["symbol"].dtype, pd.CategoricalDtype)
+        assert df["revenue"].dtype == "float32"
+
+
+def test_compact_applies_to_streamed_stock_list(make_client):
+    client = make_client(compact=CompactDtypes())
+    chunks = list(client.stocks.iter_stock_list(chunk_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 10]
+    assert all(isinstance(chunk["exchangeShortName"].dtype, pd.CategoricalDtype) for chunk in chunks)
+    assert pd.concat(chunks)["symbol"].astype(str).tolist() == client.stocks.stock_list()["symbol"].astype(str).tolist()
@@ -0,0 +1,96 @@
+"""The as-of joins of merge_eps_his and get_fiscal_close_chg against the outer
+merge plus bfill/ffill they replaced, kept here as the reference."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmpxx.financials import Financials
+
+
+def legacy_align(eps_df: pd.DataFrame, his_df: pd.DataFrame) -> pd.DataFrame:
+    eps_df = eps_df.sort_values(by="date", ascending=True, ignore_index=True)
+    eps_df["forward"] = eps_df["eps"].isnull()
+    eps_df["eps"] = eps_df["eps"].fillna(eps_df["epsEstimated"])
+    eps_df["eps_ttm"] = eps_df["eps"].rolling(4).sum()
+    eps_df["date"] = eps_df["date"].dt.strftime("%Y-%m-%d")
+    his_df = his_df.assign(date=his_df["date"].dt.strftime("%Y-%m-%d"))
+
+    merged_df = pd.merge(eps_df, his_df, on="date", how="outer", sort=True)
+    merged_df["eps_ttm"] = merged_df["eps_ttm"].bfill().ffill()
+    merged_df["forward"] = merged_df["forward"].astype("boolean").bfill()
+    return merged_df.assign(date=pd.to_datetime(merged_df["date"]))
+
+
+def legacy_fiscal_close_chg(eps_df: pd.DataFrame, his_df: pd.DataFrame) -> pd.DataFrame:
+    eps_df = eps_df.sort_values(by="date", ascending=True, ignore_index=True)
+    merged_df = pd.merge(eps_df, his_df, on="date", how="outer", sort=True)
+    merged_df["close"] = merged_df["close"].ffill()
+    merged_df = merged_df[merged_df["date"] <= pd.Timestamp.now()]
+    # pct_change on a forward-filled column
+    merged_df["fiscal_chg"] = merged_df["close"] / merged_df["close"].shift() - 1
+    return merged_df[merged_df["is_fiscal"].notna() & merged_df["is_fiscal"].astype(bool)].reset_index(drop=True)
+
+
+def weekday_on_or_before(day: pd.Timestamp, weekday: int) -> pd.Timestamp:
+    return day - pd.offsets.Day((day.weekday() - weekday) % 7)
+
+
+@pytest.fixture
+def earnings(fake_api):
+    """Reports around a one-year price window ending today, covering the edge cases."""
+    today = pd.Timestamp.today().normalize()
+    fake_api.as_of = today
+    first_bar = today - pd.DateOffset(years=1)
+    reports = [
+        (first_bar - pd.offsets.Day(130), "bmo", 0.9),                    # before the first price bar
+        (first_bar - pd.offsets.Day(40), "amc", 1.0),                     # before the first price bar
+        (weekday_on_or_before(today - pd.offsets.Day(290), 1), "bmo", 1.1),  # Tuesday, trading day
+        (weekday_on_or_before(today - pd.offsets.Day(200), 5), "bmo", 1.2),  # Saturday
+        (weekday_on_or_before(today - pd.offsets.Day(110), 4), "amc", 1.3),  # Friday after close -> Saturday
+        (weekday_on_or_before(today - pd.offsets.Day(20), 1), "amc", 1.4),   # Tuesday after close -> Wednesday
+        (today + pd.offsets.Day(30), "bmo", None),                        # estimates, no price yet
+        (today + pd.offsets.Day(120), "bmo", None),
+    ]
+    body = [{"date": day.strftime("%Y-%m-%d"), "symbol": "AAA", "eps": eps, "epsEstimated": 1.5, "time": time}
+            for day, time, eps in reversed(reports)]
+    fake_api.replies["historical/earning_calendar/AAA"] = [(200, body, {})] * 4
+    return body
+
+
+def test_pe_alignment_matches_outer_merge(client, earnings):
+    eps_df, his_df = client.financials._fetch_eps_prices("AAA", 1, raw=True)
+    aligned = Financials._align_eps_prices(eps_df, his_df, False)
+    legacy = legacy_align(eps_df, his_df)
+
+    columns = ["date", "eps_ttm", "close", "eps", "forward"]
+    expected = legacy[columns].dropna(subset=["close"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(aligned[columns].reset_index(drop=True), expected, check_dtype=False)
+    # One row per trading day, none for weekend reports or estimates
+    assert len(aligned) == len(his_df)
+    assert aligned["eps"].notna().sum() == 2
+    assert not aligned["forward"].iloc[0] and aligned["forward"].iloc[-1]
+
+
+def test_fiscal_close_chg_matches_outer_merge(client, earnings):
+    eps_df, his_df = client.financials._fetch_eps_prices("AAA", 1)
+    result = Financials._fiscal_close_chg(eps_df, his_df, False)
+    legacy = legacy_fiscal_close_chg(eps_df, his_df)
+
+    columns = ["date", "eps", "close", "fiscal_chg"]
+    pd.testing.assert_frame_equal(result[columns], legacy[columns], check_dtype=False)
+    # Estimates are dropped; reports before the first bar have no close
+    assert len(result) == 6
+    assert result["close"].iloc[:2].isna().all()
+    # A Saturday report compares Friday's close with itself
+    saturday = result["date"].dt.weekday == 5
+    assert saturday.sum() == 2
+    assert np.allclose(result.loc[saturday, "fiscal_chg"], 0)
+
+
+def test_merge_eps_his_uses_the_alignment(client, earnings):
+    pe = client.financials.merge_eps_his("AAA", period=1, enable_logging=False, raw=True)
+    eps_df, his_df = client.financials._fetch_eps_prices("AAA", 1, raw=True)
+    legacy = legacy_align(eps_df, his_df).dropna(subset=["close"]).reset_index(drop=True)
+
+    assert np.allclose(pe["eps_ttm"], legacy["eps_ttm"])
+    assert np.allclose(pe["pe"], np.where(legacy["eps_ttm"] > 0, legacy["close"] / legacy["eps_ttm"], 0))
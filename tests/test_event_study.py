@@ -0,0 +1,13 @@
+import pandas as pd
+
+
+def test_event_study_downloads_once_and_matches_separate_calls(client, fake_api):
+    fake_api.as_of = pd.Timestamp.today().normalize()
+    pe, close_chg = client.financials.earnings_event_study("AAA", period=2)
+
+    assert len(fake_api.requests_to("historical/earning_calendar/")) == 1
+    assert len(fake_api.requests_to("historical-price-full/")) == 1
+
+    pd.testing.assert_frame_equal(pe, client.financials.merge_eps_his("AAA", period=2, enable_logging=False))
+    pd.testing.assert_frame_equal(close_chg, client.financials.get_fiscal_close_chg("AAA", period=2))
+    assert not pe.empty and close_chg["fiscal_chg"].notna().any()
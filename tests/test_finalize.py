@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from fmpxx.utils import finalize_frame
+
+
+def make_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "symbol": ["AAA", "BBB", "CCC"],
+        "date": pd.to_datetime(["2025-01-02", "2025-01-03", "2025-01-06"]),
+        "volume": np.array([1, 2, 3], dtype="int64"),
+        "price": [1.234, np.nan, 3.456],
+        "nulls": [None, None, None],
+    })
+
+
+def test_fills_and_rounds_numeric_columns_only():
+    df = make_frame()
+    result = finalize_frame(df, fill_value=0)
+
+    assert result is df
+    assert result["price"].tolist() == [1.23, 0.0, 3.46]
+    assert result["nulls"].isna().all()
+    assert result["symbol"].tolist() == ["AAA", "BBB", "CCC"]
+
+
+def test_untouched_columns_are_not_copied():
+    df = make_frame()
+    symbol, date, volume = (df[column].to_numpy() for column in ("symbol", "date", "volume"))
+    finalize_frame(df, fill_value=0)
+
+    assert np.shares_memory(df["symbol"].to_numpy(), symbol)
+    assert np.shares_memory(df["date"].to_numpy(), date)
+    assert np.shares_memory(df["volume"].to_numpy(), volume)
+
+
+def test_none_skips_fill_and_rounding():
+    df = make_frame()
+    finalize_frame(df, decimals=None)
+
+    assert np.isnan(df.loc[1, "price"])
+    assert df.loc[0, "price"] == 1.234
+
+
+def test_many_fills_statements_unless_raw(client):
+    filled, _ = client.financials.get_stock_performance_many(["AAA"], limit=6)
+    raw, _ = client.financials.get_stock_performance_many(["AAA"], limit=6, raw=True)
+
+    assert raw["revenue_growth_rate"].isna().any()
+    assert not filled["revenue_growth_rate"].isna().any()
+
+
+def test_partially_null_text_columns_are_not_filled():
+    df = pd.DataFrame({"link": ["https://a", None, np.nan], "revenue": [1.0, np.nan, 2.0]})
+    finalize_frame(df, fill_value=0)
+
+    assert df["link"].tolist()[0] == "https://a"
+    assert df["link"].iloc[1:].isna().all()
+    assert df["revenue"].tolist() == [1.0, 0.0, 2.0]
+
+
+def test_merge_eps_his_rounds_pe_unless_raw(client, fake_api):
+    fake_api.as_of = pd.Timestamp.today().normalize()
+    pe = client.financials.merge_eps_his("AAA", period=1, enable_logging=False)
+    raw = client.financials.merge_eps_his("AAA", period=1, enable_logging=False, raw=True)
+
+    assert (pe["pe"] == pe["pe"].round(2)).all()
+    assert np.allclose(pe["pe"], raw["pe"].round(2))
+    assert (raw["pe"] != raw["pe"].round(2)).any()
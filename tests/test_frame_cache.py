@@ -0,0 +1,80 @@
+import pandas as pd
+
+from fmpxx import CompactDtypes, FMPClient, FrameCache
+from fmpxx.cache import MISS
+
+
+def test_lru_eviction_by_entries():
+    cache = FrameCache(max_entries=2)
+    cache.set("a", pd.DataFrame({"x": [1]}))
+    cache.set("b", pd.DataFrame({"x": [2]}))
+    cache.get("a")
+    cache.set("c", pd.DataFrame({"x": [3]}))
+
+    assert cache.get("b") is MISS
+    assert cache.get("a")["x"].tolist() == [1]
+    assert cache.stats()["entries"] == 2
+
+
+def test_byte_budget_skips_oversized_frames():
+    cache = FrameCache(max_bytes=1000)
+    cache.set("big", pd.DataFrame({"x": range(1000)}))
+    assert cache.get("big") is MISS
+    assert cache.stats()["bytes"] == 0
+
+
+def test_results_are_copies():
+    cache = FrameCache()
+    cache.set("a", pd.DataFrame({"x": [1]}))
+    result = cache.get("a")
+    result.loc[0, "x"] = 99
+    assert cache.get("a")["x"].tolist() == [1]
+
+
+def test_memoized_methods_skip_download(make_client, fake_api):
+    client = make_client(frame_cache=FrameCache())
+    first = client.financials.get_merged_financials("AAPL", limit=8)
+    first["revenue"] = 0.0
+    second = client.financials.get_merged_financials(symbol="AAPL", limit=8, period="quarter")
+
+    assert len(fake_api.requests_to("income-statement")) == 1
+    assert (second["revenue"] > 0).all()
+    assert client.transport.frame_cache.stats()["hits"] == 1
+
+
+def test_memoize_key_includes_arguments_and_dtype_policy(make_client):
+    cache = FrameCache()
+    plain = make_client(frame_cache=cache)
+    compact = make_client(frame_cache=cache, compact=CompactDtypes())
+    revenue = plain.financials.get_merged_financials("AAPL", limit=8, columns=["revenue"])
+    both = plain.financials.get_merged_financials("AAPL", limit=8, columns=["revenue", "totalDebt"])
+    compacted = compact.financials.get_merged_financials("AAPL", limit=8, columns=["revenue"])
+
+    assert "totalDebt" not in revenue.columns and "totalDebt" in both.columns
+    assert revenue["symbol"].dtype == object and compacted["symbol"].dtype == "category"
+
+
+def test_projected_and_full_merges_share_statement_downloads(make_client, fake_api):
+    client = make_client(frame_cache=FrameCache())
+    client.financials.get_stock_performance("AAA")
+    merged = client.financials.get_merged_financials("AAA", limit=12)
+
+    assert len(fake_api.calls) == 3
+    assert len(merged) == 12
+    # The three statements are served from the cache for the second merge
+    assert client.transport.frame_cache.stats()["hits"] == 3
+
+
+def test_memoize_key_includes_quality_rules_and_api_key(make_client, fake_api):
+    cache = FrameCache()
+    default = make_client(frame_cache=cache)
+    excluding = make_client(frame_cache=cache, symbol_rules={"AAA": "exclude"})
+
+    assert default.financials.get_merged_financials("AAA", limit=8) is not None
+    assert excluding.financials.get_merged_financials("AAA", limit=8) is None
+
+    other_key = FMPClient("other-key", frame_cache=cache)
+    other_key.session.mount("https://", fake_api)
+    other_key.financials.get_merged_financials("AAA", limit=8)
+    other_key.close()
+    assert len(fake_api.requests_to("income-statement")) == 3
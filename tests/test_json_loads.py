@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_custom_decoder_gets_the_raw_response_bytes(make_client):
+    payloads = []
+
+    def loads(content):
+        payloads.append(content)
+        return json.loads(content)
+
+    client = make_client(json_loads=loads)
+    quotes = client.stocks.quote("AAPL")
+
+    assert len(payloads) == 1
+    assert isinstance(payloads[0], bytes)
+    assert json.loads(payloads[0]) == [{"symbol": "AAPL", "price": 0.0, "volume": 1000}]
+    assert quotes["symbol"].tolist() == ["AAPL"]
+
+
+def test_falls_back_to_the_stdlib_without_orjson():
+    # A fresh interpreter, so the blocked import does not leak into other tests
+    code = (
+        "import json, sys\n"
+        "sys.modules['orjson'] = None\n"
+        "from fmpxx import FMPClient\n"
+        "from fmpxx.utils import json_loads\n"
+        "assert json_loads is json.loads\n"
+        "client = FMPClient('key')\n"
+        "assert client.transport.json_loads is json.loads\n"
+        "assert client.transport.json_loads(b'[1, 2]') == [1, 2]\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=Path(__file__).parents[1])
+    assert result.returncode == 0, result.stderr
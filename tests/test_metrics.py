@@ -0,0 +1,79 @@
+import pytest
+
+from fmpxx import Metrics, ResponseCache
+from fmpxx.exceptions import SymbolNotFoundError
+from fmpxx.metrics import Histogram, endpoint_name
+
+
+def test_endpoint_names_drop_symbols():
+    assert endpoint_name("income-statement/AAPL") == "income-statement"
+    assert endpoint_name("historical-price-full/AAPL,MSFT") == "historical-price-full"
+    assert endpoint_name("historical/earning_calendar/AAPL") == "historical/earning_calendar"
+    assert endpoint_name("profile/AAPL") == "profile"
+
+
+def test_histogram_quantiles_follow_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 2.0):
+        histogram.observe(value)
+    summary = histogram.summary()
+    assert summary["count"] == 4 and summary["max"] == 2.0
+    assert summary["p50"] == 0.1 and summary["p99"] == 2.0
+
+
+def test_requests_run_hooks_and_record_metrics(make_client, fake_api, tmp_path):
+    client = make_client(metrics=Metrics(), cache=ResponseCache(str(tmp_path)))
+    seen, infos = [], []
+    client.on_request(lambda endpoint, params: seen.append(endpoint))
+    client.on_response(lambda endpoint, params, info: infos.append(info))
+    client.financials.get_financials("AAPL", "income", limit=4)
+    client.financials.get_financials("AAPL", "income", limit=4)
+
+    stats = client.stats()
+    assert seen == ["income-statement/AAPL"] * 2
+    assert [info["cached"] for info in infos] == [False, True]
+    assert infos[0]["status"] == 200 and infos[0]["bytes"] > 0
+    assert stats["endpoints"]["income-statement"]["requests"] == 1
+    assert stats["endpoints"]["income-statement"]["cache_hits"] == 1
+    assert stats["stages"]["get_financials"]["build"]["count"] == 2
+
+
+def test_failed_requests_are_recorded(make_client, fake_api):
+    client = make_client(metrics=Metrics())
+    infos = []
+    client.on_response(lambda endpoint, params, info: infos.append(info))
+    fake_api.replies["quote/NOPE"] = [(404, {}, {})]
+    with pytest.raises(SymbolNotFoundError):
+        client.stocks.quote("NOPE")
+
+    assert isinstance(infos[0]["error"], SymbolNotFoundError) and infos[0]["status"] == 404
+    assert client.stats()["endpoints"]["quote"]["errors"] == 1
+
+
+def test_failing_hook_does_not_break_requests(client):
+    client.on_response(lambda endpoint, params, info: 1 / 0)
+    assert client.financials.get_financials("AAPL", "income", limit=1).shape[0] == 1
+
+
+def test_streamed_requests_run_hooks_and_record_metrics(make_client):
+    client = make_client(metrics=Metrics())
+    seen, infos = [], []
+    client.on_request(lambda endpoint, params: seen.append(endpoint))
+    client.on_response(lambda endpoint, params, info: infos.append(info))
+    rows = sum(len(chunk) for chunk in client.stocks.iter_stock_list(chunk_size=8))
+
+    stats = client.stats()
+    assert rows == 30 and seen == ["stock/list"]
+    assert infos[0]["status"] == 200 and infos[0]["error"] is None
+    assert infos[0]["bytes"] == stats["totals"]["bytes"] > 0
+    assert stats["totals"]["requests"] == 1
+    assert stats["endpoints"]["stock/list"]["network"]["count"] == 1
+
+
+def test_streamed_api_errors_are_recorded(make_client, fake_api):
+    client = make_client(metrics=Metrics())
+    fake_api.replies["stock/list"] = [(500, {}, {"Retry-After": "0"})] * 4
+    with pytest.raises(Exception):
+        list(client.stocks.iter_stock_list())
+    stats = client.stats()["endpoints"]["stock/list"]
+    assert stats["errors"] == 1 and stats["retries"] == 3
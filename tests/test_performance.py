@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from fmpxx import compute_performance_panel
+from fmpxx.financials import PERFORMANCE_COLUMNS
+
+
+def test_panel_matches_per_symbol_results(client):
+    symbols = ["AAA", "BBB", "CCC"]
+    merged = pd.concat([client.financials.get_merged_financials(symbol, limit=8) for symbol in symbols])
+    panel = compute_performance_panel(merged.sample(frac=1, random_state=0)).reset_index(drop=True)
+    single = pd.concat([client.financials.get_stock_performance(symbol, limit=8) for symbol in symbols],
+                       ignore_index=True)
+
+    assert list(panel.columns) == PERFORMANCE_COLUMNS
+    pd.testing.assert_frame_equal(panel.sort_values(["symbol", "period_date"], ignore_index=True),
+                                  single.sort_values(["symbol", "period_date"], ignore_index=True))
+
+
+def test_growth_never_crosses_symbols(client):
+    merged = pd.concat([client.financials.get_merged_financials(symbol, limit=6, raw=True) for symbol in ("AAA", "BBB")])
+    panel = compute_performance_panel(merged, raw=True)
+
+    for _, rows in panel.groupby("symbol"):
+        growth = rows["revenue_growth_rate"].to_numpy()
+        assert np.isnan(growth[:4]).all()
+        assert np.allclose(growth[4:], 1.02 ** 4 - 1)
+
+
+def test_many_matches_single(client):
+    panel, errors = client.financials.get_stock_performance_many(["AAA", "BBB"], limit=8)
+    single = client.financials.get_stock_performance("BBB", limit=8)
+    assert errors.empty
+    pd.testing.assert_frame_equal(panel[panel["symbol"] == "BBB"].reset_index(drop=True), single)
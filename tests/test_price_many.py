@@ -0,0 +1,27 @@
+import pandas as pd
+
+
+def test_batches_symbols_and_splits_the_stock_list(client, fake_api):
+    symbols = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF", "GGG", "AAA"]
+    fake_api.empty.add("CCC")
+    df = client.financials.stocks.historical_price_many(symbols, start="2025-06-02", end="2025-06-13", chunk_size=3)
+
+    paths = [path for path, _ in fake_api.calls]
+    assert sorted(paths) == ["historical-price-full/AAA,BBB,CCC", "historical-price-full/DDD,EEE,FFF",
+                             "historical-price-full/GGG"]
+    assert all(params == {"from": "2025-06-02", "to": "2025-06-13"} for _, params in fake_api.calls)
+
+    # Long format in the caller's order, one row per symbol and trading day
+    assert list(df["symbol"].unique()) == ["AAA", "BBB", "DDD", "EEE", "FFF", "GGG"]
+    assert len(df) == 6 * 10
+    assert df.groupby("symbol", sort=False)["date"].is_monotonic_increasing.all()
+
+
+def test_panel_has_one_column_per_symbol(client):
+    panel = client.financials.stocks.historical_price_many(["BBB", "AAA"], start="2025-06-02", end="2025-06-13",
+                                                           panel=True)
+
+    assert list(panel.columns) == ["BBB", "AAA"]
+    assert len(panel) == 10
+    assert isinstance(panel.index, pd.DatetimeIndex) and panel.index.name == "date"
+    assert panel.notna().all().all()
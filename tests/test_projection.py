@@ -0,0 +1,36 @@
+import pytest
+
+from fmpxx.financials import MERGED_KEY_COLUMNS
+
+
+def test_projected_merge_matches_full_merge(client):
+    full = client.financials.get_merged_financials("AAPL", limit=8)
+    projected = client.financials.get_merged_financials("AAPL", limit=8, columns=["revenue", "totalDebt", "freeCashFlow"])
+
+    assert list(projected.columns) == [*MERGED_KEY_COLUMNS, "revenue", "totalDebt", "freeCashFlow"]
+    assert projected[["revenue", "totalDebt", "freeCashFlow"]].equals(full[["revenue", "totalDebt", "freeCashFlow"]])
+    assert not any(column.endswith("_y") for column in projected.columns)
+
+
+def test_fields_come_from_the_first_statement_reporting_them(client):
+    projected = client.financials.get_merged_financials("AAPL", limit=4, columns=["netIncome"])
+    full = client.financials.get_merged_financials("AAPL", limit=4)
+    assert projected["netIncome"].equals(full["netIncome"])
+
+
+def test_unknown_columns_raise(client):
+    with pytest.raises(ValueError, match="Unknown statement columns"):
+        client.financials.get_merged_financials("AAPL", limit=4, columns=["revenue", "nope"])
+
+
+@pytest.mark.parametrize("key", ["acceptedDate", "fillingDate", "date", "symbol", "period_date", "acceptedDate_x"])
+def test_requesting_a_key_keeps_it_once(client, key):
+    projected = client.financials.get_merged_financials("AAPL", limit=4, columns=["revenue", key])
+
+    assert list(projected.columns) == [*MERGED_KEY_COLUMNS, "revenue"]
+
+
+def test_a_single_column_name_is_not_split(client):
+    projected = client.financials.get_merged_financials("AAPL", limit=4, columns="revenue")
+
+    assert list(projected.columns) == [*MERGED_KEY_COLUMNS, "revenue"]
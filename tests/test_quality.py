@@ -0,0 +1,98 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from fmpxx import QualityReport, validate_statements
+from fmpxx.quality import DROP_FIRST, EXCLUDE, ISSUE_COLUMNS
+
+
+def statements(symbol: str, period_dates: list[str], filing_dates: list[str] | None = None) -> pd.DataFrame:
+    filing_dates = filing_dates or [f"{date[:8]}28" for date in period_dates]
+    return pd.DataFrame({
+        "symbol": symbol,
+        "period_date": pd.to_datetime(period_dates),
+        "date": filing_dates,
+        "revenue": range(len(period_dates)),
+    })
+
+
+QUARTERS = ["2024-03-31", "2024-06-30", "2024-09-30", "2024-12-31"]
+
+
+@pytest.fixture(autouse=True)
+def no_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        yield
+
+
+def test_clean_panel_passes_unchanged():
+    panel = pd.concat([statements("AAA", QUARTERS), statements("BBB", QUARTERS)], ignore_index=True)
+    cleaned, report = validate_statements(panel, rules={})
+    assert report.ok and report.issues.empty
+    assert list(report.issues.columns) == ISSUE_COLUMNS
+    pd.testing.assert_frame_equal(cleaned, panel)
+
+
+def test_gap_excludes_only_that_symbol():
+    gappy = statements("AAA", ["2023-12-31", "2024-06-30", "2024-09-30"])
+    cleaned, report = validate_statements(pd.concat([gappy, statements("BBB", QUARTERS)]), rules={})
+
+    assert not report.ok
+    assert report.excluded == {"AAA": "182 days since the previous report"}
+    assert set(cleaned["symbol"]) == {"BBB"}
+
+
+def test_duplicates_and_restatements():
+    df = statements("AAA", [*QUARTERS, "2024-12-31", "2024-09-30"],
+                    ["2024-04-28", "2024-07-28", "2024-10-28", "2025-01-28", "2025-01-28", "2025-03-01"])
+    cleaned, report = validate_statements(df, rules={})
+
+    checks = report.issues["check"].tolist()
+    assert checks == ["duplicate", "restatement"]
+    assert report.ok
+    assert len(cleaned) == 5
+
+
+def test_symbol_rules_and_missing_symbols():
+    panel = pd.concat([statements("OLD", QUARTERS), statements("BAD", QUARTERS), statements("AAA", QUARTERS)])
+    cleaned, report = validate_statements(panel, rules={"OLD": DROP_FIRST, "BAD": EXCLUDE},
+                                          symbols=["OLD", "BAD", "AAA", "GONE"])
+
+    assert report.excluded == {"GONE": "financial statement data is incomplete", "BAD": "excluded by symbol rule"}
+    assert cleaned.groupby("symbol").size().to_dict() == {"AAA": 4, "OLD": 3}
+    assert report.issues["period_date"].dtype == "datetime64[ns]"
+    assert report.for_symbol("OLD")["check"].tolist() == ["dropped"]
+    assert report.summary().loc["BAD", "excluded"] == 1
+
+
+def test_with_errors_adds_incomplete_symbols():
+    _, report = validate_statements(statements("AAA", ["2023-12-31", "2024-06-30"]), rules={})
+    report = report.with_errors({"ZZZ": "FMPConnectionError: timeout"})
+    assert report.issues["symbol"].tolist() == ["ZZZ", "AAA"]
+    assert report.issues.dtypes["period_date"] == "datetime64[ns]"
+    assert set(report.excluded) == {"ZZZ", "AAA"}
+
+
+def test_quality_report_through_client(client, fake_api):
+    fake_api.empty.add("EEE")
+    report = client.financials.quality_report(["HLT", "CSC", "AAA", "EEE"], limit=8)
+
+    assert isinstance(report, QualityReport)
+    assert report.excluded == {"CSC": "excluded by symbol rule", "EEE": "financial statement data is incomplete"}
+    assert report.for_symbol("HLT")["check"].tolist() == ["dropped"]
+    assert report.for_symbol("AAA").empty
+
+
+def test_symbol_rules_use_the_requested_symbol(client, fake_api):
+    # The statements report a different ticker than the one requested
+    fake_api.aliases.update({"HLT": "HLT-OLD", "CSC": "CSC-OLD"})
+
+    merged = client.financials.get_merged_financials("HLT", limit=8)
+    panel, errors = client.financials.get_stock_performance_many(["HLT", "CSC"], limit=8)
+
+    assert len(merged) == 7 and set(merged["symbol"]) == {"HLT"}
+    assert client.financials.get_merged_financials("CSC", limit=8) is None
+    assert len(panel) == 7 and set(panel["symbol"]) == {"HLT"}
+    assert errors["symbol"].tolist() == ["CSC"]
@@ -0,0 +1,24 @@
+from fmpxx.stocks import Stocks
+
+
+def test_large_symbol_lists_are_split_under_the_url_limit(client, fake_api):
+    symbols = [f"S{i:03d}" for i in range(600)]
+    fake_api.empty.update({"S007", "S450"})
+    quotes = client.stocks.quote(reversed(symbols + ["S001"]))
+
+    quote_calls = fake_api.requests_to("quote/")
+    assert len(quote_calls) == 2
+    for path, _ in fake_api.calls:
+        assert len(f"{Stocks.BASE_URL}{path}?apikey=test-key") <= Stocks.MAX_URL_LENGTH
+    assert sorted(s for path, _ in fake_api.calls for s in path.removeprefix("quote/").split(",")) == symbols
+
+    # Merged back by symbol, in input order, without the symbols that have no quote
+    expected = [s for s in reversed(symbols + ["S001"]) if s not in {"S007", "S450"}]
+    assert quotes.index.tolist() == list(dict.fromkeys(expected))
+    assert quotes.loc["S123", "volume"] == 1000
+
+
+def test_chunks_respect_the_url_budget():
+    chunks = Stocks._chunk_symbols(["AAAA"] * 10, overhead=Stocks.MAX_URL_LENGTH - 14)
+
+    assert chunks == [["AAAA"] * 3] * 3 + [["AAAA"]]
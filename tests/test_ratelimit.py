@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+
+from fmpxx import Metrics, RateLimiter, RetryPolicy
+from fmpxx.exceptions import RateLimitExceededError
+from fmpxx.ratelimit import parse_retry_after
+
+
+def test_token_bucket_spaces_requests():
+    limiter = RateLimiter(calls_per_minute=600, burst=2)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    # Two burst tokens, then one token every 0.1s
+    assert time.monotonic() - start == pytest.approx(0.3, abs=0.08)
+
+
+def test_async_acquire_shares_the_bucket():
+    limiter = RateLimiter(calls_per_minute=600, burst=1)
+    limiter.acquire()
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) == pytest.approx(0.3, abs=0.08)
+
+
+def test_pause_holds_back_callers():
+    limiter = RateLimiter(calls_per_minute=6000, burst=10)
+    limiter.pause(0.2)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.19
+
+
+def test_retry_policy_schedule():
+    policy = RetryPolicy(max_retries=2, backoff_factor=0.5, max_backoff=1.0)
+    assert policy.should_retry(429, 0) and policy.should_retry(503, 1)
+    assert not policy.should_retry(429, 2)
+    assert not policy.should_retry(404, 0)
+    assert 0 <= policy.delay(5) <= 1.0
+    assert policy.delay(0, "3") == 1.0
+    assert RetryPolicy().delay(0, "3") == 3.0
+
+
+def test_backoff_pauses_the_shared_limiter_on_429_only():
+    policy = RetryPolicy(max_retries=1)
+    limiter = RateLimiter(calls_per_minute=6000, burst=10)
+
+    assert policy.backoff("url", 200, 0, None, limiter) is None
+    assert policy.backoff("url", 429, 1, "0.2", limiter) is None
+    assert policy.backoff("url", 503, 0, "0.2", limiter) == 0.2
+    assert limiter._reserve() == 0
+    assert policy.backoff("url", 429, 0, "0.2", limiter) == 0.2
+    assert limiter._reserve() > 0.15
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_transport_retries_429_with_retry_after(make_client, fake_api):
+    client = make_client(metrics=Metrics())
+    fake_api.replies["quote/AAPL"] = [(429, {}, {"Retry-After": "0.1"}), (503, {}, {"Retry-After": "0"})]
+    start = time.monotonic()
+    data = client.stocks.quote("AAPL")
+
+    assert time.monotonic() - start >= 0.1
+    assert len(fake_api.requests_to("quote/AAPL")) == 3
+    assert data["symbol"].tolist() == ["AAPL"]
+    assert client.stats()["endpoints"]["quote"]["retries"] == 2
+
+
+def test_transport_gives_up_after_max_retries(make_client, fake_api):
+    client = make_client(max_retries=1)
+    fake_api.replies["quote/AAPL"] = [(429, {}, {"Retry-After": "0"})] * 3
+    with pytest.raises(RateLimitExceededError):
+        client.stocks.quote("AAPL")
+    assert len(fake_api.requests_to("quote/AAPL")) == 2
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmpxx import Screener
+
+
+def panel(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["symbol", "period_date", "revenue_growth_rate", "debtToAssetRatio"])
+
+
+@pytest.fixture
+def screener() -> Screener:
+    return Screener(panel([
+        ("AAA", "2024-12-31", 0.30, 0.2),
+        ("BBB", "2024-12-31", 0.10, 0.5),
+        ("CCC", "2024-12-31", np.nan, 0.1),
+        ("DDD", "2024-12-31", -0.05, 0.3),
+        ("AAA", "2024-09-30", 0.20, 0.2),
+        ("BBB", "2024-09-30", 0.25, 0.5),
+    ]))
+
+
+def test_quarters_and_percentiles(screener):
+    assert [str(q) for q in screener.quarters] == ["2024Q3", "2024Q4"]
+    assert screener.metrics == ["revenue_growth_rate", "debtToAssetRatio"]
+    latest = screener.cross_section().set_index("symbol")
+    assert latest.loc["AAA", "revenue_growth_rate_pct"] == 1.0
+    assert np.isnan(latest.loc["CCC", "revenue_growth_rate_pct"])
+
+
+def test_rank_drops_missing_metrics(screener):
+    ranked = screener.rank("revenue_growth_rate")
+    assert ranked["symbol"].tolist() == ["AAA", "BBB", "DDD"]
+    assert ranked["rank"].tolist() == [1, 2, 3]
+
+    by_quarter = screener.rank("revenue_growth_rate", quarter=None)
+    assert by_quarter["symbol"].tolist() == ["BBB", "AAA", "AAA", "BBB", "DDD"]
+
+
+def test_top_filters_after_ranking(screener):
+    assert screener.top("revenue_growth_rate", 0.67)["symbol"].tolist() == ["AAA", "BBB"]
+    assert screener.top("revenue_growth_rate", 0.67, where="debtToAssetRatio < 0.4")["symbol"].tolist() == ["AAA"]
+    assert screener.top("debtToAssetRatio", 0.25, ascending=True)["symbol"].tolist() == ["CCC"]
+    with pytest.raises(ValueError):
+        screener.top("revenue_growth_rate", 0)
+
+
+def test_screen_and_percentile_table(screener):
+    assert screener.screen("revenue_growth_rate_pct > 0.5", quarter="2024Q3")["symbol"].tolist() == ["BBB"]
+    table = screener.percentile("debtToAssetRatio")
+    assert table.shape == (2, 4)
+    with pytest.raises(ValueError, match="Unknown metric"):
+        screener.rank("nope")
+
+
+def test_from_symbols_leaves_short_histories_unranked(make_client, fake_api):
+    client = make_client()
+    # CCC has four reports, too few for a year-over-year growth rate
+    fake_api.history["CCC"] = 4
+    fake_api.empty.add("EEE")
+    screener = Screener.from_symbols(client.financials, ["AAA", "BBB", "CCC", "EEE"], limit=8)
+
+    latest = screener.cross_section().set_index("symbol")
+    assert np.isnan(latest.loc["CCC", "revenue_growth_rate"])
+    assert latest.loc["AAA", "revenue_growth_rate"] > 0
+    assert "CCC" not in screener.rank("revenue_growth_rate")["symbol"].tolist()
+    assert "CCC" in screener.rank("debtToAssetRatio")["symbol"].tolist()
+    assert screener.errors["symbol"].tolist() == ["EEE"]
+
+
+def test_from_merged_keeps_missing_values(make_client, fake_api):
+    client = make_client()
+    fake_api.history["CCC"] = 4
+    merged = pd.concat([client.financials.get_merged_financials(symbol, limit=8, raw=True) for symbol in ("AAA", "CCC")])
+    ranked = Screener.from_merged(merged).rank("revenue_growth_rate")
+    assert ranked["symbol"].tolist() == ["AAA"]
@@ -7,7 +7,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 # 将项目根目录添加到 Python 模块搜索路径
 sys.path.append(project_root)
 # 然后再导入你的模块
-from fmpxx import FMPClient
+from fmpxx import FMPClient, Cassette
 from fmpxx.exceptions import FMPAPIError, InvalidAPIKeyError, SymbolNotFoundError, RateLimitExceededError, FMPConnectionError
 # Set pandas display options for better output in console
 pd.set_option('display.max_columns', None)
@@ -22,12 +22,17 @@ dotenv.load_dotenv()
 API_Key = os.getenv("FMP_KEY")
 ticker = 'AAPL'
 
-if not API_Key:
-    print("Error: FMP_KEY environment variable not set. Please set it in your .env file or environment.")
+# 录制/回放：FMP_CASSETTE=record 用真实 key 录制响应；未设置 key 时回放 tests/cassettes，无需网络
+cassette_dir = os.path.join(project_root, 'tests', 'cassettes')
+cassette_mode = os.getenv("FMP_CASSETTE") or (None if API_Key else "replay")
+if not API_Key and not (cassette_mode == "replay" and os.path.isdir(cassette_dir)):
+    print("Error: FMP_KEY environment variable not set. Please set it in your .env file or environment,")
+    print("or record cassettes first with FMP_CASSETTE=record.")
     sys.exit(1)
+cassette = Cassette(cassette_dir, mode=cassette_mode, ignore_values=('from', 'to')) if cassette_mode else None
 
 # Test stocks functionality specifically
-client = FMPClient(api_key=API_Key)
+client = FMPClient(api_key=API_Key or 'replay', cassette=cassette)
 
 print("\n=== Testing Stocks Module ===")
 
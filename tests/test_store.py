@@ -0,0 +1,110 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from fmpxx import PriceStore, StatementStore
+
+
+def bars(start: str, end: str, close: float = 100.0) -> pd.DataFrame:
+    dates = pd.bdate_range(start, end)
+    return pd.DataFrame({"date": dates, "open": close, "high": close, "low": close,
+                         "close": close + pd.RangeIndex(len(dates)).to_numpy()})
+
+
+def test_price_upsert_recomputes_pct_chg_at_the_boundary(tmp_path):
+    store = PriceStore(str(tmp_path))
+    store.upsert("AAPL", bars("2025-01-01", "2025-01-10"))
+    merged = store.upsert("AAPL", bars("2025-01-10", "2025-01-15", close=200.0))
+
+    assert merged["date"].is_unique and merged["date"].is_monotonic_increasing
+    assert store.date_range("AAPL") == (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-15"))
+    boundary = merged.set_index("date").loc["2025-01-10"]
+    assert boundary["close"] == 200.0
+    assert boundary["pct_chg"] == pytest.approx(200.0 / 106.0 - 1)
+    assert pd.isna(merged["pct_chg"].iloc[0])
+
+
+def test_statement_upsert_replaces_amended_rows(tmp_path):
+    store = StatementStore(str(tmp_path))
+    store.upsert("AAPL", "income", "quarter", pd.DataFrame({
+        "date": ["2025-03-31", "2024-12-31"], "fillingDate": ["2025-04-30", "2025-01-30"], "revenue": [1.0, 2.0],
+    }))
+    merged = store.upsert("AAPL", "income", "quarter", pd.DataFrame({
+        "date": ["2025-06-30", "2025-03-31", "2025-03-31"],
+        "fillingDate": ["2025-07-30", "2025-05-15", "2025-04-30"], "revenue": [3.0, 1.5, 1.0],
+    }))
+
+    assert merged["date"].tolist() == ["2025-06-30", "2025-03-31", "2024-12-31"]
+    assert merged["revenue"].tolist() == [3.0, 1.5, 2.0]
+    assert store.load("AAPL", "income", "quarter").equals(merged)
+    assert store.load("MSFT", "income", "quarter").empty
+
+
+def test_incremental_prices_only_download_new_bars(make_client, fake_api, tmp_path):
+    client = make_client(price_store=PriceStore(str(tmp_path)))
+    fake_api.as_of = pd.Timestamp("2025-03-31")
+    client.stocks.historical_price_full("AAPL", start="2025-01-02", incremental=True)
+
+    fake_api.as_of = pd.Timestamp("2025-06-30")
+    df = client.stocks.historical_price_full("AAPL", start="2025-01-02", incremental=True)
+
+    refresh = fake_api.requests_to("historical-price-full")[-1]
+    assert refresh == {"from": "2025-03-31"}
+    assert df.equals(client.stocks.historical_price_full("AAPL", start="2025-01-02"))
+
+
+def test_incremental_prices_backfill_history_before_the_store(make_client, fake_api, tmp_path):
+    client = make_client(price_store=PriceStore(str(tmp_path)))
+    fake_api.as_of = pd.Timestamp("2025-03-31")
+    client.stocks.historical_price_full("AAPL", start="2025-01-02", incremental=True)
+
+    # Without a start the whole history is asked for, including the bars before 2025-01-02
+    df = client.stocks.historical_price_full("AAPL", incremental=True)
+    older = client.stocks.historical_price_full("AAPL", start="2024-06-03", end="2024-12-31", incremental=True)
+
+    # The backfilled range is then served from the store
+    assert fake_api.requests_to("historical-price-full")[1:] == [{"to": "2025-01-01"}, {"from": "2025-03-31"}]
+    assert older["date"].iloc[0] == pd.Timestamp("2024-06-03")
+    assert df["date"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert df.equals(client.stocks.historical_price_full("AAPL"))
+
+
+def test_incremental_statements_refresh_only_new_reports(make_client, fake_api, tmp_path):
+    client = make_client(statement_store=StatementStore(str(tmp_path)))
+    fake_api.as_of = pd.Timestamp.today().normalize()
+    client.financials.get_merged_financials("AAPL", limit=8, incremental=True)
+    merged = client.financials.get_merged_financials("AAPL", limit=8, incremental=True)
+
+    assert [params["limit"] for params in fake_api.requests_to("income-statement")] == ["8", "2"]
+    assert len(merged) == 8
+
+
+def test_incremental_statements_backfill_missed_quarters(make_client, fake_api, tmp_path):
+    store = StatementStore(str(tmp_path))
+    client = make_client(statement_store=store)
+    expected = client.financials.get_merged_financials("AAPL", limit=12)
+
+    # The store is three quarters behind the API
+    fake_api.as_of = pd.Timestamp("2024-09-30")
+    client.financials.get_merged_financials("AAPL", limit=12, incremental=True)
+    fake_api.as_of = pd.Timestamp("2025-06-30")
+    merged = client.financials.get_merged_financials("AAPL", limit=12, incremental=True)
+
+    assert merged is not None
+    assert merged["period_date"].tolist() == expected["period_date"].tolist()
+    assert store.load("AAPL", "income", "quarter")["date"].iloc[0] == "2025-06-30"
+
+
+def test_incremental_statements_fall_back_to_full_download(make_client, fake_api, tmp_path, monkeypatch):
+    client = make_client(statement_store=StatementStore(str(tmp_path)))
+    fake_api.as_of = pd.Timestamp("2024-09-30")
+    client.financials.get_merged_financials("AAPL", limit=12, incremental=True)
+
+    # Underestimate the missed reports: the refresh does not reach the stored rows
+    monkeypatch.setattr(type(client.financials), "_refresh_limit", lambda self, stored, limit, period: 2)
+    fake_api.as_of = pd.Timestamp("2025-06-30")
+    merged = client.financials.get_merged_financials("AAPL", limit=12, incremental=True)
+
+    assert [params["limit"] for params in fake_api.requests_to("income-statement")] == ["12", "2", "12"]
+    assert merged is not None and len(merged) == 12
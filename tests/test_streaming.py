@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from fmpxx.exceptions import FMPAPIError
+from fmpxx.utils import iter_json_array
+
+DOCUMENT = [{"symbol": "AAPL", "price": 123.456, "name": "Äpfel “Inc”"}, [1, 2.5e3, None], "x", -7, True]
+
+
+def split(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_decodes_array_across_any_chunking(size):
+    data = b" \n" + json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8") + b"\n"
+    assert list(iter_json_array(split(data, size))) == DOCUMENT
+
+
+def test_yields_elements_before_the_end_arrives():
+    items = iter_json_array(iter([b'[{"a": 1}, {"b"', b': 2}', b']']))
+    assert next(items) == {"a": 1}
+    assert next(items) == {"b": 2}
+    assert list(items) == []
+
+
+def test_numbers_cut_between_chunks_are_not_split():
+    assert list(iter_json_array([b"[12", b"34, 5", b".5]"])) == [1234, 5.5]
+
+
+def test_non_array_document_is_yielded_whole():
+    assert list(iter_json_array([b'{"Error Mes', b'sage": "limit"}'])) == [{"Error Message": "limit"}]
+
+
+def test_empty_array():
+    assert list(iter_json_array([b"[", b" ]"])) == []
+
+
+def test_truncated_array_raises():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a": 1}, {"b": ']))
+    with pytest.raises(ValueError, match="Truncated JSON array"):
+        list(iter_json_array([b'[{"a": 1}']))
+
+
+def test_stream_matches_stock_list_and_filters(client):
+    rows = [row for chunk in client.stocks.iter_stock_list(chunk_size=7, exchange="NYSE", security_type="stock")
+            for row in chunk.to_dict("records")]
+    full = client.stocks.stock_list()
+    expected = full[(full["exchangeShortName"] == "NYSE") & (full["type"] == "stock")]
+    assert [row["symbol"] for row in rows] == expected["symbol"].tolist()
+
+
+def test_stream_raises_api_errors(client, fake_api):
+    fake_api.replies["stock/list"] = [(200, {"Error Message": "Limit reached"}, {})]
+    with pytest.raises(FMPAPIError, match="Limit reached"):
+        list(client.stocks.iter_stock_list())